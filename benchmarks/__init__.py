@@ -0,0 +1 @@
+# Engine benchmark suite (run with: python -m benchmarks.run_benchmarks)
@@ -0,0 +1,267 @@
+"""
+Fake LLM - in-process stand-in for BoeingAPIClient used by the benchmarks.
+
+Routes each request by the engine template it was built from (judge,
+executor, OPro optimizer, APE induction/resampling, Promptbreeder
+mutations, S2A filter/optimizer) and answers in the format the engine
+parses. Judge scores come from a scriptable objective landscape: a prompt
+scores higher for each "good" feature phrase it contains and lower for
+"bad" ones. Prompt edits add or remove feature sentences, so engines can
+actually climb the landscape.
+
+All randomness is derived from the request content and seed, so a run is
+reproducible regardless of thread scheduling.
+"""
+
+import hashlib
+import json
+import random
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Tuple
+
+from glassbox.core.api_client import APIResponse, Message
+from glassbox.prompts.templates import (
+    APE_INDUCTION_SYSTEM_PROMPT,
+    OPRO_OPTIMIZER_SYSTEM_PROMPT,
+)
+
+# Feature sentence -> score contribution. Matching is case-insensitive on
+# the sentence without its trailing period.
+DEFAULT_FEATURES: Dict[str, float] = {
+    "Think step by step.": 12.0,
+    "You are an expert analyst.": 10.0,
+    "Verify your answer before responding.": 10.0,
+    "Use numbered constraints.": 8.0,
+    "Be concise.": 8.0,
+    "Follow the example output format.": 6.0,
+    "Do not include information that is not in the input.": 6.0,
+    "Be creative and add extra detail.": -8.0,
+    "Respond in a casual tone.": -6.0,
+}
+
+
+@dataclass
+class Landscape:
+    """
+    Objective landscape for judge scores (0-100).
+
+    score = base + sum(feature weights present) - length penalty
+            + deterministic per-(prompt, input) noise
+    """
+    features: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_FEATURES))
+    base: float = 30.0
+    max_words: int = 80  # Words beyond this cost length_penalty each
+    length_penalty: float = 0.25
+    noise: float = 2.0  # +/- noise amplitude
+    input_weights: Dict[str, float] = field(default_factory=dict)  # Input text -> score offset
+
+    def present(self, prompt: str) -> List[str]:
+        """Feature sentences found in the prompt."""
+        lowered = prompt.lower()
+        return [f for f in self.features if f.rstrip(".").lower() in lowered]
+
+    def score(self, prompt: str, input_text: str = "") -> float:
+        """Deterministic judge score for a prompt on an input."""
+        value = self.base + sum(self.features[f] for f in self.present(prompt))
+        value -= max(0, len(prompt.split()) - self.max_words) * self.length_penalty
+        value += self.input_weights.get(input_text, 0.0)
+        if self.noise:
+            digest = hashlib.sha256(f"{prompt}\x00{input_text}".encode("utf-8")).digest()
+            value += (digest[0] / 255.0 * 2 - 1) * self.noise
+        return round(max(0.0, min(100.0, value)), 1)
+
+
+class FakeLLM:
+    """
+    Duck-typed BoeingAPIClient backed by a Landscape.
+
+    Usage:
+        llm = FakeLLM(latency=0.05, seed=7)
+        engine = OProEngine(llm, Evaluator(llm), session)
+        engine.run(max_steps=5)
+        print(llm.calls, llm.calls_by_kind)
+    """
+
+    def __init__(
+        self,
+        landscape: Optional[Landscape] = None,
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        seed: int = 0,
+        model: str = "fake-llm",
+        temperature: float = 0.7
+    ):
+        self.landscape = landscape or Landscape()
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.seed = seed
+        self.config = SimpleNamespace(model=model, temperature=temperature)
+
+        self._lock = threading.Lock()
+        self._stop_requested = threading.Event()
+        self._seen: Counter = Counter()  # Request digest -> times seen
+        self._judged: Dict[str, float] = {}  # Prompt -> best judge score
+        self.calls = 0
+        self.calls_by_kind: Counter = Counter()
+
+    # ------------------------------------------------------------------
+    # BoeingAPIClient surface
+    # ------------------------------------------------------------------
+
+    def send_message(
+        self,
+        messages: List[Message],
+        temperature: Optional[float] = None,
+        max_retries: Optional[int] = None
+    ) -> APIResponse:
+        """Answer a request after the configured latency."""
+        if self._stop_requested.is_set():
+            return APIResponse(success=False, error_message="Request cancelled by user")
+
+        system = next((m.content for m in messages if m.role == "system"), "")
+        user = next((m.content for m in reversed(messages) if m.role == "user"), "")
+
+        digest = hashlib.sha256(f"{system}\x00{user}".encode("utf-8")).hexdigest()
+        with self._lock:
+            self.calls += 1
+            occurrence = self._seen[digest]
+            self._seen[digest] += 1
+        rng = random.Random(f"{self.seed}:{digest}:{occurrence}")
+
+        kind, content = self._route(system, user, rng)
+        with self._lock:
+            self.calls_by_kind[kind] += 1
+
+        delay = self.latency + (rng.uniform(-1, 1) * self.latency_jitter if self.latency_jitter else 0.0)
+        if delay > 0 and self._stop_requested.wait(delay):
+            return APIResponse(success=False, error_message="Request cancelled by user")
+
+        return APIResponse(success=True, content=content)
+
+    def request_stop(self):
+        self._stop_requested.set()
+
+    def reset_stop(self):
+        self._stop_requested.clear()
+
+    # ------------------------------------------------------------------
+    # Routing
+    # ------------------------------------------------------------------
+
+    def _route(self, system: str, user: str, rng: random.Random) -> Tuple[str, str]:
+        """Return (call kind, response text) for a request."""
+        if user.startswith("INPUT PROVIDED:") and "=== RESPONSE" in user:
+            return "judge", self._judge_batch(user)
+        if user.startswith("TASK PROMPT:"):
+            return "judge", self._judge(user)
+        if system == OPRO_OPTIMIZER_SYSTEM_PROMPT:
+            return "optimizer", self._opro_variations(user, rng)
+        if system == APE_INDUCTION_SYSTEM_PROMPT:
+            return "optimizer", self._edit("Transform each input into the output shown in the examples.", rng)
+        if user.startswith("Given this instruction:"):
+            return "optimizer", self._ape_resample(user, rng)
+        if user.startswith("Rewrite the following prompt"):
+            return "optimizer", self._edit(_section(user, "ORIGINAL PROMPT:", "MUTATION DIRECTION:"), rng)
+        if user.startswith("You are a meta-optimizer"):
+            return "optimizer", self._edit(_section(user, "TASK-PROMPT:", "MUTATION-PROMPT:"), rng)
+        if user.startswith("Combine the best elements"):
+            return "optimizer", self._crossover(user, rng)
+        if user.startswith("The current S2A filter prompt"):
+            return "optimizer", self._edit(_section(user, "CURRENT FILTER PROMPT:", "ISSUES OBSERVED:"), rng)
+        if user.startswith("Given the following text, extract"):
+            return "filter", self._s2a_filter(user)
+        return "executor", f"Answer based on: {user[:80]}"
+
+    def _judge(self, user: str) -> str:
+        prompt = _section(user, "TASK PROMPT:", "INPUT PROVIDED:")
+        input_text = _section(user, "INPUT PROVIDED:", "AI RESPONSE TO EVALUATE:")
+        score = self._score(prompt, input_text)
+        return json.dumps({
+            "score": score,
+            "breakdown": {k: round(score / 4, 1) for k in
+                          ("accuracy", "relevance", "clarity", "instruction_following")},
+            "reasoning": f"Features present: {len(self.landscape.present(prompt))}"
+        })
+
+    def _judge_batch(self, user: str) -> str:
+        input_text = _section(user, "INPUT PROVIDED:", "Below are")
+        prompts = re.findall(r"TASK PROMPT:\n(.*?)\n\nAI RESPONSE TO EVALUATE:", user, re.DOTALL)
+        return json.dumps([
+            {"index": i + 1, "score": self._score(p.strip(), input_text), "reasoning": "batch"}
+            for i, p in enumerate(prompts)
+        ])
+
+    def _score(self, prompt: str, input_text: str) -> float:
+        score = self.landscape.score(prompt, input_text)
+        with self._lock:
+            self._judged[prompt] = max(score, self._judged.get(prompt, 0.0))
+        return score
+
+    def _opro_variations(self, user: str, rng: random.Random) -> str:
+        """Edit the best prompt visible in the trajectory (full-length or truncated)."""
+        base = _section(user, "TASK DESCRIPTION:", "OPTIMIZATION HISTORY:")
+        history = _section(user, "OPTIMIZATION HISTORY:", "Current best score:")
+        shown = re.findall(r"\[Score: ([\d.]+)\]\n(.*?)(?=\n\n\[Score:|\Z)", history, re.DOTALL)
+        if shown:
+            base = max((float(score), prompt.strip()) for score, prompt in shown)[1]
+        else:
+            # Legacy summary: prompts cut to 50 characters
+            prefixes = re.findall(r"\[Prompt: (.*?)\.\.\. \| Score:", user)
+            with self._lock:
+                visible = [
+                    (score, prompt) for prompt, score in self._judged.items()
+                    if any(prompt.startswith(prefix) for prefix in prefixes)
+                ]
+            if visible:
+                base = max(visible)[1]
+
+        count = int(re.search(r"Generate (\d+) new prompt variations", user).group(1))
+        return "\n\n".join(
+            f"VARIATION {i + 1}:\n{self._edit(base, rng)}\nREASONING: Adjusted instruction features."
+            for i in range(count)
+        )
+
+    def _ape_resample(self, user: str, rng: random.Random) -> str:
+        base = re.search(r'Given this instruction:\n"(.*?)"\n\nGenerate', user, re.DOTALL).group(1)
+        count = int(re.search(r"Generate (\d+) variations", user).group(1))
+        return "\n".join(f"{i + 1}. {self._edit(base, rng)}" for i in range(count))
+
+    def _crossover(self, user: str, rng: random.Random) -> str:
+        prompt_a = re.search(r"PROMPT A \(Score: [^)]*\):\n(.*?)\n\nPROMPT B", user, re.DOTALL).group(1)
+        prompt_b = re.search(r"PROMPT B \(Score: [^)]*\):\n(.*?)\n\nCreate a new prompt", user, re.DOTALL).group(1)
+        merged = prompt_a
+        for feature in self.landscape.present(prompt_b):
+            if feature.rstrip(".").lower() not in merged.lower() and rng.random() < 0.5:
+                merged = f"{merged} {feature}"
+        return merged
+
+    def _s2a_filter(self, user: str) -> str:
+        raw = _section(user, "RAW CONTEXT:", "QUESTION/QUERY:")
+        sentences = [s.strip() for s in re.split(r"(?<=[.!?])\s+", raw) if s.strip()]
+        kept = [s for s in sentences if "opinion" not in s.lower() and "unrelated" not in s.lower()]
+        removed = [s for s in sentences if s not in kept]
+        return "UNBIASED CONTEXT:\n" + " ".join(kept) + "\n\nFILTERED OUT:\n" + "\n".join(
+            f"- {s}" for s in removed
+        )
+
+    def _edit(self, prompt: str, rng: random.Random) -> str:
+        """Add a random feature sentence (or occasionally drop one)."""
+        prompt = prompt.strip()
+        present = self.landscape.present(prompt)
+        if present and rng.random() < 0.2:
+            drop = rng.choice(present)
+            return re.sub(re.escape(drop.rstrip(".")) + r"\.?", "", prompt, flags=re.IGNORECASE).strip()
+        missing = [f for f in self.landscape.features if f not in present]
+        if not missing:
+            return prompt
+        return f"{prompt} {rng.choice(missing)}"
+
+
+def _section(text: str, start: str, end: str) -> str:
+    """Text between two template headings (stripped)."""
+    match = re.search(re.escape(start) + r"(.*?)" + re.escape(end), text, re.DOTALL)
+    return match.group(1).strip() if match else ""
@@ -245,7 +245,8 @@ def main():
     session = get_or_create_session()
     render_zone_c(session.candidates, session.test_bench)
     
-
+    # === ZONE D: Score Trajectory + Cost/Latency Telemetry ===
+    render_zone_d(session.trajectory, session.telemetry)
     
     # === Auto-refresh during optimization ===
     if st.session_state.get("is_running", False):
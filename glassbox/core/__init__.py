@@ -1,6 +1,8 @@
 # Core package - exports all engines and utilities
 from glassbox.core.api_client import BoeingAPIClient, Message, APIResponse, APIConfig
 from glassbox.core.gemini_client import GeminiAPIClient, GeminiConfig, GeminiResponse, get_api_client
+from glassbox.core.async_client import AsyncBoeingAPIClient, AsyncGeminiAPIClient
+from glassbox.core.cassette import CassetteClient
 from glassbox.core.evaluator import Evaluator, HumanOverrideEvaluator, EvaluationResult
 from glassbox.core.optimizer_base import AbstractOptimizer, OptimizerStatus, StepResult
 from glassbox.core.opro_engine import OProEngine
@@ -19,6 +21,11 @@ __all__ = [
     "GeminiConfig",
     "GeminiResponse",
     "get_api_client",
+    # API - asyncio
+    "AsyncBoeingAPIClient",
+    "AsyncGeminiAPIClient",
+    # API - record/replay
+    "CassetteClient",
     # Evaluator
     "Evaluator",
     "HumanOverrideEvaluator",
@@ -0,0 +1,178 @@
+"""
+Best-Arm Allocator - adaptive test-bench spending over a candidate pool.
+
+Each candidate prompt is an arm and a pull scores it on one more test
+input. An arm's full-bench mean is bracketed by a confidence interval, the
+tighter of:
+
+- the exact bound: its unscored inputs could score anywhere in 0-100;
+- a Hoeffding-Serfling bound (sampling inputs without replacement) at the
+  configured confidence, union-bounded over arms and pulls.
+
+Allocation follows LUCB: after one pull per arm, each round pulls the
+empirical leader and the challengers with the highest upper bounds, drops
+arms whose upper bound is below the leader's lower bound, and stops once
+the leader's lower bound clears every other arm's upper bound (the winner
+is separated). The winner is then scored on its remaining inputs so its
+reported score is exact rather than a partial mean.
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+SCORE_RANGE = 100.0
+
+
+@dataclass
+class ArmInterval:
+    """Confidence interval on one arm's full-bench mean score."""
+    arm: int
+    mean: Optional[float]  # Mean of the inputs scored so far
+    lower: float
+    upper: float
+    scored: List[int] = field(default_factory=list)  # Input indices scored
+    status: str = "racing"  # "racing", "winner" or "eliminated"
+
+    def to_dict(self, confidence: float) -> Dict[str, Any]:
+        return {
+            "strategy": "best_arm",
+            "status": self.status,
+            "mean": round(self.mean, 2) if self.mean is not None else None,
+            "lower": round(self.lower, 2),
+            "upper": round(self.upper, 2),
+            "confidence": confidence,
+            "inputs_evaluated": len(self.scored)
+        }
+
+
+class BestArmAllocator:
+    """
+    LUCB best-arm identification over `arms` prompts and `inputs` test inputs.
+
+    Usage:
+        allocator = BestArmAllocator(arms=len(prompts), inputs=3, confidence=0.95)
+        while True:
+            pulls = allocator.next_pulls()  # [(arm, input_index), ...]
+            if not pulls:
+                break
+            for arm, input_index in pulls:
+                allocator.record(arm, input_index, score)
+        allocator.winner, allocator.intervals()
+    """
+
+    def __init__(self, arms: int, inputs: int, confidence: float = 0.95, batch: int = 2):
+        self.arms = arms
+        self.inputs = inputs
+        self.confidence = confidence
+        self.batch = max(2, batch)  # Leader plus at least one challenger per round
+        self.scores: List[Dict[int, float]] = [{} for _ in range(arms)]
+        self.eliminated: List[bool] = [False] * arms
+        self.pulls = 0  # Scores recorded through record()
+        self._pulled: List[int] = [0] * arms
+        delta = max(1e-9, 1.0 - confidence)
+        self._log_term = math.log(2.0 * max(1, arms) * max(1, inputs) / delta)
+
+    def record(self, arm: int, input_index: int, score: float, pulled: bool = True):
+        """Store a score; pulled=False for scores that cost no call (e.g. empty inputs)."""
+        self.scores[arm][input_index] = score
+        if pulled:
+            self.pulls += 1
+            self._pulled[arm] += 1
+
+    def pulled(self, arm: int) -> int:
+        """Scores recorded for the arm through pulls."""
+        return self._pulled[arm]
+
+    def interval(self, arm: int) -> Tuple[Optional[float], float, float]:
+        """(observed mean, lower, upper) bounds on the arm's full-bench mean."""
+        scores = self.scores[arm]
+        n = len(scores)
+        if n == 0:
+            return None, 0.0, SCORE_RANGE
+        total = sum(scores.values())
+        mean = total / n
+        remaining = self.inputs - n
+        lower = total / self.inputs
+        upper = (total + SCORE_RANGE * remaining) / self.inputs
+        if remaining:
+            # Serfling: sampling without replacement shrinks the radius as n -> inputs
+            rho = 1.0 - (n - 1) / self.inputs
+            radius = SCORE_RANGE * math.sqrt(rho * self._log_term / (2 * n))
+            lower = max(lower, mean - radius)
+            upper = min(upper, mean + radius)
+        return mean, lower, upper
+
+    def _live(self) -> List[int]:
+        return [arm for arm in range(self.arms) if not self.eliminated[arm]]
+
+    def _complete(self, arm: int) -> bool:
+        return len(self.scores[arm]) >= self.inputs
+
+    def _next_input(self, arm: int) -> int:
+        return next(i for i in range(self.inputs) if i not in self.scores[arm])
+
+    @property
+    def leader(self) -> Optional[int]:
+        """Live arm with the highest observed mean (lowest index on ties)."""
+        scored = [arm for arm in self._live() if self.scores[arm]]
+        if not scored:
+            return None
+        return max(scored, key=lambda arm: (self.interval(arm)[0], -arm))
+
+    def _eliminate(self, leader: int):
+        floor = self.interval(leader)[1]
+        for arm in self._live():
+            if arm != leader and self.interval(arm)[2] < floor:
+                self.eliminated[arm] = True
+
+    def separated(self) -> bool:
+        """True once the leader's lower bound clears every other live arm's upper bound."""
+        leader = self.leader
+        if leader is None:
+            return False
+        floor = self.interval(leader)[1]
+        return all(self.interval(arm)[2] <= floor for arm in self._live() if arm != leader)
+
+    @property
+    def winner(self) -> Optional[int]:
+        return self.leader if self.separated() else None
+
+    def next_pulls(self) -> List[Tuple[int, int]]:
+        """The next round of (arm, input_index) pulls; empty when allocation is done."""
+        unpulled = [arm for arm in self._live() if not self._pulled[arm] and not self._complete(arm)]
+        if unpulled:
+            return [(arm, self._next_input(arm)) for arm in unpulled]
+
+        leader = self.leader
+        if leader is None:
+            return []
+        self._eliminate(leader)
+
+        if self.separated():
+            # Finish the winner so its score is exact, then stop
+            if self._complete(leader):
+                return []
+            return [(leader, i) for i in range(self.inputs) if i not in self.scores[leader]]
+
+        pulls = [] if self._complete(leader) else [(leader, self._next_input(leader))]
+        challengers = sorted(
+            (arm for arm in self._live() if arm != leader and not self._complete(arm)),
+            key=lambda arm: (-self.interval(arm)[2], arm)
+        )
+        for arm in challengers[:self.batch - len(pulls)]:
+            pulls.append((arm, self._next_input(arm)))
+        return pulls
+
+    def intervals(self) -> List[ArmInterval]:
+        """Current interval and status of every arm, in arm order."""
+        winner = self.winner
+        result = []
+        for arm in range(self.arms):
+            mean, lower, upper = self.interval(arm)
+            if winner is not None:
+                status = "winner" if arm == winner else "eliminated"
+            else:
+                status = "eliminated" if self.eliminated[arm] else "racing"
+            result.append(ArmInterval(arm, mean, lower, upper, sorted(self.scores[arm]), status))
+        return result
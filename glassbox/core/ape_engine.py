@@ -6,13 +6,15 @@ deduces the instruction from input-output examples.
 """
 
 import logging
+import random
 import re
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
 
 from glassbox.core.optimizer_base import AbstractOptimizer, StepResult
 from glassbox.core.api_client import Message
 from glassbox.models.session import SchematicState
 from glassbox.models.candidate import UnifiedCandidate
+from glassbox.models.memo import canonicalize_prompt
 from glassbox.prompts.templates import (
     APE_INDUCTION_SYSTEM_PROMPT,
     APE_INDUCTION_USER_TEMPLATE,
@@ -22,6 +24,8 @@ from glassbox.prompts.templates import (
 
 logger = logging.getLogger(__name__)
 
+INDUCTION_EXAMPLES = 3  # Example slots in APE_INDUCTION_USER_TEMPLATE
+
 
 class APEEngine(AbstractOptimizer):
     """
@@ -29,9 +33,12 @@ class APEEngine(AbstractOptimizer):
     
     Algorithm:
     1. User provides 3-5 input-output examples
-    2. Induction: LLM deduces the "hidden instruction" that maps input→output
-    3. Resampling: Generate N variations of the deduced instruction
-    4. Evaluation: Run all variations against test bench
+    2. Induction: LLM deduces the "hidden instruction" that maps input→output,
+       once per sampled example subset (SessionConfig.induction_subsets,
+       run concurrently); duplicate instructions are dropped
+    3. Resampling: Generate N variations spread across the induced set
+    4. Evaluation: Run all variations against test bench (or, with
+       evaluation_strategy "best_arm", only until the best is separated)
     5. Selection: Highest average score wins
     
     Glass Box Visualization:
@@ -44,6 +51,8 @@ class APEEngine(AbstractOptimizer):
         super().__init__(*args, **kwargs)
         self.examples: List[Tuple[str, str]] = []  # (input, output) pairs
         self._deduced_instruction: str = ""
+        self.induced_instructions: List[str] = []  # Distinct induction results, in subset order
+        self._instruction_sources: Dict[str, List[int]] = {}  # Canonical prompt -> example indices
         self._induction_complete: bool = False
 
     @property
@@ -59,6 +68,8 @@ class APEEngine(AbstractOptimizer):
         self.examples = examples
         self._induction_complete = False
         self._deduced_instruction = ""
+        self.induced_instructions = []
+        self._instruction_sources = {}
 
     def step(self) -> StepResult:
         """
@@ -70,13 +81,25 @@ class APEEngine(AbstractOptimizer):
         self.session.current_step += 1
         step_num = self.session.current_step
 
+        # Budget check: resampling calls plus at least one candidate (and induction if pending)
+        subsets = max(1, self.session.config.induction_subsets)
+        shortfall = self._budget_shortfall(
+            (0 if self._induction_complete else subsets)
+            + (len(self.induced_instructions) or subsets)
+            + self._calls_per_candidate()
+        )
+        if shortfall:
+            return self._budget_stop_result(step_num, shortfall)
+
         # Phase 1: Induction (first step only)
         if not self._induction_complete:
             self.session.schematic_state = SchematicState.INDUCTION
             self.session.active_node = "induction"
             self._update_monologue("Analyzing examples...", "induction", 0)
             
-            self._deduced_instruction = self._perform_induction()
+            with self.telemetry.phase("induction"):
+                self.induced_instructions = self._perform_induction()
+            self._deduced_instruction = self.induced_instructions[0] if self.induced_instructions else ""
             self._induction_complete = True
             
             if not self._deduced_instruction:
@@ -94,22 +117,47 @@ class APEEngine(AbstractOptimizer):
         # Phase 2: Resampling
         self.session.schematic_state = SchematicState.MUTATION
         self.session.active_node = "induction"
-        self._update_monologue(f"Generating variations of: {self._deduced_instruction[:50]}...", "resampling", 75)
+        if len(self.induced_instructions) > 1:
+            preview = f"{len(self.induced_instructions)} induced instructions, e.g. {self._deduced_instruction[:50]}"
+        else:
+            preview = f"Generating variations of: {self._deduced_instruction[:50]}"
+        self._update_monologue(f"{preview}...", "resampling", 75)
         
-        variations = self._generate_variations()
+        with self.telemetry.phase("mutation"):
+            variations = self._generate_variations()
+
+        variations = self._trim_to_budget(variations, self._calls_per_candidate())
+        if not variations:
+            return self._budget_stop_result(step_num, self._budget_shortfall(self._calls_per_candidate()))
 
         # Phase 3: Evaluation
         self.session.schematic_state = SchematicState.EVALUATION
         self.session.active_node = "candidates"
         
-        step_candidates = []
-        for i, prompt_text in enumerate(variations):
-            if self._stop_requested.is_set():
-                break
-            
+        def _evaluate_variation(prompt_text: str) -> UnifiedCandidate:
             candidate = self._evaluate_candidate(prompt_text, step_num)
-            step_candidates.append(candidate)
-            self.session.candidates.append(candidate)
+            self._record_candidate(candidate)
+            return candidate
+
+        # Listwise judging: one judge call per input for the whole step
+        # (racing and best-arm allocation judge each round themselves)
+        if self.session.config.batch_judging and self.session.config.evaluation_strategy not in ("racing", "best_arm"):
+            self._batch_judge(variations)
+
+        if self.session.config.evaluation_strategy == "best_arm":
+            step_candidates = self._allocate_candidates(variations, step_num)
+        elif self.session.config.evaluation_strategy == "racing":
+            step_candidates = []
+            for prompt_text, outcome in zip(variations, self._race_test_inputs(variations)):
+                if outcome is None:
+                    continue  # Interrupted by stop
+                scores, responses, reasoning, racing = outcome
+                candidate = self._build_candidate(prompt_text, step_num, scores, responses, reasoning)
+                candidate.meta["racing"] = racing
+                self._record_candidate(candidate)
+                step_candidates.append(candidate)
+        else:
+            step_candidates = self.scheduler.map(_evaluate_variation, variations)
 
         # Select best
         best = max(step_candidates, key=lambda c: c.score_aggregate) if step_candidates else None
@@ -131,21 +179,70 @@ class APEEngine(AbstractOptimizer):
             should_stop=step_num >= 3  # APE typically converges in few steps
         )
 
-    def _perform_induction(self) -> str:
-        """Deduce the hidden instruction from examples."""
+    def _perform_induction(self) -> List[str]:
+        """
+        Deduce the hidden instruction from examples.
+        
+        With SessionConfig.induction_subsets = K > 1, K example subsets are
+        sampled and induced concurrently (the APE paper's proposal
+        sampling), so the first step costs about one call's latency.
+        
+        Returns:
+            Distinct instructions in subset order (the first three examples
+            first); empty if every induction call failed.
+        """
         if len(self.examples) < 2:
             # Use seed prompt and test bench as examples
             self.examples = [
                 (self.session.test_bench.input_a, ""),  # Will use API to generate ideal
                 (self.session.test_bench.input_b, ""),
             ]
-            return self.session.seed_prompt  # Fallback to seed
+            return [self.session.seed_prompt]  # Fallback to seed
+
+        subsets = self._sample_example_subsets(max(1, self.session.config.induction_subsets))
+
+        def _induce(subset: List[int]) -> Tuple[List[int], str]:
+            with self.telemetry.phase("induction"):
+                return subset, self._induce_instruction(subset)
 
-        # Format examples for induction prompt
+        instructions = []
+        for subset, instruction in self.scheduler.map(_induce, subsets):
+            if not instruction:
+                continue
+            key = canonicalize_prompt(instruction)
+            if key in self._instruction_sources:
+                continue  # Duplicate of an earlier subset's instruction
+            self._instruction_sources[key] = subset
+            instructions.append(instruction)
+        return instructions
+
+    def _sample_example_subsets(self, count: int) -> List[List[int]]:
+        """
+        Up to `count` distinct ordered subsets of example indices, each
+        filling the template's example slots. The first is always the first
+        three examples (the single-call behavior); the rest are drawn from
+        the module RNG, so runs are reproducible under random.seed.
+        """
+        size = min(INDUCTION_EXAMPLES, len(self.examples))
+        subsets = [list(range(size))]
+        seen = {tuple(subsets[0])}
+        attempts = 0
+        while len(subsets) < count and attempts < 20 * count:
+            attempts += 1
+            subset = random.sample(range(len(self.examples)), size)
+            if tuple(subset) not in seen:
+                seen.add(tuple(subset))
+                subsets.append(subset)
+        return subsets
+
+    def _induce_instruction(self, subset: List[int]) -> str:
+        """One induction call on the examples at `subset`; "" on failure."""
         example_texts = {}
-        for i, (inp, out) in enumerate(self.examples[:3], 1):
-            example_texts[f"input_{i}"] = inp
-            example_texts[f"output_{i}"] = out
+        for slot in range(1, INDUCTION_EXAMPLES + 1):
+            # Fewer examples than slots: mark the spare slots as unused
+            inp, out = self.examples[subset[slot - 1]] if slot <= len(subset) else ("(none)", "(none)")
+            example_texts[f"input_{slot}"] = inp
+            example_texts[f"output_{slot}"] = out
 
         user_prompt = APE_INDUCTION_USER_TEMPLATE.format(**example_texts)
 
@@ -163,11 +260,43 @@ class APEEngine(AbstractOptimizer):
             return ""
 
     def _generate_variations(self) -> List[str]:
-        """Generate variations of the deduced instruction."""
+        """
+        Generate variations of the induced instructions.
+        
+        Every induced instruction is a candidate and seeds its own
+        resampling call (run concurrently), each asking for an equal share
+        of SessionConfig.generations_per_step variations.
+        """
         num_variations = self.session.config.generations_per_step
-
+        bases = self.induced_instructions or [self._deduced_instruction]
+        per_base = max(1, -(-num_variations // len(bases)))
+
+        def _resample(base: str) -> List[str]:
+            with self.telemetry.phase("mutation"):
+                return self._resample_instruction(base, per_base)
+
+        resampled = self.scheduler.map(_resample, bases)
+
+        # Always include the bases, then interleave their variations
+        variations = list(bases)
+        seen = {canonicalize_prompt(base) for base in bases}
+        for rank in range(max((len(r) for r in resampled), default=0)):
+            for base, results in zip(bases, resampled):
+                if rank >= len(results):
+                    continue
+                key = canonicalize_prompt(results[rank])
+                if key in seen:
+                    continue
+                seen.add(key)
+                variations.append(results[rank])
+                self._instruction_sources.setdefault(key, self._sources_of(base))
+
+        return variations[:len(bases) + num_variations]
+
+    def _resample_instruction(self, base_instruction: str, num_variations: int) -> List[str]:
+        """One resampling call: numbered variations of `base_instruction`."""
         user_prompt = APE_RESAMPLE_TEMPLATE.format(
-            base_instruction=self._deduced_instruction,
+            base_instruction=base_instruction,
             num_variations=num_variations
         )
 
@@ -181,7 +310,7 @@ class APEEngine(AbstractOptimizer):
         )
 
         if not response.success:
-            return [self._deduced_instruction]  # Fallback to base
+            return []  # The base itself is still a candidate
 
         # Parse numbered variations
         variations = []
@@ -200,46 +329,55 @@ class APEEngine(AbstractOptimizer):
         if current_var:
             variations.append(current_var.strip())
 
-        # Always include the original
-        if self._deduced_instruction not in variations:
-            variations.insert(0, self._deduced_instruction)
+        return variations[:num_variations]
 
-        return variations[:num_variations + 1]
+    def _sources_of(self, prompt_text: str) -> Optional[List[int]]:
+        """Example indices the prompt was induced from (None if unknown)."""
+        return self._instruction_sources.get(canonicalize_prompt(prompt_text))
 
-    def _evaluate_candidate(self, prompt_text: str, generation: int) -> UnifiedCandidate:
-        """Evaluate candidate against test bench."""
-        test_inputs = [
-            (self.session.test_bench.input_a, "a"),
-            (self.session.test_bench.input_b, "b"),
-            (self.session.test_bench.input_c, "c"),
-        ]
+    def _allocate_candidates(self, variations: List[str], step_num: int) -> List[UnifiedCandidate]:
+        """
+        Best-arm evaluation of the step's pool: test-bench calls go to the
+        leading instructions until the winner is separated. Candidates carry
+        their confidence interval in meta["best_arm"].
+        """
+        results, allocator = self._allocate_test_inputs(variations)
+        intervals = allocator.intervals()
 
-        scores = {}
-        responses = {}
-        reasoning = {}
-        
-        for input_text, label in test_inputs:
-            key = f"input_{label}"
-            
-            if not input_text.strip():
-                scores[key] = 50.0
-                responses[key] = ""
-                reasoning[key] = "Test input empty"
-                continue
+        step_candidates = []
+        for prompt_text, outcome, interval in zip(variations, results, intervals):
+            if outcome is None:
+                continue  # Interrupted by stop
+            scores, responses, reasoning = outcome
+            candidate = self._build_candidate(prompt_text, step_num, scores, responses, reasoning)
+            candidate.meta["best_arm"] = interval.to_dict(allocator.confidence)
+            self._record_candidate(candidate)
+            step_candidates.append(candidate)
 
-            try:
-                response = self._execute_prompt(prompt_text, input_text)
-                responses[key] = response
-                
-                eval_result = self.evaluator.evaluate(prompt_text, input_text, response)
-                scores[key] = eval_result.score
-                reasoning[key] = eval_result.reasoning
-                
-            except Exception as e:
-                scores[key] = 0.0
-                responses[key] = ""
-                reasoning[key] = f"Error: {str(e)}"
-        
+        full_cost = len(variations) * sum(1 for _, text in self._test_bench_inputs() if text.strip())
+        winner = allocator.winner
+        if winner is not None:
+            w = intervals[winner]
+            self.session.internal_monologue += (
+                f"\nBest arm: #{winner + 1} separated at {allocator.confidence:.0%} "
+                f"(CI {w.lower:.1f}-{w.upper:.1f}) after {allocator.pulls}/{full_cost} input evaluations"
+            )
+        return step_candidates
+
+    def _evaluate_candidate(self, prompt_text: str, generation: int) -> UnifiedCandidate:
+        """Evaluate candidate against test bench."""
+        scores, responses, reasoning = self._evaluate_test_inputs(prompt_text)
+        return self._build_candidate(prompt_text, generation, scores, responses, reasoning)
+
+    def _build_candidate(
+        self,
+        prompt_text: str,
+        generation: int,
+        scores: Dict[str, float],
+        responses: Dict[str, str],
+        reasoning: Dict[str, str]
+    ) -> UnifiedCandidate:
+        """Wrap per-input results in a UnifiedCandidate."""
         # Calculate aggregate
         valid_scores = [v for v in scores.values()]
         aggregate = sum(valid_scores) / len(valid_scores) if valid_scores else 0.0
@@ -256,7 +394,8 @@ class APEEngine(AbstractOptimizer):
                     "responses": responses,
                     "reasoning": reasoning
                 },
-                "deduced_from_indices": list(range(len(self.examples))) if self.examples else []
+                "deduced_from_indices": self._sources_of(prompt_text)
+                or (list(range(len(self.examples))) if self.examples else [])
             }
         )
 
@@ -11,15 +11,23 @@ import uuid
 import base64
 import logging
 import threading
-import time
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any, Union
 from queue import Queue
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from glassbox.core.response_cache import ResponseCache
+from glassbox.core.rate_limiter import TokenBucket, AdaptiveConcurrencyController
+from glassbox.core.retry import RetryPolicy, RequestCancelled, run_interruptible
 
 logger = logging.getLogger(__name__)
 
+HTML_RESPONSE_ERROR = (
+    "Received HTML response - likely firewall or SSO redirect. Check VPN/authentication."
+)
+
 
 @dataclass
 class Message:
@@ -45,17 +53,31 @@ class APIResponse:
     content: str = ""
     error_message: str = ""
     raw_response: Optional[Dict] = None
+    retries: int = 0  # Backoff retries spent before this response
+    cached: bool = False  # Served from the response cache, not the network
 
 
 @dataclass 
 class APIConfig:
     """Configuration for Boeing API client."""
-    base_url: str = "https://bcai-test.web.boeing.com"
+    base_url: str = field(default_factory=lambda: os.getenv("BCAI_BASE_URL") or "https://bcai-test.web.boeing.com")
     endpoint: str = "/bcai-public-api/conversation"
     model: str = "gpt-4o-mini"
     temperature: float = 0.7
     ca_bundle_path: Optional[str] = None
     timeout: int = 60
+    pool_size: int = 10  # Keep-alive connections held open to the gateway
+    max_concurrency: int = 16  # In-flight request cap for the async client
+    # Persistent response cache (disabled unless a path is set)
+    cache_path: Optional[str] = field(default_factory=lambda: os.getenv("GLASSBOX_CACHE_PATH") or None)
+    cache_ttl_seconds: int = 7 * 24 * 3600
+    cache_max_bytes: int = 256 * 1024 * 1024
+    cache_all_temperatures: bool = False  # Default: only temperature 0.0 (judge) calls
+    # Client-side rate limiting (token bucket) and AIMD concurrency control
+    rate_limit_rps: float = 0.0  # Request starts per second; 0 disables the bucket
+    rate_limit_burst: int = 10
+    initial_concurrency: int = 8  # AIMD start point; ceiling is max_concurrency
+    min_concurrency: int = 1
 
 
 class BoeingAPIClient:
@@ -67,15 +89,112 @@ class BoeingAPIClient:
     - Strict request body schema with mandatory fields
     - Response parsing with fallback logic
     - SSL/Certificate handling for internal CA
-    - Daemon thread execution with stop signal support
+    - Daemon thread execution with stop signal support (interrupts backoff and in-flight calls)
+    - Jittered, Retry-After-aware retries via a pluggable RetryPolicy
+    - Pooled keep-alive HTTP session shared by all worker threads
     """
 
-    def __init__(self, config: Optional[APIConfig] = None):
+    def __init__(
+        self,
+        config: Optional[APIConfig] = None,
+        retry_policy: Optional[RetryPolicy] = None
+    ):
         self.config = config or APIConfig()
+        self.retry_policy = retry_policy or RetryPolicy()
         self._conversation_guid = str(uuid.uuid4())
         self._stop_requested = threading.Event()
         self._result_queue: Queue = Queue()
-        
+
+        # Pooled HTTP session (created lazily, shared across threads)
+        self._session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
+        self._requests_sent = 0
+
+        # Throughput control shared by every thread using this client
+        self.rate_limiter = TokenBucket(self.config.rate_limit_rps, self.config.rate_limit_burst)
+        self.concurrency = AdaptiveConcurrencyController(
+            initial_limit=self.config.initial_concurrency,
+            min_limit=self.config.min_concurrency,
+            max_limit=self.config.max_concurrency
+        )
+
+        # Content-addressed response cache for deterministic calls
+        self.response_cache: Optional[ResponseCache] = None
+        if self.config.cache_path:
+            self.response_cache = ResponseCache(
+                self.config.cache_path,
+                ttl_seconds=self.config.cache_ttl_seconds,
+                max_bytes=self.config.cache_max_bytes,
+                cache_all_temperatures=self.config.cache_all_temperatures
+            )
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        Keep-alive HTTP session used for every gateway call.
+
+        Reusing one session avoids a new TCP connection and TLS handshake
+        per executor/judge/optimizer call.
+        """
+        with self._session_lock:
+            if self._session is None:
+                self._session = self._create_session()
+            return self._session
+
+    def _create_session(self) -> requests.Session:
+        """Build a session whose connection pool is sized from APIConfig."""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.config.pool_size,
+            pool_maxsize=self.config.pool_size
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        # SSL verification - use custom CA bundle if provided
+        session.verify = self.config.ca_bundle_path or True
+        return session
+
+    def get_connection_stats(self) -> Dict[str, int]:
+        """
+        Report connection reuse for the pooled session.
+
+        Returns:
+            Dict with requests sent, connections opened, connections reused
+            and the configured pool size.
+        """
+        opened = 0
+        with self._session_lock:
+            session = self._session
+            requests_sent = self._requests_sent
+
+        if session is not None:
+            for adapter in session.adapters.values():
+                pools = adapter.poolmanager.pools
+                for key in pools.keys():
+                    pool = pools.get(key)
+                    if pool is not None:
+                        opened += pool.num_connections
+
+        return {
+            "requests_sent": requests_sent,
+            "connections_opened": opened,
+            "connections_reused": max(0, requests_sent - opened),
+            "pool_size": self.config.pool_size
+        }
+
+    def get_rate_limit_stats(self) -> Dict[str, float]:
+        """Current AIMD concurrency limit and observed throughput."""
+        stats = self.concurrency.metrics()
+        stats["rate_limit_rps"] = self.config.rate_limit_rps
+        return stats
+
+    def close(self):
+        """Close the pooled session and release its connections."""
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
     @property
     def pat_token(self) -> Optional[str]:
         """Retrieve PAT from environment variable (BCAI_PAT_B64)."""
@@ -110,10 +229,36 @@ class BoeingAPIClient:
             "stream": False,  # Strictly disabled per spec
             "skip_db_save": True,  # Mandatory per spec
             "conversation_mode": ["non-rag"],  # Mandatory per spec
-            "temperature": temperature or self.config.temperature,
+            # Explicit None check: a judge temperature of 0.0 must not fall back
+            "temperature": temperature if temperature is not None else self.config.temperature,
             "messages": [msg.to_dict() for msg in messages]
         }
 
+    def _cache_key(self, messages: List[Message], temperature: float) -> Optional[str]:
+        """Cache key for this request, or None if it should not be cached."""
+        if self.response_cache is None or not self.response_cache.is_cacheable(temperature):
+            return None
+        return ResponseCache.make_key(self.config.model, temperature, messages)
+
+    def _cached_response(self, cache_key: Optional[str]) -> Optional[APIResponse]:
+        """Serve a request from the response cache if present."""
+        if cache_key is None:
+            return None
+        cached = self.response_cache.get(cache_key)
+        if cached is None:
+            return None
+        return APIResponse(
+            success=True,
+            content=cached["content"],
+            raw_response=cached["raw_response"],
+            cached=True
+        )
+
+    def _store_response(self, cache_key: Optional[str], result: APIResponse):
+        """Persist a successful response under its cache key."""
+        if cache_key is not None and result.success:
+            self.response_cache.put(cache_key, result.content, result.raw_response)
+
     def _parse_response(self, response: requests.Response) -> APIResponse:
         """
         Parse API response with fallback logic per Boeing spec 1.5.
@@ -129,11 +274,32 @@ class BoeingAPIClient:
             if "text/html" in content_type:
                 return APIResponse(
                     success=False,
-                    error_message="Received HTML response - likely firewall or SSO redirect. Check VPN/authentication."
+                    error_message=HTML_RESPONSE_ERROR
                 )
 
             data = response.json()
-            
+
+        except json.JSONDecodeError:
+            return APIResponse(
+                success=False,
+                error_message="Invalid JSON response from API"
+            )
+        except Exception as e:
+            return APIResponse(
+                success=False,
+                error_message=f"Response parsing error: {str(e)}"
+            )
+
+        return self._parse_response_data(data)
+
+    def _parse_response_data(self, data: Dict[str, Any]) -> APIResponse:
+        """
+        Extract message content from a decoded response body.
+        
+        Shared by the sync and async clients so both apply the same
+        choices/messages fallbacks.
+        """
+        try:
             # Primary path: response['choices'][0]['messages'][0]['content']
             # Note: Boeing API may return a list of messages in choices
             choices = data.get("choices", [])
@@ -175,11 +341,6 @@ class BoeingAPIClient:
                 raw_response=data
             )
 
-        except json.JSONDecodeError:
-            return APIResponse(
-                success=False,
-                error_message="Invalid JSON response from API"
-            )
         except Exception as e:
             return APIResponse(
                 success=False,
@@ -193,6 +354,7 @@ class BoeingAPIClient:
         error_messages = {
             401: "Unauthorized - Check PAT format (must be Base64 encoded, no whitespace)",
             403: "Access Denied - Check network access/VPN connection",
+            429: "Rate limited (429) - Backing off and reducing concurrency",
         }
         
         if status_code in error_messages:
@@ -208,61 +370,66 @@ class BoeingAPIClient:
         self,
         messages: List[Message],
         temperature: Optional[float] = None,
-        max_retries: int = 5
+        max_retries: Optional[int] = None
     ) -> APIResponse:
         """
         Send a message to the Boeing API.
         
-        Implements exponential backoff for 5xx errors per Boeing spec Section 4.
+        Implements exponential backoff for 5xx errors per Boeing spec Section 4,
+        and also backs off on 429, honouring Retry-After (see retry_policy).
+        Request starts pass through the token bucket and AIMD concurrency
+        limit. Deterministic calls are served from the response cache when
+        enabled. Backoff waits and in-flight requests are abandoned as soon as
+        request_stop() is called.
         """
         url = f"{self.config.base_url}{self.config.endpoint}"
         headers = self._get_headers()
         body = self._build_request_body(messages, temperature)
+
+        cache_key = self._cache_key(messages, body["temperature"])
+        cached = self._cached_response(cache_key)
+        if cached is not None:
+            return cached
         
         # SSL verification - use custom CA bundle if provided
         verify = self.config.ca_bundle_path or True
         
-        backoff = 2  # Start at 2s, double up to 32s
+        policy = self.retry_policy
+        attempts = max_retries if max_retries is not None else policy.max_retries
         
-        for attempt in range(max_retries):
-            if self._stop_requested.is_set():
-                return APIResponse(
-                    success=False,
-                    error_message="Request cancelled by user"
-                )
+        for attempt in range(attempts):
+            # Wait for a rate-limit token and an AIMD concurrency slot
+            if (
+                self._stop_requested.is_set()
+                or not self.rate_limiter.acquire(self._stop_requested)
+                or not self.concurrency.acquire(self._stop_requested)
+            ):
+                return self._cancelled_response()
             
             try:
-                response = requests.post(
-                    url,
-                    headers=headers,
-                    json=body,
-                    verify=verify,
-                    timeout=self.config.timeout
-                )
-                
-                if response.status_code == 200:
-                    return self._parse_response(response)
-                
-                error_msg = self._handle_http_error(response.status_code)
-                
-                # Retry with backoff for 5xx errors
-                if response.status_code >= 500 and attempt < max_retries - 1:
-                    logger.warning(f"Server error, retrying in {backoff}s...")
-                    time.sleep(backoff)
-                    backoff = min(backoff * 2, 32)
-                    continue
-                
-                return APIResponse(
-                    success=False,
-                    error_message=error_msg
+                with self._session_lock:
+                    self._requests_sent += 1
+
+                response = run_interruptible(
+                    lambda: self.session.post(
+                        url,
+                        headers=headers,
+                        json=body,
+                        verify=verify,
+                        timeout=self.config.timeout
+                    ),
+                    self._stop_requested
                 )
                 
+            except RequestCancelled:
+                return self._cancelled_response()
             except requests.exceptions.SSLError as e:
                 return APIResponse(
                     success=False,
                     error_message=f"SSL Error - Check CA bundle path. Error: {str(e)}"
                 )
             except requests.exceptions.Timeout:
+                self.concurrency.on_overload()
                 return APIResponse(
                     success=False,
                     error_message=f"Request timeout after {self.config.timeout}s"
@@ -272,12 +439,51 @@ class BoeingAPIClient:
                     success=False,
                     error_message=f"Request failed: {str(e)}"
                 )
+            finally:
+                self.concurrency.release()
+
+            if response.status_code == 200:
+                self.concurrency.on_success()
+                result = self._parse_response(response)
+                result.retries = attempt
+                self._store_response(cache_key, result)
+                return result
+            
+            error_msg = self._handle_http_error(response.status_code)
+            
+            # Overload signals shrink the concurrency limit and are retried
+            retryable = policy.should_retry(response.status_code)
+            if retryable:
+                self.concurrency.on_overload()
+            
+            if retryable and attempt < attempts - 1:
+                delay = policy.compute_delay(attempt, response.headers.get("Retry-After"))
+                logger.warning(
+                    f"Gateway overloaded ({response.status_code}), retrying in {delay:.1f}s..."
+                )
+                # Event wait instead of sleep so STOP interrupts the backoff
+                if self._stop_requested.wait(delay):
+                    return self._cancelled_response()
+                continue
+            
+            return APIResponse(
+                success=False,
+                error_message=error_msg,
+                retries=attempt
+            )
         
         return APIResponse(
             success=False,
             error_message="Max retries exceeded"
         )
 
+    def _cancelled_response(self) -> APIResponse:
+        """Response returned when a stop request aborts a call."""
+        return APIResponse(
+            success=False,
+            error_message="Request cancelled by user"
+        )
+
     def send_message_async(
         self,
         messages: List[Message],
@@ -0,0 +1,413 @@
+"""
+Async API Clients - asyncio-native counterparts to BoeingAPIClient and GeminiAPIClient.
+
+Used when many judge/executor calls need to be in flight at once. Each client
+caps concurrency (the Boeing client by its AIMD limit, the Gemini client with a
+semaphore) so callers get backpressure instead of one daemon thread per request.
+"""
+
+import asyncio
+import json
+import logging
+import ssl
+from typing import Optional, List, Any, Dict
+
+from glassbox.core.api_client import (
+    BoeingAPIClient,
+    APIConfig,
+    APIResponse,
+    Message,
+    HTML_RESPONSE_ERROR
+)
+from glassbox.core.retry import RetryPolicy, STOP_POLL_INTERVAL
+from glassbox.core.gemini_client import (
+    GeminiAPIClient,
+    GeminiConfig,
+    GeminiResponse,
+    GENAI_AVAILABLE
+)
+
+logger = logging.getLogger(__name__)
+
+# aiohttp is optional - only needed for the async Boeing client
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+if GENAI_AVAILABLE:
+    from google.genai import types
+
+
+class AsyncBoeingAPIClient(BoeingAPIClient):
+    """
+    asyncio-native Boeing AI Gateway client.
+
+    Reuses the request schema (_build_request_body), headers and response
+    fallbacks (_parse_response_data) of BoeingAPIClient. In-flight requests
+    are capped by the shared AIMD controller (self.concurrency), whose limit
+    starts at APIConfig.initial_concurrency, never exceeds max_concurrency
+    and shrinks on 429/5xx/timeouts. Every request method is async:
+    send_message_async returns an asyncio.Task and health_check must be
+    awaited.
+
+    Usage:
+        client = AsyncBoeingAPIClient()
+        responses = await client.send_many([[msg_a], [msg_b], [msg_c]])
+        await client.aclose()
+    """
+
+    def __init__(
+        self,
+        config: Optional[APIConfig] = None,
+        retry_policy: Optional[RetryPolicy] = None
+    ):
+        super().__init__(config, retry_policy)
+        # Loop-bound resources, rebuilt if the client is used from a new event loop
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._slot_freed: Optional[asyncio.Condition] = None
+        self._http: Optional["aiohttp.ClientSession"] = None
+
+    def _ensure_loop_resources(self):
+        """Create the slot condition and aiohttp session for the running loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._http is not None and not self._http.closed:
+            return
+
+        self._loop = loop
+        self._slot_freed = asyncio.Condition()
+
+        # SSL verification - use custom CA bundle if provided
+        ssl_context = (
+            ssl.create_default_context(cafile=self.config.ca_bundle_path)
+            if self.config.ca_bundle_path else True
+        )
+        connector = aiohttp.TCPConnector(limit=self.config.pool_size, ssl=ssl_context)
+        self._http = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.config.timeout)
+        )
+
+    async def send_message(
+        self,
+        messages: List[Message],
+        temperature: Optional[float] = None,
+        max_retries: Optional[int] = None
+    ) -> APIResponse:
+        """
+        Send a message to the Boeing API without blocking the event loop.
+
+        Implements exponential backoff for 5xx errors per Boeing spec Section 4,
+        honouring Retry-After on 429/5xx. Backoff waits and in-flight requests
+        are abandoned as soon as request_stop() is called.
+        """
+        if not AIOHTTP_AVAILABLE:
+            return APIResponse(
+                success=False,
+                error_message="aiohttp not installed. Run: pip install aiohttp"
+            )
+
+        url = f"{self.config.base_url}{self.config.endpoint}"
+        headers = self._get_headers()
+        body = self._build_request_body(messages, temperature)
+
+        cache_key = self._cache_key(messages, body["temperature"])
+        cached = self._cached_response(cache_key)
+        if cached is not None:
+            return cached
+
+        self._ensure_loop_resources()
+        policy = self.retry_policy
+        attempts = max_retries if max_retries is not None else policy.max_retries
+
+        for attempt in range(attempts):
+            if self._stop_requested.is_set():
+                return self._cancelled_response()
+
+            # Pace request starts with the shared token bucket
+            wait = self.rate_limiter.reserve()
+            if wait > 0 and await self._stoppable_sleep(wait):
+                return self._cancelled_response()
+
+            if not await self._acquire_slot():
+                return self._cancelled_response()
+            try:
+                try:
+                    with self._session_lock:
+                        self._requests_sent += 1
+
+                    outcome = await self._until_stopped(self._post(url, headers, body))
+                    if outcome is None:
+                        return self._cancelled_response()
+                    status_code, retry_after, result = outcome
+                finally:
+                    await self._release_slot()
+
+                if status_code == 200:
+                    self.concurrency.on_success()
+                    result.retries = attempt
+                    self._store_response(cache_key, result)
+                    return result
+
+                error_msg = self._handle_http_error(status_code)
+
+                # Retry with backoff for 429/5xx (slot released while waiting)
+                retryable = policy.should_retry(status_code)
+                if retryable:
+                    self.concurrency.on_overload()
+                if retryable and attempt < attempts - 1:
+                    delay = policy.compute_delay(attempt, retry_after)
+                    logger.warning(f"Server error, retrying in {delay:.1f}s...")
+                    if await self._stoppable_sleep(delay):
+                        return self._cancelled_response()
+                    continue
+
+                return APIResponse(
+                    success=False,
+                    error_message=error_msg,
+                    retries=attempt
+                )
+
+            except aiohttp.ClientSSLError as e:
+                return APIResponse(
+                    success=False,
+                    error_message=f"SSL Error - Check CA bundle path. Error: {str(e)}"
+                )
+            except asyncio.TimeoutError:
+                self.concurrency.on_overload()
+                return APIResponse(
+                    success=False,
+                    error_message=f"Request timeout after {self.config.timeout}s"
+                )
+            except aiohttp.ClientError as e:
+                return APIResponse(
+                    success=False,
+                    error_message=f"Request failed: {str(e)}"
+                )
+
+        return APIResponse(
+            success=False,
+            error_message="Max retries exceeded"
+        )
+
+    async def _acquire_slot(self) -> bool:
+        """Wait for an AIMD in-flight slot. Returns False if stop was requested."""
+        while not self.concurrency.try_acquire():
+            if self._stop_requested.is_set():
+                return False
+            async with self._slot_freed:
+                try:
+                    await asyncio.wait_for(self._slot_freed.wait(), STOP_POLL_INTERVAL)
+                except asyncio.TimeoutError:
+                    pass  # Re-check the limit (AIMD may have raised it) and stop
+        return True
+
+    async def _release_slot(self):
+        self.concurrency.release()
+        async with self._slot_freed:
+            self._slot_freed.notify_all()
+
+    async def _post(self, url: str, headers: dict, body: dict):
+        """POST and return (status, Retry-After header, parsed response or None)."""
+        async with self._http.post(url, headers=headers, json=body) as response:
+            if response.status == 200:
+                return 200, None, await self._parse_async_response(response)
+            return response.status, response.headers.get("Retry-After"), None
+
+    async def _until_stopped(self, coro):
+        """Await coro, cancelling it (and returning None) if stop is requested."""
+        task = asyncio.ensure_future(coro)
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=STOP_POLL_INTERVAL)
+            if done:
+                return task.result()
+            if self._stop_requested.is_set():
+                task.cancel()
+                return None
+
+    async def _stoppable_sleep(self, delay: float) -> bool:
+        """Sleep up to delay seconds. Returns True if stop was requested."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + delay
+        while not self._stop_requested.is_set():
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+            await asyncio.sleep(min(remaining, STOP_POLL_INTERVAL))
+        return True
+
+    async def _parse_async_response(self, response: "aiohttp.ClientResponse") -> APIResponse:
+        """Apply the BoeingAPIClient parsing fallbacks to an aiohttp response."""
+        # Guard: Check for HTML (firewall/SSO redirect)
+        content_type = response.headers.get("Content-Type", "")
+        if "text/html" in content_type:
+            return APIResponse(
+                success=False,
+                error_message=HTML_RESPONSE_ERROR
+            )
+
+        try:
+            data = json.loads(await response.text())
+        except json.JSONDecodeError:
+            return APIResponse(
+                success=False,
+                error_message="Invalid JSON response from API"
+            )
+
+        return self._parse_response_data(data)
+
+    async def send_many(
+        self,
+        batch: List[List[Message]],
+        temperature: Optional[float] = None
+    ) -> List[APIResponse]:
+        """
+        Send several conversations concurrently.
+
+        At most the current AIMD limit of requests are in flight; results
+        are returned in the same order as the batch.
+        """
+        return await asyncio.gather(
+            *(self.send_message(messages, temperature) for messages in batch)
+        )
+
+    def send_message_async(
+        self,
+        messages: List[Message],
+        temperature: Optional[float] = None,
+        callback: Optional[callable] = None
+    ) -> "asyncio.Task":
+        """
+        Schedule send_message on the running event loop.
+
+        Like BoeingAPIClient.send_message_async, the response is placed in
+        _result_queue and passed to callback; the task also returns it.
+        """
+        async def _worker() -> APIResponse:
+            result = await self.send_message(messages, temperature)
+            self._result_queue.put(result)
+            if callback:
+                callback(result)
+            return result
+
+        return asyncio.get_running_loop().create_task(_worker())
+
+    async def health_check(self) -> str:
+        """Quick connectivity check."""
+        if not self.pat_token:
+            return "ERROR: BCAI_PAT_B64 environment variable not set"
+
+        try:
+            response = await self.send_message([Message(role="user", content="ping")])
+            if response.success:
+                return "OK"
+            return f"ERROR: {response.error_message}"
+        except Exception as e:
+            return f"ERROR: {str(e)}"
+
+    async def aclose(self):
+        """Close the aiohttp session and release its connections."""
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
+        self._http = None
+        self._loop = None
+
+
+class AsyncGeminiAPIClient(GeminiAPIClient):
+    """
+    asyncio-native Gemini client for local development.
+
+    Uses the google-genai async surface (client.aio) and caps in-flight
+    requests by GeminiConfig.max_concurrency. send_message, send_many and
+    health_check are all awaited.
+    """
+
+    def __init__(self, config: Optional[GeminiConfig] = None):
+        super().__init__(config)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _ensure_semaphore(self) -> asyncio.Semaphore:
+        """Create the in-flight semaphore for the running loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._semaphore is None:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.config.max_concurrency)
+        return self._semaphore
+
+    async def send_message(
+        self,
+        messages: List[Any],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> GeminiResponse:
+        """Send a message to Gemini API without blocking the event loop."""
+        if not self._client:
+            return GeminiResponse(
+                success=False,
+                error_message="Gemini client not initialized. Check API key."
+            )
+
+        if self._stop_event.is_set():
+            return GeminiResponse(
+                success=False,
+                error_message="Request cancelled"
+            )
+
+        effective_temperature = temperature if temperature is not None else self.config.temperature
+        cache_key = self._cache_key(messages, effective_temperature)
+        cached = self._cached_response(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            gemini_contents = self._convert_messages(messages)
+
+            gen_config = types.GenerateContentConfig(
+                temperature=effective_temperature,
+                max_output_tokens=max_tokens or self.config.max_tokens,
+            )
+
+            async with self._ensure_semaphore():
+                response = await self._client.aio.models.generate_content(
+                    model=self.config.model,
+                    contents=gemini_contents,
+                    config=gen_config
+                )
+
+            if response.text:
+                if cache_key is not None:
+                    self.response_cache.put(cache_key, response.text)
+                return GeminiResponse(
+                    success=True,
+                    content=response.text,
+                    raw_response=response
+                )
+            else:
+                return GeminiResponse(
+                    success=False,
+                    error_message="Empty response from Gemini",
+                    raw_response=response
+                )
+
+        except Exception as e:
+            logger.error(f"Gemini API error: {e}")
+            return GeminiResponse(
+                success=False,
+                error_message=str(e)
+            )
+
+    async def health_check(self) -> Dict[str, Any]:
+        """Check API connectivity (async, like every other method of this client)."""
+        return super().health_check()
+
+    async def send_many(
+        self,
+        batch: List[List[Any]],
+        temperature: Optional[float] = None
+    ) -> List[GeminiResponse]:
+        """Send several conversations concurrently, preserving batch order."""
+        return await asyncio.gather(
+            *(self.send_message(messages, temperature) for messages in batch)
+        )
@@ -0,0 +1,121 @@
+"""
+Mutation Bandit - adaptive choice of Promptbreeder mutation operators.
+
+Each arm (an operator such as "crossover", or a zero-order direction such
+as "more concise") is rewarded with the fitness gain its child achieved
+over its parent, normalized by the headroom left above the parent and
+scaled by the API calls the child cost (mutation + fitness evaluation)
+relative to a full-price child, so rewards stay in [0, 1]. Arms that buy
+more improvement per call are chosen more often.
+
+Children are scored a generation after they are bred, so selection counts
+a pull as pending until its reward arrives; UCB treats pending pulls as
+explored, which spreads one generation's batch of choices across arms
+instead of giving every child the same operator.
+"""
+
+import math
+import random
+from dataclasses import dataclass
+from typing import Any, Dict, List, Sequence
+
+BANDIT_STRATEGIES = ("ucb", "thompson", "random")
+NOMINAL_CALLS = 3  # Mutation + execute + judge for a child with a new prompt
+
+
+@dataclass
+class ArmStats:
+    """Running statistics of one arm."""
+    pulls: int = 0  # Rewarded pulls
+    pending: int = 0  # Selected, reward not yet known
+    reward: float = 0.0  # Sum of rewards
+    calls: float = 0.0  # API calls spent on rewarded pulls
+    improvements: int = 0  # Children that beat their parent
+
+    @property
+    def mean(self) -> float:
+        return self.reward / self.pulls if self.pulls else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "pulls": self.pulls,
+            "pending": self.pending,
+            "mean_reward": round(self.mean, 4),
+            "calls": round(self.calls, 2),
+            "improvements": self.improvements
+        }
+
+
+class MutationBandit:
+    """
+    UCB1 / Thompson-sampling selector over a fixed set of arms.
+
+    Usage:
+        bandit = MutationBandit(["zero_order", "first_order", "crossover"], strategy="ucb")
+        operator = bandit.select(random)
+        ...
+        bandit.update(operator, parent_fitness=60, child_fitness=72, calls=3)
+    """
+
+    def __init__(self, arms: Sequence[str], strategy: str = "ucb", exploration: float = 0.2):
+        if strategy not in BANDIT_STRATEGIES:
+            raise ValueError(f"Unknown bandit strategy: {strategy}")
+        self.arms: List[str] = list(arms)
+        self.strategy = strategy
+        self.exploration = exploration
+        self.stats: Dict[str, ArmStats] = {arm: ArmStats() for arm in self.arms}
+
+    def select(self, rng: random.Random) -> str:
+        """Choose an arm and count it as a pending pull."""
+        if self.strategy == "random":
+            arm = rng.choice(self.arms)
+        elif self.strategy == "thompson":
+            # Beta posterior treating each reward as a fractional success
+            arm = max(self.arms, key=lambda a: rng.betavariate(
+                1.0 + self.stats[a].reward,
+                1.0 + self.stats[a].pulls - self.stats[a].reward
+            ))
+        else:
+            arm = self._ucb_arm()
+        self.stats[arm].pending += 1
+        return arm
+
+    def _ucb_arm(self) -> str:
+        tried = {arm: stats.pulls + stats.pending for arm, stats in self.stats.items()}
+        for arm in self.arms:
+            if tried[arm] == 0:
+                return arm
+        total = sum(tried.values())
+        return max(
+            self.arms,
+            key=lambda a: self.stats[a].mean + self.exploration * math.sqrt(2 * math.log(total) / tried[a])
+        )
+
+    def release(self, arm: str):
+        """Withdraw a pending pull that will never be rewarded."""
+        self.stats[arm].pending = max(0, self.stats[arm].pending - 1)
+
+    def reassign(self, from_arm: str, to_arm: str):
+        """Move a pending pull to another arm (e.g. crossover fell back to zero-order)."""
+        self.release(from_arm)
+        self.stats[to_arm].pending += 1
+
+    def update(self, arm: str, parent_fitness: float, child_fitness: float, calls: float):
+        """Reward a pending pull with the child's normalized fitness gain per call."""
+        stats = self.stats[arm]
+        gain = max(0.0, child_fitness - parent_fitness) / max(1.0, 100.0 - parent_fitness)
+        stats.pending = max(0, stats.pending - 1)
+        stats.pulls += 1
+        stats.reward += min(1.0, gain * NOMINAL_CALLS / max(1.0, calls))
+        stats.calls += calls
+        stats.improvements += 1 if child_fitness > parent_fitness else 0
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        return {arm: stats.to_dict() for arm, stats in self.stats.items()}
+
+    def summary(self) -> str:
+        """One line for the monologue, e.g. "crossover 0.052 (4/6), ..."."""
+        return ", ".join(
+            f"{arm.replace('_', '-')} {stats.mean:.3f} ({stats.improvements}/{stats.pulls})"
+            for arm, stats in self.stats.items()
+        )
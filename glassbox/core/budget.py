@@ -0,0 +1,87 @@
+"""
+Budget Tracker - enforces SessionConfig.budget for one optimizer run.
+
+Counts LLM calls and tokens through the optimizer's TelemetryRecorder, so
+every call made via the engine's client (including the judge's) is
+charged. AbstractOptimizer.run stops between steps once a limit is hit;
+engines call affordable() before committing to a batch of calls so a step
+does not overshoot the remaining budget.
+"""
+
+import time
+from typing import Optional
+
+from glassbox.core.telemetry import TelemetryRecorder
+from glassbox.models.session import RunBudget
+
+
+class BudgetTracker:
+    """
+    Remaining calls, tokens and time for the current run.
+
+    Before start() is called (e.g. a bare step() outside run()) the tracker
+    reports an unlimited budget.
+    """
+
+    def __init__(self, budget: RunBudget, recorder: TelemetryRecorder):
+        self.budget = budget
+        self.recorder = recorder
+        self._started_at: Optional[float] = None
+        self._base_calls = 0
+        self._base_tokens = 0
+
+    def start(self):
+        """Begin charging calls, tokens and time from now."""
+        self._started_at = time.perf_counter()
+        self._base_calls = self.recorder.total_calls
+        self._base_tokens = self.recorder.total_tokens
+
+    @property
+    def calls_used(self) -> int:
+        return self.recorder.total_calls - self._base_calls
+
+    @property
+    def tokens_used(self) -> int:
+        return self.recorder.total_tokens - self._base_tokens
+
+    @property
+    def elapsed_s(self) -> float:
+        return 0.0 if self._started_at is None else time.perf_counter() - self._started_at
+
+    def exhausted(self) -> Optional[str]:
+        """Reason string if any limit has been reached, else None."""
+        if self._started_at is None:
+            return None
+        budget = self.budget
+        if budget.max_calls and self.calls_used >= budget.max_calls:
+            return f"call budget reached ({self.calls_used}/{budget.max_calls} calls)"
+        if budget.max_tokens and self.tokens_used >= budget.max_tokens:
+            return f"token budget reached ({self.tokens_used}/{budget.max_tokens} tokens)"
+        if budget.deadline_s and self.elapsed_s >= budget.deadline_s:
+            return f"deadline reached ({self.elapsed_s:.1f}s/{budget.deadline_s:.0f}s)"
+        return None
+
+    def affordable(self, count: int, calls_each: int = 1) -> int:
+        """
+        How many of `count` units costing up to `calls_each` calls fit in
+        the remaining budget. Token headroom is estimated from the average
+        tokens per call so far this run.
+        """
+        if self._started_at is None or count <= 0:
+            return max(0, count)
+        if self.exhausted():
+            return 0
+
+        calls_each = max(1, calls_each)
+        limit = count
+        if self.budget.max_calls:
+            limit = min(limit, (self.budget.max_calls - self.calls_used) // calls_each)
+        if self.budget.max_tokens and self.calls_used:
+            tokens_per_call = self.tokens_used / self.calls_used
+            remaining_calls = (self.budget.max_tokens - self.tokens_used) / max(tokens_per_call, 1.0)
+            limit = min(limit, int(remaining_calls // calls_each))
+        return max(0, limit)
+
+    def summary(self) -> str:
+        """One-line usage summary for the monologue."""
+        return f"{self.calls_used} calls, {self.tokens_used} tokens, {self.elapsed_s:.1f}s"
@@ -0,0 +1,203 @@
+"""
+Cassette Client - record/replay of all LLM traffic for a run.
+
+Record mode wraps a real client (Boeing, Gemini or a test double) and
+appends every request/response pair to a JSON-lines cassette (gzip if the
+path ends in .gz). Replay mode serves the same responses back with zero
+latency and no network, so whole OPro/APE/Promptbreeder sessions can be
+re-run exactly in CI, profiled without network noise, or attached to a bug
+report.
+
+Requests are matched by content (model, temperature, normalized messages),
+not by order. Repeated identical requests are served their recorded
+responses in the order they were recorded. Engine-side randomness (e.g.
+Promptbreeder's mutation choices) must be seeded for a replay to issue the
+same requests.
+
+Usage:
+    client = CassetteClient("run.cassette.jsonl.gz", mode="record", client=BoeingAPIClient())
+    ... run engines with client ...
+    client.close()
+
+    replay = CassetteClient("run.cassette.jsonl.gz", mode="replay")
+"""
+
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from types import SimpleNamespace
+from typing import Any, Deque, Dict, List, Optional
+
+from glassbox.core.api_client import APIResponse
+from glassbox.core.response_cache import ResponseCache, normalize_messages
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_VERSION = 1
+
+
+def _open_cassette(path: str, mode: str):
+    """Open a cassette as text, transparently gzipped for *.gz paths."""
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class CassetteClient:
+    """
+    Record/replay wrapper exposing the BoeingAPIClient send_message surface.
+
+    Attributes other than send_message are delegated to the wrapped client,
+    so engines, the evaluator and the UI can use it unchanged.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        mode: str = "replay",
+        client: Optional[Any] = None,
+        include_requests: bool = True
+    ):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        if mode == "record" and client is None:
+            raise ValueError("Record mode needs a client to forward requests to")
+
+        self.path = os.path.expanduser(path)
+        self.mode = mode
+        self.client = client
+        self.include_requests = include_requests  # Store messages once per request key
+
+        self._lock = threading.Lock()
+        self._stop_requested = threading.Event()
+        self._tapes: Dict[str, Deque[Dict[str, Any]]] = defaultdict(deque)
+        self._keys_written: set = set()
+        self._file = None
+        self.hits = 0
+        self.misses = 0
+
+        if mode == "replay":
+            header = self._load()
+            self.config = client.config if client is not None else SimpleNamespace(
+                model=header.get("model", ""),
+                temperature=header.get("temperature", 0.7)
+            )
+        else:
+            self.config = client.config
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = _open_cassette(self.path, "w")
+            self._write({
+                "cassette": CASSETTE_VERSION,
+                "model": getattr(self.config, "model", ""),
+                "temperature": getattr(self.config, "temperature", None),
+                "created": time.time()
+            })
+
+    def __getattr__(self, name: str):
+        # Only called for attributes not defined here (config, health_check, ...)
+        client = self.__dict__.get("client")
+        if client is None:
+            raise AttributeError(name)
+        return getattr(client, name)
+
+    def _request_key(self, messages: List[Any], temperature: Optional[float]) -> str:
+        effective = temperature if temperature is not None else getattr(self.config, "temperature", 0.0)
+        return ResponseCache.make_key(getattr(self.config, "model", ""), effective or 0.0, messages)
+
+    def send_message(self, messages: List[Any], temperature: Optional[float] = None, **kwargs) -> APIResponse:
+        """Record the wrapped client's response, or replay the recorded one."""
+        key = self._request_key(messages, temperature)
+
+        if self.mode == "replay":
+            if self._stop_requested.is_set():
+                return APIResponse(success=False, error_message="Request cancelled by user")
+            with self._lock:
+                tape = self._tapes.get(key)
+                entry = tape.popleft() if tape else None
+                if entry is None:
+                    self.misses += 1
+                else:
+                    self.hits += 1
+            if entry is None:
+                logger.warning(f"Cassette miss for request {key[:12]}")
+                return APIResponse(success=False, error_message=f"Cassette miss: no recorded response for {key[:12]}")
+            return APIResponse(
+                success=entry["success"],
+                content=entry.get("content", ""),
+                error_message=entry.get("error", ""),
+                cached=True  # Replayed, not a real call
+            )
+
+        start = time.perf_counter()
+        response = self.client.send_message(messages, temperature=temperature, **kwargs)
+        entry = {
+            "key": key,
+            "success": bool(response.success),
+            "content": response.content or "",
+            "latency_ms": round((time.perf_counter() - start) * 1000, 1)
+        }
+        if not response.success:
+            entry["error"] = response.error_message
+        with self._lock:
+            if self.include_requests and key not in self._keys_written:
+                entry["request"] = {"temperature": temperature, "messages": normalize_messages(messages)}
+            self._keys_written.add(key)
+            self._write(entry)
+        return response
+
+    def _write(self, record: Dict[str, Any]):
+        """Append one JSON line (lock held or single-threaded setup)."""
+        self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._file.flush()
+
+    def _load(self) -> Dict[str, Any]:
+        """Read a cassette into per-key tapes; returns the header record."""
+        header: Dict[str, Any] = {}
+        with _open_cassette(self.path, "r") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if "cassette" in record:
+                    header = record
+                    continue
+                self._tapes[record["key"]].append(record)
+        return header
+
+    def stats(self) -> Dict[str, Any]:
+        """Replay hit/miss counts (misses > 0 means the run diverged)."""
+        with self._lock:
+            return {
+                "mode": self.mode,
+                "hits": self.hits,
+                "misses": self.misses,
+                "remaining": sum(len(tape) for tape in self._tapes.values())
+            }
+
+    def request_stop(self):
+        self._stop_requested.set()
+        if self.client is not None:
+            self.client.request_stop()
+
+    def reset_stop(self):
+        self._stop_requested.clear()
+        if self.client is not None:
+            self.client.reset_stop()
+
+    def health_check(self):
+        if self.client is not None:
+            return self.client.health_check()
+        return f"OK: replaying cassette {self.path}"
+
+    def close(self):
+        """Flush and close the cassette file (record mode)."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
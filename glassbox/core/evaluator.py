@@ -9,11 +9,19 @@ Implements hybrid scoring approach:
 import json
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 from glassbox.core.api_client import BoeingAPIClient, Message
-from glassbox.prompts.templates import EVALUATOR_SYSTEM_PROMPT, EVALUATOR_USER_TEMPLATE
+from glassbox.prompts.templates import (
+    EVALUATOR_SYSTEM_PROMPT,
+    EVALUATOR_BATCH_SYSTEM_PROMPT,
+    EVALUATOR_BATCH_OUTPUT_FORMAT,
+    EVALUATOR_USER_TEMPLATE,
+    EVALUATOR_BATCH_USER_TEMPLATE,
+    EVALUATOR_BATCH_ITEM_TEMPLATE
+)
 
 logger = logging.getLogger(__name__)
 
@@ -40,11 +48,13 @@ class Evaluator:
         self, 
         api_client: BoeingAPIClient,
         custom_system_prompt: Optional[str] = None,
-        evaluation_temperature: float = 0.0  # Low temp for consistent scoring
+        evaluation_temperature: float = 0.0,  # Low temp for consistent scoring
+        max_parallel_inputs: int = 3  # Concurrent input pipelines in evaluate_tristate
     ):
         self.api_client = api_client
         self.system_prompt = custom_system_prompt or EVALUATOR_SYSTEM_PROMPT
         self.temperature = evaluation_temperature
+        self.max_parallel_inputs = max_parallel_inputs
 
     def evaluate(
         self,
@@ -90,6 +100,115 @@ class Evaluator:
 
         return self._parse_evaluation_response(api_response.content)
 
+    def evaluate_batch(
+        self,
+        prompt: Optional[str],
+        input_text: str,
+        responses: List[str],
+        candidate_prompts: Optional[List[str]] = None
+    ) -> List[EvaluationResult]:
+        """
+        Judge N responses to the same input in a single (listwise) request.
+        
+        The rubric and input are sent once instead of N times, under
+        batch_system_prompt (the same criteria, asking for a JSON array).
+        Each response is shown under the task prompt that produced it, the
+        same context evaluate() gives the judge. If the judge's reply cannot be parsed
+        into exactly N score objects, each response is re-judged with
+        evaluate().
+        
+        Args:
+            prompt: Task prompt for every response (when candidate_prompts is omitted)
+            input_text: The input every response was produced from
+            responses: The AI responses to evaluate
+            candidate_prompts: Prompt that produced each response (defaults to prompt)
+            
+        Returns:
+            One EvaluationResult per response, in the same order
+        """
+        if not responses:
+            return []
+
+        candidate_prompts = candidate_prompts or [prompt] * len(responses)
+        if len(responses) == 1:
+            return [self.evaluate(candidate_prompts[0], input_text, responses[0])]
+
+        items = "\n\n".join(
+            EVALUATOR_BATCH_ITEM_TEMPLATE.format(
+                index=i + 1,
+                candidate_prompt=candidate_prompt,
+                response=response
+            )
+            for i, (candidate_prompt, response) in enumerate(zip(candidate_prompts, responses))
+        )
+        user_message = EVALUATOR_BATCH_USER_TEMPLATE.format(
+            input_text=input_text,
+            count=len(responses),
+            responses=items
+        )
+
+        messages = [
+            Message(role="system", content=self.batch_system_prompt),
+            Message(role="user", content=user_message)
+        ]
+
+        api_response = self.api_client.send_message(
+            messages,
+            temperature=self.temperature
+        )
+
+        if api_response.success:
+            results = self._parse_batch_response(api_response.content, len(responses))
+            if results is not None:
+                return results
+            logger.warning("Batch evaluation unparseable - falling back to per-item judging")
+        else:
+            logger.error(f"Batch evaluation API call failed: {api_response.error_message}")
+
+        return [
+            self.evaluate(candidate_prompt, input_text, response)
+            for candidate_prompt, response in zip(candidate_prompts, responses)
+        ]
+
+    def _parse_batch_response(self, response_text: str, count: int) -> Optional[List[EvaluationResult]]:
+        """Parse a JSON array of score objects; None unless exactly `count` are found."""
+        try:
+            json_match = re.search(r'\[[\s\S]*\]', response_text)
+            if not json_match:
+                return None
+            data = json.loads(json_match.group())
+        except json.JSONDecodeError:
+            return None
+
+        if not isinstance(data, list) or len(data) != count:
+            return None
+        if not all(isinstance(item, dict) and "score" in item for item in data):
+            return None
+
+        # Honour explicit indices if the judge reordered its answers
+        indices = [item.get("index") for item in data]
+        if sorted(i for i in indices if isinstance(i, int)) == list(range(1, count + 1)):
+            data = sorted(data, key=lambda item: item["index"])
+
+        results = []
+        for item in data:
+            try:
+                score = max(0, min(100, float(item["score"])))
+            except (TypeError, ValueError):
+                return None
+            results.append(EvaluationResult(
+                score=score,
+                reasoning=item.get("reasoning", "No reasoning provided"),
+                breakdown=item.get("breakdown", {
+                    "accuracy": 0,
+                    "relevance": 0,
+                    "clarity": 0,
+                    "instruction_following": 0
+                }),
+                raw_response=response_text
+            ))
+        return results
+
     def _parse_evaluation_response(self, response_text: str) -> EvaluationResult:
         """Parse the JSON evaluation response from the LLM Judge."""
         try:
@@ -151,6 +270,10 @@ class Evaluator:
         """
         Evaluate a prompt against all three test bench inputs.
         
+        The three execute+judge pipelines run concurrently (up to
+        max_parallel_inputs at a time); a failure in one input does not
+        affect the others.
+        
         Args:
             prompt: The prompt to evaluate
             input_a: Golden Path input
@@ -161,33 +284,49 @@ class Evaluator:
         Returns:
             Tuple of (result_a, result_b, result_c)
         """
-        results = []
-        
-        for input_text in [input_a, input_b, input_c]:
+        def _evaluate_input(input_text: str) -> EvaluationResult:
             if not input_text.strip():
                 # Empty input - skip with neutral score
-                results.append(EvaluationResult(
+                return EvaluationResult(
                     score=50.0,
                     reasoning="Test input was empty - using neutral score",
                     breakdown={"accuracy": 12.5, "relevance": 12.5, "clarity": 12.5, "instruction_following": 12.5}
-                ))
-                continue
+                )
 
             # Execute the prompt with the input
             try:
                 response = executor_fn(prompt, input_text)
-                result = self.evaluate(prompt, input_text, response)
-                results.append(result)
+                return self.evaluate(prompt, input_text, response)
             except Exception as e:
                 logger.error(f"Execution failed: {e}")
-                results.append(EvaluationResult(
+                return EvaluationResult(
                     score=0.0,
                     reasoning=f"Execution failed: {str(e)}",
                     breakdown={"accuracy": 0, "relevance": 0, "clarity": 0, "instruction_following": 0}
-                ))
+                )
+
+        inputs = [input_a, input_b, input_c]
+        workers = max(1, min(self.max_parallel_inputs, len(inputs)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_evaluate_input, inputs))
 
         return tuple(results)
 
+    @property
+    def batch_system_prompt(self) -> str:
+        """
+        System prompt for evaluate_batch: system_prompt with its
+        single-object output format swapped for the array format, so the
+        two prompts never ask for conflicting shapes. A fully custom system
+        prompt keeps its text and gets the array format appended.
+        """
+        if self.system_prompt.startswith(EVALUATOR_SYSTEM_PROMPT):
+            return EVALUATOR_BATCH_SYSTEM_PROMPT + self.system_prompt[len(EVALUATOR_SYSTEM_PROMPT):]
+        return f"""{self.system_prompt}
+
+When several responses are given, score each one and reply with this instead:
+{EVALUATOR_BATCH_OUTPUT_FORMAT}"""
+
     def set_custom_rubric(self, rubric: str):
         """
         Allow users to customize the evaluation criteria.
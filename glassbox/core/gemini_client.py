@@ -14,6 +14,9 @@ import threading
 from dotenv import load_dotenv
 load_dotenv()
 
+from glassbox.core.response_cache import ResponseCache
+from glassbox.core.retry import RequestCancelled, run_interruptible
+
 logger = logging.getLogger(__name__)
 
 # Try to import Google GenAI SDK
@@ -33,6 +36,12 @@ class GeminiConfig:
     model: str = "gemini-2.0-flash"
     temperature: float = 0.7
     max_tokens: int = 4096
+    max_concurrency: int = 16  # In-flight request cap for the async client
+    # Persistent response cache (disabled unless a path is set)
+    cache_path: Optional[str] = field(default_factory=lambda: os.getenv("GLASSBOX_CACHE_PATH") or None)
+    cache_ttl_seconds: int = 7 * 24 * 3600
+    cache_max_bytes: int = 256 * 1024 * 1024
+    cache_all_temperatures: bool = False  # Default: only temperature 0.0 (judge) calls
 
 
 @dataclass
@@ -42,6 +51,7 @@ class GeminiResponse:
     content: str = ""
     error_message: str = ""
     raw_response: Any = None
+    cached: bool = False  # Served from the response cache, not the network
 
 
 class GeminiAPIClient:
@@ -55,6 +65,16 @@ class GeminiAPIClient:
         self.config = config or GeminiConfig()
         self._client = None
         self._stop_event = threading.Event()
+
+        # Content-addressed response cache for deterministic calls
+        self.response_cache: Optional[ResponseCache] = None
+        if self.config.cache_path:
+            self.response_cache = ResponseCache(
+                self.config.cache_path,
+                ttl_seconds=self.config.cache_ttl_seconds,
+                max_bytes=self.config.cache_max_bytes,
+                cache_all_temperatures=self.config.cache_all_temperatures
+            )
         
         if not GENAI_AVAILABLE:
             logger.error("google-genai SDK not available")
@@ -99,25 +119,36 @@ class GeminiAPIClient:
                 error_message="Request cancelled"
             )
 
+        effective_temperature = temperature if temperature is not None else self.config.temperature
+        cache_key = self._cache_key(messages, effective_temperature)
+        cached = self._cached_response(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             # Convert messages to Gemini format
             gemini_contents = self._convert_messages(messages)
             
             # Build generation config
             gen_config = types.GenerateContentConfig(
-                temperature=temperature or self.config.temperature,
+                temperature=effective_temperature,
                 max_output_tokens=max_tokens or self.config.max_tokens,
             )
 
-            # Make API call
-            response = self._client.models.generate_content(
-                model=self.config.model,
-                contents=gemini_contents,
-                config=gen_config
+            # Make API call (abandoned immediately if stop is requested)
+            response = run_interruptible(
+                lambda: self._client.models.generate_content(
+                    model=self.config.model,
+                    contents=gemini_contents,
+                    config=gen_config
+                ),
+                self._stop_event
             )
 
             # Extract text from response
             if response.text:
+                if cache_key is not None:
+                    self.response_cache.put(cache_key, response.text)
                 return GeminiResponse(
                     success=True,
                     content=response.text,
@@ -130,6 +161,11 @@ class GeminiAPIClient:
                     raw_response=response
                 )
 
+        except RequestCancelled:
+            return GeminiResponse(
+                success=False,
+                error_message="Request cancelled"
+            )
         except Exception as e:
             logger.error(f"Gemini API error: {e}")
             return GeminiResponse(
@@ -137,6 +173,21 @@ class GeminiAPIClient:
                 error_message=str(e)
             )
 
+    def _cache_key(self, messages: List[Any], temperature: float) -> Optional[str]:
+        """Cache key for this request, or None if it should not be cached."""
+        if self.response_cache is None or not self.response_cache.is_cacheable(temperature):
+            return None
+        return ResponseCache.make_key(self.config.model, temperature, messages)
+
+    def _cached_response(self, cache_key: Optional[str]) -> Optional[GeminiResponse]:
+        """Serve a request from the response cache if present."""
+        if cache_key is None:
+            return None
+        cached = self.response_cache.get(cache_key)
+        if cached is None:
+            return None
+        return GeminiResponse(success=True, content=cached["content"], cached=True)
+
     def _convert_messages(self, messages: List[Any]) -> List[types.Content]:
         """Convert Boeing-style messages to Gemini format."""
         contents = []
@@ -214,15 +265,31 @@ def get_api_client(use_gemini: bool = None):
         use_gemini: Force Gemini (True) or Boeing (False). 
                     If None, auto-detect based on environment.
     
+    Set GLASSBOX_CASSETTE to a cassette path to record all traffic
+    (GLASSBOX_CASSETTE_MODE=record, the default) or to replay a recorded
+    run offline (GLASSBOX_CASSETTE_MODE=replay).
+    
     Returns:
-        Either GeminiAPIClient or BoeingAPIClient
+        Either GeminiAPIClient or BoeingAPIClient (wrapped in a
+        CassetteClient when GLASSBOX_CASSETTE is set)
     """
+    cassette_path = os.getenv("GLASSBOX_CASSETTE")
+    cassette_mode = os.getenv("GLASSBOX_CASSETTE_MODE", "record")
+    if cassette_path and cassette_mode == "replay":
+        from glassbox.core.cassette import CassetteClient
+        return CassetteClient(cassette_path, mode="replay")
+
     if use_gemini is None:
         # Auto-detect: use Gemini if GEMINI_API_KEY is set, else try Boeing
         use_gemini = bool(os.getenv("GEMINI_API_KEY"))
     
     if use_gemini:
-        return GeminiAPIClient()
+        client = GeminiAPIClient()
     else:
         from glassbox.core.api_client import BoeingAPIClient
-        return BoeingAPIClient()
+        client = BoeingAPIClient()
+
+    if cassette_path:
+        from glassbox.core.cassette import CassetteClient
+        return CassetteClient(cassette_path, mode=cassette_mode, client=client)
+    return client
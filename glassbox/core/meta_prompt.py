@@ -0,0 +1,120 @@
+"""
+Meta-Prompt Builder - token-budgeted trajectory history for OPro.
+
+Instead of the five most recent prompts cut to 50 characters, the history
+shown to the optimizer LLM is chosen by score and diversity (maximal
+marginal relevance over word overlap) and packed at full length until a
+token budget is spent. The input cost of a generation call therefore stays
+bounded however long the trajectory grows, and the optimizer sees the best
+and most distinct prompts rather than near-duplicates of the latest one.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List
+
+from glassbox.core.telemetry import estimate_tokens, CHARS_PER_TOKEN
+from glassbox.models.memo import canonicalize_prompt
+from glassbox.models.session import TrajectoryEntry
+
+MIN_TRUNCATED_TOKENS = 32  # Don't squeeze in a prompt with less room than this
+_WORD = re.compile(r"\w+")
+
+
+@dataclass
+class MetaPromptHistory:
+    """Trajectory text chosen for one generation call."""
+    text: str
+    tokens: int
+    entries: List[TrajectoryEntry] = field(default_factory=list)  # In display order (ascending score)
+    available: int = 0  # Distinct prompts considered
+    truncated: int = 0  # Entries shortened to fit the budget
+
+
+def _words(prompt: str) -> FrozenSet[str]:
+    return frozenset(_WORD.findall(prompt.lower()))
+
+
+def _similarity(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """Jaccard similarity of two word sets."""
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def format_entry(score: float, prompt: str) -> str:
+    """One history block as shown to the optimizer."""
+    return f"[Score: {score:.1f}]\n{prompt}"
+
+
+class MetaPromptBuilder:
+    """
+    Selects and formats trajectory entries within a token budget.
+
+    Usage:
+        builder = MetaPromptBuilder(token_budget=1200)
+        history = builder.build(session.trajectory)
+        history.text, history.tokens
+    """
+
+    def __init__(self, token_budget: int = 1200, max_entries: int = 20, diversity: float = 0.3):
+        self.token_budget = token_budget
+        self.max_entries = max_entries
+        self.diversity = diversity  # 0 = pure score ranking, 1 = pure novelty
+
+    def build(self, entries: List[TrajectoryEntry]) -> MetaPromptHistory:
+        # Best score per distinct prompt
+        unique: Dict[str, TrajectoryEntry] = {}
+        for entry in entries:
+            key = canonicalize_prompt(entry.prompt)
+            if key and (key not in unique or entry.score > unique[key].score):
+                unique[key] = entry
+
+        remaining = sorted(unique.values(), key=lambda e: e.score, reverse=True)
+        words = {id(e): _words(e.prompt) for e in remaining}
+        max_similarity = {id(e): 0.0 for e in remaining}
+
+        selected: List[TrajectoryEntry] = []
+        blocks: Dict[int, str] = {}
+        used = 0
+        truncated = 0
+        separator = estimate_tokens("\n\n")
+
+        while remaining and len(selected) < self.max_entries:
+            # Maximal marginal relevance: high score, low overlap with picks so far
+            pick = max(
+                remaining,
+                key=lambda e: (1 - self.diversity) * e.score / 100.0
+                + self.diversity * (1.0 - max_similarity[id(e)])
+            )
+            remaining.remove(pick)
+
+            block = format_entry(pick.score, pick.prompt)
+            cost = estimate_tokens(block) + (separator if selected else 0)
+            if used + cost > self.token_budget:
+                room = self.token_budget - used - separator - estimate_tokens(format_entry(pick.score, ""))
+                if room < MIN_TRUNCATED_TOKENS:
+                    continue  # A shorter prompt may still fit
+                block = format_entry(pick.score, pick.prompt[:room * CHARS_PER_TOKEN].rstrip() + "...")
+                cost = estimate_tokens(block) + (separator if selected else 0)
+                truncated += 1
+
+            selected.append(pick)
+            blocks[id(pick)] = block
+            used += cost
+            for other in remaining:
+                max_similarity[id(other)] = max(
+                    max_similarity[id(other)],
+                    _similarity(words[id(other)], words[id(pick)])
+                )
+
+        # Ascending score, so the strongest prompts sit next to the instructions
+        selected.sort(key=lambda e: e.score)
+        text = "\n\n".join(blocks[id(e)] for e in selected)
+        return MetaPromptHistory(
+            text=text,
+            tokens=estimate_tokens(text),
+            entries=selected,
+            available=len(unique),
+            truncated=truncated
+        )
@@ -7,14 +7,20 @@ prompt variations based on scored history (trajectory).
 
 import logging
 import re
-from typing import List, Dict, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Tuple
 
 from glassbox.core.optimizer_base import AbstractOptimizer, StepResult
 from glassbox.core.api_client import BoeingAPIClient, Message
 from glassbox.core.evaluator import Evaluator
+from glassbox.core.meta_prompt import MetaPromptBuilder, MetaPromptHistory
+from glassbox.core.telemetry import count_message_tokens, estimate_tokens
 from glassbox.models.session import (
     OptimizerSession, 
-    SchematicState
+    SchematicState,
+    TrajectoryEntry
 )
 from glassbox.models.candidate import UnifiedCandidate
 from glassbox.prompts.templates import (
@@ -25,6 +31,18 @@ from glassbox.prompts.templates import (
 
 logger = logging.getLogger(__name__)
 
+ISLAND_TEMPERATURE_SPREAD = 0.4  # Default island temperatures span temperature +/- half of this
+
+
+@dataclass
+class OProIsland:
+    """One independent OPro chain in island mode."""
+    index: int
+    temperature: float
+    trajectory: List[TrajectoryEntry] = field(default_factory=list)
+    best: Optional[UnifiedCandidate] = None
+    migrated_score: float = -1.0  # Score of the last best migrated to the shared trajectory
+
 
 class OProEngine(AbstractOptimizer):
     """
@@ -42,8 +60,37 @@ class OProEngine(AbstractOptimizer):
     - Nodes: [Seed Prompt] → [Executor] → [Scorer] → [Optimizer Agent] → (back)
     - Yellow edge: Data flow (Scorer → Optimizer)
     - Blue edge: Instruction flow (Optimizer → Seed)
+    
+    Pipelined mode (SessionConfig.pipelined_generation): once
+    pipeline_trigger candidates of step n are scored, step n+1's generation
+    starts speculatively on a trajectory that includes the best of them, so
+    generation latency overlaps the rest of step n's evaluation. If step n
+    finishes with a different trajectory than the one speculated on, the
+    step's candidates are marked meta["pipeline"]["stale_trajectory"].
+    Nothing is speculated on the last step of run(), on a step that meets
+    stop_score_threshold or when the budget cannot cover it. Racing steps
+    do not pipeline.
+    
+    Island mode (SessionConfig.opro_islands = K > 1): K chains run
+    concurrently, each with its own trajectory and temperature. Every
+    migration_interval steps each chain's best (if improved) is appended to
+    session.trajectory, the shared view every chain's meta-prompt includes.
+    Each step the remaining run budget is split between the chains before
+    they start. Chains evaluate with racing and batch judging like the
+    single chain, but island mode does not pipeline generation.
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._speculation_lock = threading.Lock()
+        self._speculation: Optional[Dict[str, Any]] = None  # Pending generation for the next step
+        self._speculation_executor: Optional[ThreadPoolExecutor] = None
+        self._step_scored: List[UnifiedCandidate] = []
+        self.pipeline_stats = {"speculative_steps": 0, "stale_steps": 0}
+        self._last_step: Optional[int] = None  # Final step of the current run() (None outside run)
+        self.islands: List[OProIsland] = []
+        self.generation_log: List[Dict[str, Any]] = []  # Token report per generation call
+
     @property
     def engine_name(self) -> str:
         return "OPro (Iterative)"
@@ -62,13 +109,29 @@ class OProEngine(AbstractOptimizer):
         """
         self.session.current_step += 1
         step_num = self.session.current_step
+        with self._speculation_lock:
+            self._step_scored = []
         
+        # Budget check: one generation call plus at least one candidate
+        shortfall = self._budget_shortfall(1 + self._calls_per_candidate())
+        if shortfall:
+            return self._budget_stop_result(step_num, shortfall)
+
+        if self.session.config.opro_islands > 1:
+            return self._island_step(step_num)
+
         # Phase 1: Generate variations
         self.session.schematic_state = SchematicState.MUTATION
         self.session.active_node = "optimizer"
         self._update_monologue("Generating variations...", "mutation")
         
-        variations = self._generate_variations()
+        pipeline_meta = None
+        speculation = self._collect_speculation()
+        if speculation is not None:
+            variations, pipeline_meta = speculation
+        else:
+            with self.telemetry.phase("generation"):
+                variations = self._generate_variations()
         
         if not variations:
             return StepResult(
@@ -82,22 +145,40 @@ class OProEngine(AbstractOptimizer):
                 error_message="No variations generated"
             )
 
+        variations = self._trim_to_budget(variations, self._calls_per_candidate())
+        if not variations:
+            return self._budget_stop_result(step_num, self._budget_shortfall(self._calls_per_candidate()))
+
         # Phase 2: Evaluate each variation
         self.session.schematic_state = SchematicState.EVALUATION
         self.session.active_node = "scorer"
         self._update_monologue(f"Evaluating {len(variations)} candidates...", "evaluation")
         
-        step_candidates = []
-        for i, (prompt_text, reasoning) in enumerate(variations):
-            if self._stop_requested.is_set():
-                break
-                
+        def _evaluate_variation(indexed_variation):
+            i, (prompt_text, reasoning) = indexed_variation
             logger.info(f"Evaluating candidate {i+1}/{len(variations)}")
             
             candidate = self._evaluate_candidate(prompt_text, step_num)
             candidate.meta["generation_reasoning"] = reasoning  # Store generation reasoning
-            step_candidates.append(candidate)
-            self.session.candidates.append(candidate)
+            if pipeline_meta is not None:
+                candidate.meta["pipeline"] = pipeline_meta
+            self._record_candidate(candidate)
+            self._maybe_speculate(candidate, len(variations))
+            return candidate
+
+        # Listwise judging: one judge call per input for the whole step
+        # (racing judges each round's survivors itself)
+        if self.session.config.batch_judging and self.session.config.evaluation_strategy != "racing":
+            self._batch_judge([prompt_text for prompt_text, _ in variations])
+
+        if self.session.config.evaluation_strategy == "racing":
+            step_candidates = self._race_variations(variations, step_num)
+            if pipeline_meta is not None:
+                for candidate in step_candidates:
+                    candidate.meta["pipeline"] = pipeline_meta
+        else:
+            # Candidates run concurrently; results keep generation order
+            step_candidates = self.scheduler.map(_evaluate_variation, list(enumerate(variations)))
 
         # Phase 3: Select best (greedy)
         best = max(step_candidates, key=lambda c: c.score_aggregate) if step_candidates else None
@@ -109,8 +190,56 @@ class OProEngine(AbstractOptimizer):
         # Update visualization state
         self.session.schematic_state = SchematicState.IDLE
         self.session.active_node = ""
+        summary = f"Step {step_num} complete. Best: {best.score_aggregate:.1f}%" if best else "No candidates"
+        if pipeline_meta is not None:
+            summary += " (speculative generation" + (
+                " on a stale trajectory)" if pipeline_meta["stale_trajectory"] else ")"
+            )
+        self._update_monologue(summary, "complete")
+
+        return StepResult(
+            candidates=step_candidates,
+            best_candidate=best,
+            step_number=step_num,
+            schematic_state=SchematicState.IDLE,
+            active_node="",
+            internal_monologue=self.session.internal_monologue,
+            should_stop=False
+        )
+
+    def _island_step(self, step_num: int) -> StepResult:
+        """One step of every island chain, run concurrently, then migration."""
+        islands = self._get_islands()
+
+        self.session.schematic_state = SchematicState.MUTATION
+        self.session.active_node = "optimizer"
+        self._update_monologue(f"Running {len(islands)} island chains...", "mutation")
+
+        # Split the remaining budget between the chains before any of them
+        # starts: concurrent chains cannot each trim against the same budget
+        allowances = self._island_allowances(len(islands))
+        running = [(island, allowance) for island, allowance in zip(islands, allowances) if allowance]
+        per_island = self._island_pool_map(
+            lambda pair: self._run_island(pair[0], step_num, pair[1]), running
+        )
+        step_candidates = [c for candidates in per_island for c in candidates]
+
+        migrated = 0
+        if step_num % max(1, self.session.config.migration_interval) == 0:
+            migrated = self._migrate_islands(islands)
+
+        best = max(step_candidates, key=lambda c: c.score_aggregate) if step_candidates else None
+        if best:
+            self.session.winner = self.session.get_best_candidate()
+
+        self.session.schematic_state = SchematicState.IDLE
+        self.session.active_node = ""
+        island_bests = ", ".join(
+            f"#{i.index} (T={i.temperature:.2f}): {i.best.score_aggregate:.1f}" if i.best else f"#{i.index}: —"
+            for i in islands
+        )
         self._update_monologue(
-            f"Step {step_num} complete. Best: {best.score_aggregate:.1f}%" if best else "No candidates",
+            f"Step {step_num} islands {island_bests}" + (f"; migrated {migrated}" if migrated else ""),
             "complete"
         )
 
@@ -121,25 +250,284 @@ class OProEngine(AbstractOptimizer):
             schematic_state=SchematicState.IDLE,
             active_node="",
             internal_monologue=self.session.internal_monologue,
-            should_stop=False
+            should_stop=False,
+            error_message="" if step_candidates or self._stop_requested.is_set() else "No variations generated"
         )
 
-    def _generate_variations(self) -> List[tuple]:
+    def _get_islands(self) -> List[OProIsland]:
+        """Create the island chains on first use."""
+        if not self.islands:
+            config = self.session.config
+            count = config.opro_islands
+            if config.island_temperatures:
+                temperatures = [config.island_temperatures[i % len(config.island_temperatures)] for i in range(count)]
+            else:
+                temperatures = [
+                    config.temperature + ISLAND_TEMPERATURE_SPREAD * (i / (count - 1) - 0.5)
+                    for i in range(count)
+                ]
+            self.islands = [
+                OProIsland(index=i, temperature=round(min(2.0, max(0.0, t)), 2))
+                for i, t in enumerate(temperatures)
+            ]
+            if config.pipelined_generation:
+                logger.warning("pipelined_generation is ignored with opro_islands > 1")
+        return self.islands
+
+    def _island_allowances(self, count: int) -> List[int]:
+        """
+        Candidates each of `count` chains may evaluate this step (0 = the
+        chain sits the step out). Every running chain is charged one
+        generation call up front; the rest of the affordable calls are
+        shared out evenly in candidates.
+        """
+        per_candidate = self._calls_per_candidate()
+        wanted = count * (1 + per_candidate * max(1, self.session.config.generations_per_step))
+        calls = self.budget.affordable(wanted, 1)
+        running = min(count, calls // (1 + per_candidate))
+        if not running:
+            return [0] * count
+        share, extra = divmod((calls - running) // per_candidate, running)
+        return [share + (1 if i < extra else 0) for i in range(running)] + [0] * (count - running)
+
+    def _island_pool_map(self, fn, items: List[Any]) -> List[Any]:
+        """Run one callable per island on its own thread (chains are latency-bound)."""
+        if not items:
+            return []
+        with ThreadPoolExecutor(max_workers=len(items), thread_name_prefix="glassbox-island") as pool:
+            return list(pool.map(fn, items))
+
+    def _island_context(self, island: OProIsland) -> Tuple[MetaPromptHistory, float]:
+        """Island's own trajectory merged with the shared (migrated) trajectory."""
+        own = {entry.prompt for entry in island.trajectory}
+        entries = sorted(
+            island.trajectory + [e for e in self.session.trajectory if e.prompt not in own],
+            key=lambda e: e.step
+        )
+        best_score = max((e.score for e in entries), default=0.0)
+        return self._trajectory_history(entries), best_score
+
+    def _run_island(self, island: OProIsland, step_num: int, allowance: int) -> List[UnifiedCandidate]:
+        """Generate and evaluate one step of an island chain (at most `allowance` candidates)."""
+        if self._stop_requested.is_set():
+            return []
+        config = self.session.config
+        island_meta = {"index": island.index, "temperature": island.temperature}
+        try:
+            history, best_score = self._island_context(island)
+            with self.telemetry.phase("generation"):
+                variations = self._generate_variations(history, best_score, island.temperature)
+            if len(variations) > allowance:
+                logger.info(f"Budget: island {island.index} evaluating {allowance} of {len(variations)} candidates")
+                variations = variations[:allowance]
+
+            if config.evaluation_strategy == "racing":
+                candidates = self._race_variations(variations, step_num)
+                for candidate in candidates:
+                    candidate.meta["island"] = island_meta
+            else:
+                if config.batch_judging:
+                    self._batch_judge([prompt_text for prompt_text, _ in variations])
+
+                def _evaluate(variation: tuple) -> UnifiedCandidate:
+                    prompt_text, reasoning = variation
+                    candidate = self._evaluate_candidate(prompt_text, step_num)
+                    candidate.meta["generation_reasoning"] = reasoning
+                    candidate.meta["island"] = island_meta
+                    self._record_candidate(candidate)
+                    return candidate
+
+                candidates = self.scheduler.map(_evaluate, variations)
+        except Exception as e:
+            logger.error(f"Island {island.index} step failed: {e}")
+            return []
+
+        if candidates:
+            best = max(candidates, key=lambda c: c.score_aggregate)
+            island.trajectory.append(TrajectoryEntry(
+                step=step_num,
+                score=best.score_aggregate,
+                prompt=best.display_text
+            ))
+            if island.best is None or best.score_aggregate > island.best.score_aggregate:
+                island.best = best
+        return candidates
+
+    def _migrate_islands(self, islands: List[OProIsland]) -> int:
+        """Append each island's improved best to the shared session.trajectory."""
+        migrated = 0
+        for island in islands:
+            if island.best is not None and island.best.score_aggregate > island.migrated_score:
+                self._add_trajectory_entry(island.best)
+                island.migrated_score = island.best.score_aggregate
+                migrated += 1
+        return migrated
+
+    def run(self, max_steps: int = 100) -> List[StepResult]:
+        self._last_step = self.session.current_step + max_steps
+        try:
+            return super().run(max_steps)
+        finally:
+            self._last_step = None
+            self._discard_speculation()
+
+    def _trajectory_history(self, entries: List[TrajectoryEntry]) -> MetaPromptHistory:
+        """
+        History block for the optimizer meta-prompt.
+        
+        With a meta_prompt_token_budget, the top-scoring and most diverse
+        prompts are packed at full length (see core/meta_prompt.py);
+        with a budget of 0, the last five prompts truncated to 50 characters.
+        """
+        config = self.session.config
+        if config.meta_prompt_token_budget > 0:
+            history = MetaPromptBuilder(
+                token_budget=config.meta_prompt_token_budget,
+                max_entries=config.meta_prompt_max_entries,
+                diversity=config.meta_prompt_diversity
+            ).build(entries)
+        else:
+            text = self.session.get_trajectory_summary(max_entries=5, entries=entries)
+            history = MetaPromptHistory(
+                text=text,
+                tokens=estimate_tokens(text),
+                entries=entries[-5:],
+                available=len(entries)
+            )
+        if not history.text:
+            history.text = f"[Initial seed: {self.session.seed_prompt[:100]}... | Score: N/A]"
+            history.tokens = estimate_tokens(history.text)
+        return history
+
+    def _generation_context(self, provisional: Optional[UnifiedCandidate] = None) -> Tuple[MetaPromptHistory, float]:
+        """
+        Trajectory history and best score the optimizer LLM is shown.
+        
+        `provisional` is appended as if it had already won the current step
+        (used for speculative generation).
+        """
+        entries = list(self.session.trajectory)
+        if provisional is not None:
+            entries.append(TrajectoryEntry(
+                step=self.session.current_step,
+                score=provisional.score_aggregate,
+                prompt=provisional.display_text
+            ))
+        best_score = self._get_best_score() if entries else 0.0
+        return self._trajectory_history(entries), best_score
+
+    def _maybe_speculate(self, candidate: UnifiedCandidate, step_size: int):
+        """Start the next step's generation once enough of this step is scored."""
+        if not self.session.config.pipelined_generation:
+            return
+        with self._speculation_lock:
+            self._step_scored.append(candidate)
+            trigger = max(1, min(self.session.config.pipeline_trigger, step_size))
+            if self._speculation is not None or len(self._step_scored) < trigger:
+                return
+            # No next step to use it: the run ends after this one, the
+            # step is about to meet the stop threshold, or the budget cannot
+            # cover the rest of this step plus the next one's minimum
+            provisional = max(self._step_scored, key=lambda c: c.score_aggregate)
+            if self._last_step is not None and self.session.current_step >= self._last_step:
+                return
+            if provisional.score_aggregate >= self.session.config.stop_score_threshold:
+                return
+            per_candidate = self._calls_per_candidate()
+            unscored = max(0, step_size - len(self._step_scored))
+            if self._stop_requested.is_set() or self._budget_shortfall(1 + per_candidate * (unscored + 1)):
+                return
+
+            history, best_score = self._generation_context(provisional)
+            if self._speculation_executor is None:
+                self._speculation_executor = ThreadPoolExecutor(
+                    max_workers=1,
+                    thread_name_prefix="glassbox-speculate"
+                )
+            self._speculation = {
+                "future": self._speculation_executor.submit(
+                    self._speculative_generate, history, best_score, self.session.current_step + 1
+                ),
+                "trajectory_text": history.text,
+                "best_score": best_score,
+                "launched_after": len(self._step_scored),
+                "step_size": step_size
+            }
+        logger.info(f"Speculative generation started after {len(self._step_scored)}/{step_size} candidates")
+
+    def _speculative_generate(self, history: MetaPromptHistory, best_score: float, step: int) -> List[tuple]:
+        with self.telemetry.phase("generation"):
+            return self._generate_variations(history, best_score, step=step)
+
+    def _collect_speculation(self) -> Optional[Tuple[List[tuple], Dict[str, Any]]]:
+        """
+        Variations from the speculative generation started during the
+        previous step, plus pipeline meta recording whether the trajectory
+        it saw was stale. None if there was no (usable) speculation.
+        """
+        with self._speculation_lock:
+            pending, self._speculation = self._speculation, None
+        if pending is None:
+            return None
+
+        try:
+            variations = pending["future"].result()
+        except Exception as e:
+            logger.error(f"Speculative generation failed: {e}")
+            return None
+        if not variations:
+            return None
+
+        history, best_score = self._generation_context()
+        stale = history.text != pending["trajectory_text"] or best_score != pending["best_score"]
+        self.pipeline_stats["speculative_steps"] += 1
+        if stale:
+            self.pipeline_stats["stale_steps"] += 1
+        return variations, {
+            "speculative": True,
+            "stale_trajectory": stale,
+            "launched_after": pending["launched_after"],
+            "previous_step_size": pending["step_size"],
+            "speculated_best": round(pending["best_score"], 2),
+            "final_best": round(best_score, 2)
+        }
+
+    def _discard_speculation(self):
+        """Drop any speculative generation still pending when the run ends."""
+        with self._speculation_lock:
+            self._speculation = None
+            executor, self._speculation_executor = self._speculation_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _generate_variations(
+        self,
+        history: Optional[MetaPromptHistory] = None,
+        best_score: Optional[float] = None,
+        temperature: Optional[float] = None,
+        step: Optional[int] = None
+    ) -> List[tuple]:
         """
         Use optimizer LLM to generate prompt variations.
         
+        Each call's token cost is appended to generation_log.
+        
+        Args:
+            history: Trajectory history shown to the optimizer (defaults to the session's)
+            best_score: Best score shown to the optimizer
+            temperature: Optimizer temperature (defaults to SessionConfig.temperature)
+            step: Step that will use the variations, for generation_log
+                (defaults to the current step; speculation passes the next)
+        
         Returns list of (prompt_text, reasoning) tuples.
         """
-        trajectory_text = self.session.get_trajectory_summary(max_entries=5)
-        if not trajectory_text:
-            trajectory_text = f"[Initial seed: {self.session.seed_prompt[:100]}... | Score: N/A]"
-        
-        best_score = self._get_best_score() if self.session.trajectory else 0.0
+        if history is None or best_score is None:
+            history, best_score = self._generation_context()
         num_variations = self.session.config.generations_per_step
 
         user_prompt = OPRO_OPTIMIZER_USER_TEMPLATE.format(
             task_description=self.session.seed_prompt,
-            trajectory=trajectory_text,
+            trajectory=history.text,
             best_score=f"{best_score:.1f}",
             num_variations=num_variations
         )
@@ -149,9 +537,24 @@ class OProEngine(AbstractOptimizer):
             Message(role="user", content=user_prompt)
         ]
 
+        input_tokens = count_message_tokens(messages)
+        self.generation_log.append({
+            "step": step if step is not None else self.session.current_step,
+            "speculative": step is not None,
+            "input_tokens": input_tokens,
+            "history_tokens": history.tokens,
+            "history_entries": len(history.entries),
+            "history_available": history.available,
+            "history_truncated": history.truncated
+        })
+        logger.info(
+            f"Generation call: {input_tokens} input tokens "
+            f"({len(history.entries)}/{history.available} history prompts, {history.tokens} tokens)"
+        )
+
         response = self.api_client.send_message(
             messages,
-            temperature=self.session.config.temperature
+            temperature=self.session.config.temperature if temperature is None else temperature
         )
 
         if not response.success:
@@ -202,44 +605,44 @@ class OProEngine(AbstractOptimizer):
 
         return variations[:self.session.config.generations_per_step]
 
-    def _evaluate_candidate(self, prompt_text: str, generation: int) -> UnifiedCandidate:
-        """Evaluate a single candidate against the tri-state test bench."""
-        # Execute and evaluate against each test input
-        test_inputs = [
-            (self.session.test_bench.input_a, "a"),
-            (self.session.test_bench.input_b, "b"),
-            (self.session.test_bench.input_c, "c"),
-        ]
+    def _race_variations(self, variations: List[tuple], step_num: int) -> List[UnifiedCandidate]:
+        """Evaluate variations input by input, pruning those that cannot win."""
+        raced = self._race_test_inputs([prompt_text for prompt_text, _ in variations])
 
-        scores = {}
-        responses = {}
-        reasoning = {}
-        
-        for input_text, label in test_inputs:
-            key = f"input_{label}"
-            
-            if not input_text.strip():
-                scores[key] = 50.0  # Neutral
-                responses[key] = ""
-                reasoning[key] = "Test input empty"
-                continue
+        step_candidates = []
+        for (prompt_text, reasoning), outcome in zip(variations, raced):
+            if outcome is None:
+                continue  # Interrupted by stop
+            scores, responses, why, racing = outcome
+            candidate = self._build_candidate(prompt_text, step_num, scores, responses, why)
+            candidate.meta["generation_reasoning"] = reasoning
+            candidate.meta["racing"] = racing
+            self._record_candidate(candidate)
+            step_candidates.append(candidate)
 
-            try:
-                # Execute the prompt
-                response = self._execute_prompt(prompt_text, input_text)
-                responses[key] = response
-                
-                # Evaluate the response
-                eval_result = self.evaluator.evaluate(prompt_text, input_text, response)
-                scores[key] = eval_result.score
-                reasoning[key] = eval_result.reasoning
-                
-            except Exception as e:
-                logger.error(f"Evaluation failed for {label}: {e}")
-                scores[key] = 0.0
-                responses[key] = ""
-                reasoning[key] = f"Error: {str(e)}"
+        pruned = sum(1 for c in step_candidates if c.meta["racing"]["pruned"])
+        if pruned:
+            self._update_monologue(
+                f"Racing pruned {pruned}/{len(step_candidates)} candidates on partial scores",
+                "evaluation"
+            )
+        return step_candidates
 
+    def _evaluate_candidate(self, prompt_text: str, generation: int) -> UnifiedCandidate:
+        """Evaluate a single candidate against the tri-state test bench."""
+        # Execute and evaluate against each test input (A/B/C concurrently)
+        scores, responses, reasoning = self._evaluate_test_inputs(prompt_text)
+        return self._build_candidate(prompt_text, generation, scores, responses, reasoning)
+
+    def _build_candidate(
+        self,
+        prompt_text: str,
+        generation: int,
+        scores: Dict[str, float],
+        responses: Dict[str, str],
+        reasoning: Dict[str, str]
+    ) -> UnifiedCandidate:
+        """Wrap per-input results in a UnifiedCandidate."""
         # Calculate aggregate (mean of active inputs)
         valid_scores = [v for v in scores.values()]
         aggregate = sum(valid_scores) / len(valid_scores) if valid_scores else 0.0
@@ -6,21 +6,28 @@ to ensure consistent behavior and visualization support.
 """
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Optional, Callable, Dict, Any
+from typing import List, Optional, Callable, Dict, Any, Tuple
 from enum import Enum
 import threading
 import logging
 from queue import Queue
 
+from glassbox.core.allocator import BestArmAllocator
 from glassbox.core.api_client import BoeingAPIClient
+from glassbox.core.budget import BudgetTracker
 from glassbox.core.evaluator import Evaluator
+from glassbox.core.scheduler import EvaluationScheduler
+from glassbox.core.telemetry import TelemetryRecorder, InstrumentedClient
 from glassbox.models.session import (
     OptimizerSession, 
     TrajectoryEntry,
     SchematicState
 )
 from glassbox.models.candidate import UnifiedCandidate
+from glassbox.models.memo import canonicalize_prompt
+from glassbox.models.telemetry import StepTelemetry
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +53,7 @@ class StepResult:
     internal_monologue: str
     should_stop: bool = False
     error_message: str = ""
+    telemetry: Optional[StepTelemetry] = None  # Filled in by run()
 
 
 class AbstractOptimizer(ABC):
@@ -62,16 +70,38 @@ class AbstractOptimizer(ABC):
         evaluator: Evaluator,
         session: OptimizerSession
     ):
-        self.api_client = api_client
+        # Every LLM call is attributed to a phase and timed (see core/telemetry.py)
+        self.telemetry = TelemetryRecorder()
+        raw_client = api_client.client if isinstance(api_client, InstrumentedClient) else api_client
+        self.api_client = InstrumentedClient(raw_client, self.telemetry)
         self.evaluator = evaluator
         self.session = session
         
+        # Route the judge's calls through the same recorder (the evaluator may
+        # be shared with a previous engine that wrapped the same client)
+        judge_client = getattr(evaluator, "api_client", None)
+        if isinstance(judge_client, InstrumentedClient):
+            judge_client = judge_client.client
+        if judge_client is raw_client:
+            evaluator.api_client = self.api_client
+        
+        # Run-level call/token/time limits (started by run())
+        self.budget = BudgetTracker(session.config.budget, self.telemetry)
+        self.stop_reason = ""
+        
         # Threading support (Boeing spec 2.3)
         self._stop_requested = threading.Event()
         self._result_queue: Queue = Queue()
         self._status = OptimizerStatus.IDLE
         self._current_thread: Optional[threading.Thread] = None
         
+        # Parallel candidate evaluation (created lazily from session config)
+        self._scheduler: Optional[EvaluationScheduler] = None
+        self._candidates_lock = threading.Lock()
+        
+        # Session-wide memo shared by every engine run on this session
+        self.session.execution_memo.max_entries = self.session.config.memo_max_entries
+        
         # Progress callbacks for UI updates
         self._on_step_complete: Optional[Callable[[StepResult], None]] = None
         self._on_status_change: Optional[Callable[[OptimizerStatus], None]] = None
@@ -128,6 +158,16 @@ class AbstractOptimizer(ABC):
         """
         pass
 
+    @property
+    def scheduler(self) -> EvaluationScheduler:
+        """Worker pool shared by this engine's candidate evaluations."""
+        if self._scheduler is None:
+            self._scheduler = EvaluationScheduler(
+                max_workers=self.session.config.eval_workers,
+                stop_event=self._stop_requested
+            )
+        return self._scheduler
+
     def get_current_status(self) -> Dict[str, Any]:
         """Get current optimizer status for UI display."""
         return {
@@ -145,8 +185,19 @@ class AbstractOptimizer(ABC):
         """
         Run optimization loop until stop condition or max steps.
         
-        Checks _stop_requested between each step for user interruption.
+        Checks _stop_requested between each step for user interruption, and
+        stops gracefully once SessionConfig.budget is used up (session.winner
+        then holds the best candidate so far; stop_reason says which limit).
         """
+        # The API client is shared across runs; clear a STOP left over from a
+        # previous optimizer unless this one has already been stopped.
+        if not self._stop_requested.is_set():
+            self.api_client.reset_stop()
+
+        self.budget = BudgetTracker(self.session.config.budget, self.telemetry)
+        self.budget.start()
+        self.stop_reason = ""
+
         self._status = OptimizerStatus.RUNNING
         self._notify_status_change()
         
@@ -160,7 +211,16 @@ class AbstractOptimizer(ABC):
                     logger.info("Optimization stopped by user")
                     break
 
+                budget_reason = self.budget.exhausted()
+                if budget_reason:
+                    self.stop_reason = budget_reason
+                    logger.info(f"Optimization stopped: {budget_reason}")
+                    break
+
+                self.telemetry.begin_step()
                 result = self.step()
+                result.telemetry = self.telemetry.end_step(result.step_number)
+                self.session.telemetry.add(result.telemetry)
                 results.append(result)
                 self._result_queue.put(result)
                 
@@ -184,10 +244,14 @@ class AbstractOptimizer(ABC):
 
             if self._status == OptimizerStatus.RUNNING:
                 self._status = OptimizerStatus.COMPLETED
+            if self.stop_reason:
+                self.session.winner = self.session.get_best_candidate()
                 
         except Exception as e:
             logger.exception("Optimization failed")
             self._status = OptimizerStatus.FAILED
+        finally:
+            self.scheduler.shutdown()
             
         self._notify_status_change()
         return results
@@ -218,6 +282,7 @@ class AbstractOptimizer(ABC):
         self.session.current_step = 0
         self.session.candidates.clear()
         self.session.trajectory.clear()
+        self.session.telemetry.clear()
         self.session.schematic_state = SchematicState.IDLE
         self.session.active_node = ""
         self.session.internal_monologue = ""
@@ -242,6 +307,49 @@ class AbstractOptimizer(ABC):
         if self._on_status_change:
             self._on_status_change(self._status)
 
+    def _calls_per_candidate(self) -> int:
+        """Upper bound on calls to execute and judge one prompt on the test bench."""
+        return max(1, 2 * sum(1 for _, text in self._test_bench_inputs() if text.strip()))
+
+    def _budget_shortfall(self, calls_needed: int) -> Optional[str]:
+        """Reason the run budget cannot cover `calls_needed` more calls, else None."""
+        if self.budget.affordable(1, calls_needed):
+            return None
+        return self.budget.exhausted() or (
+            f"remaining budget cannot cover {calls_needed} more calls ({self.budget.summary()} used)"
+        )
+
+    def _budget_stop_result(self, step_num: int, reason: str) -> StepResult:
+        """Graceful stop when the run budget is spent: report the best candidate so far."""
+        self.stop_reason = reason
+        self.session.winner = self.session.get_best_candidate()
+        self.session.schematic_state = SchematicState.IDLE
+        self.session.active_node = ""
+        self.session.internal_monologue = (
+            f"Budget exhausted: {reason}. Best so far: {self._get_best_score():.1f}"
+        )
+        return StepResult(
+            candidates=[],
+            best_candidate=self.session.winner,
+            step_number=step_num,
+            schematic_state=SchematicState.IDLE,
+            active_node="",
+            internal_monologue=self.session.internal_monologue,
+            should_stop=True
+        )
+
+    def _trim_to_budget(self, items: List[Any], calls_each: int) -> List[Any]:
+        """Keep only as many items as the run budget can evaluate."""
+        affordable = self.budget.affordable(len(items), calls_each)
+        if affordable < len(items):
+            logger.info(f"Budget: evaluating {affordable} of {len(items)} candidates")
+        return items[:affordable]
+
+    def _record_candidate(self, candidate: UnifiedCandidate):
+        """Append a candidate to the session (safe to call from worker threads)."""
+        with self._candidates_lock:
+            self.session.candidates.append(candidate)
+
     def _add_trajectory_entry(self, candidate: UnifiedCandidate):
         """Add entry to optimization trajectory."""
         entry = TrajectoryEntry(
@@ -251,21 +359,379 @@ class AbstractOptimizer(ABC):
         )
         self.session.trajectory.append(entry)
 
+    def _memo_key(self, kind: str, prompt_text: str, input_text: str) -> Tuple:
+        """Memo key: canonical prompt + input + executor model/temperature."""
+        config = getattr(self.api_client, "config", None)
+        return (
+            kind,
+            canonicalize_prompt(prompt_text),
+            input_text,
+            getattr(config, "model", ""),
+            getattr(config, "temperature", None)
+        )
+
     def _execute_prompt(self, prompt: str, input_text: str) -> str:
         """
         Execute a prompt with input and return the response.
         
-        This is a helper for evaluator's executor_fn.
+        This is a helper for evaluator's executor_fn. Outputs are memoized
+        in the session, so whitespace-equivalent prompts run only once.
         """
         from glassbox.core.api_client import Message
         
+        memo_key = self._memo_key("exec", prompt, input_text)
+        cached = self.session.execution_memo.get(memo_key)
+        if cached is not None:
+            return cached
+        
         messages = [
             Message(role="system", content=prompt),
             Message(role="user", content=input_text)
         ]
         
-        response = self.api_client.send_message(messages)
+        with self.telemetry.phase("execution"):
+            response = self.api_client.send_message(messages)
         if response.success:
+            self.session.execution_memo.put(memo_key, response.content)
             return response.content
         else:
             raise RuntimeError(f"API call failed: {response.error_message}")
+
+    def _eval_memo_key(self, prompt_text: str, input_text: str) -> Tuple:
+        """Memo key for a judge verdict (also depends on the judge rubric)."""
+        return self._memo_key("eval", prompt_text, input_text) + (
+            getattr(self.evaluator, "system_prompt", ""),
+        )
+
+    def _batch_judge(self, prompt_texts: List[str], input_texts: Optional[List[str]] = None):
+        """
+        Pre-score several prompts with one listwise judge call per input.
+        
+        Executes every (prompt, input) pair not already memoized, then
+        judges each input's responses together via Evaluator.evaluate_batch.
+        Verdicts land in the session memo, so the normal per-candidate path
+        (_evaluate_input) picks them up without further calls. Pairs that
+        fail to execute are left for that path to report.
+        
+        Args:
+            prompt_texts: Candidate prompts for this step
+            input_texts: Inputs to judge on (defaults to the non-empty test bench inputs)
+        """
+        if input_texts is None:
+            bench = self.session.test_bench
+            input_texts = [bench.input_a, bench.input_b, bench.input_c]
+        input_texts = [text for text in input_texts if text.strip()]
+        memo = self.session.execution_memo
+
+        # Unique (prompt, input) pairs that still need a verdict
+        pending = []
+        for input_text in dict.fromkeys(input_texts):
+            for prompt_text in dict.fromkeys(prompt_texts):
+                if self._eval_memo_key(prompt_text, input_text) not in memo:
+                    pending.append((prompt_text, input_text))
+        if len(pending) < 2:
+            return
+
+        def _execute(pair: Tuple[str, str]) -> Tuple[str, str, Optional[str]]:
+            prompt_text, input_text = pair
+            try:
+                return prompt_text, input_text, self._execute_prompt(prompt_text, input_text)
+            except Exception as e:
+                logger.error(f"Execution failed during batch judging: {e}")
+                return prompt_text, input_text, None
+
+        executed = self.scheduler.map(_execute, pending)
+
+        by_input: Dict[str, List[Tuple[str, str]]] = {}
+        for prompt_text, input_text, response in executed:
+            if response is not None:
+                by_input.setdefault(input_text, []).append((prompt_text, response))
+
+        def _judge_input(input_text: str):
+            pairs = by_input[input_text]
+            with self.telemetry.phase("judging"):
+                results = self.evaluator.evaluate_batch(
+                    None,  # Each response is judged against its own candidate prompt
+                    input_text,
+                    [response for _, response in pairs],
+                    candidate_prompts=[prompt_text for prompt_text, _ in pairs]
+                )
+            for (prompt_text, response), eval_result in zip(pairs, results):
+                if eval_result.raw_response:
+                    memo.put(
+                        self._eval_memo_key(prompt_text, input_text),
+                        (eval_result.score, response, eval_result.reasoning)
+                    )
+
+        workers = max(1, min(self.session.config.max_parallel_inputs, len(by_input)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(_judge_input, list(by_input)))
+
+    def _evaluate_input(self, prompt_text: str, input_text: str) -> Tuple[float, str, str]:
+        """
+        Execute and judge one prompt/input pair, skipping both calls if this
+        session already scored it (under any engine).
+        
+        Returns:
+            (score, response, reasoning)
+        """
+        return self._evaluate_input_verdict(prompt_text, input_text)[0]
+
+    def _evaluate_input_verdict(self, prompt_text: str, input_text: str) -> Tuple[Tuple[float, str, str], bool]:
+        """
+        _evaluate_input, plus whether the score is a real judge verdict
+        (False when the judge call failed and the score is a fallback).
+        """
+        memo_key = self._eval_memo_key(prompt_text, input_text)
+        cached = self.session.execution_memo.get(memo_key)
+        if cached is not None:
+            return cached, True
+
+        response = self._execute_prompt(prompt_text, input_text)
+        with self.telemetry.phase("judging"):
+            eval_result = self.evaluator.evaluate(prompt_text, input_text, response)
+        outcome = (eval_result.score, response, eval_result.reasoning)
+
+        # Only memoize real judge verdicts, not failed judge calls
+        judged = bool(eval_result.raw_response)
+        if judged:
+            self.session.execution_memo.put(memo_key, outcome)
+        return outcome, judged
+
+    def _test_bench_inputs(self) -> List[Tuple[str, str]]:
+        """Ordered (result key, input text) pairs for the test bench."""
+        bench = self.session.test_bench
+        return [
+            ("input_a", bench.input_a),
+            ("input_b", bench.input_b),
+            ("input_c", bench.input_c),
+        ]
+
+    def _race_test_inputs(
+        self,
+        prompt_texts: List[str]
+    ) -> List[Optional[Tuple[Dict[str, float], Dict[str, str], Dict[str, str], Dict[str, Any]]]]:
+        """
+        Racing evaluation: score every prompt on one input at a time and drop
+        prompts that can no longer win before spending calls on the rest.
+        
+        After each input, a prompt's upper bound is its mean score assuming
+        100 on every remaining input (empty inputs count at their fixed 50
+        from the start). It is pruned if that bound falls below
+        the current best: the session's best aggregate so far, or the lower
+        bound (0 on every remaining input) of another prompt still racing.
+        A pruned prompt's partial mean never exceeds its upper bound, so it
+        can never outrank the prompt that eliminated it.
+        
+        Returns:
+            Per prompt (in order): (scores, responses, reasoning, racing_meta),
+            or None if a stop request interrupted its evaluation. Pruned
+            prompts only have scores for the inputs they were run on.
+        """
+        inputs = self._test_bench_inputs()
+        n_inputs = len(inputs)
+        prior_best = self._get_best_score()
+
+        states = [
+            {"scores": {}, "responses": {}, "reasoning": {}, "racing": None}
+            for _ in prompt_texts
+        ]
+        alive = list(range(len(prompt_texts)))
+
+        # Empty inputs score a fixed 50 at no cost, so they count towards both
+        # bounds and only the non-empty inputs are raced
+        for key, input_text in inputs:
+            if not input_text.strip():
+                for state in states:
+                    state["scores"][key] = 50.0  # Neutral
+                    state["responses"][key] = ""
+                    state["reasoning"][key] = "Test input empty"
+        rounds = [(key, input_text) for key, input_text in inputs if input_text.strip()]
+
+        for round_index, (key, input_text) in enumerate(rounds):
+            if not alive:
+                break
+
+            if self.session.config.batch_judging:
+                self._batch_judge([prompt_texts[i] for i in alive], [input_text])
+
+            def _run(i: int) -> Tuple[int, Tuple[float, str, str]]:
+                try:
+                    return i, self._evaluate_input(prompt_texts[i], input_text)
+                except Exception as e:
+                    logger.error(f"Evaluation failed for {key}: {e}")
+                    return i, (0.0, "", f"Error: {str(e)}")
+
+            finished = dict(self.scheduler.map(_run, alive))
+            if self._stop_requested.is_set() and len(finished) < len(alive):
+                # Interrupted mid-round: leave unfinished prompts unscored
+                for i in alive:
+                    if i not in finished:
+                        states[i] = None
+                alive = [i for i in alive if i in finished]
+
+            for i in alive:
+                score, response, why = finished[i]
+                states[i]["scores"][key] = score
+                states[i]["responses"][key] = response
+                states[i]["reasoning"][key] = why
+
+            remaining = len(rounds) - (round_index + 1)
+            if remaining == 0:
+                break
+
+            totals = {i: sum(states[i]["scores"].values()) for i in alive}
+            upper = {i: (totals[i] + 100.0 * remaining) / n_inputs for i in alive}
+            threshold = max([prior_best] + [totals[i] / n_inputs for i in alive])
+
+            survivors = []
+            for i in alive:
+                if upper[i] < threshold:
+                    states[i]["racing"] = {
+                        "strategy": "racing",
+                        "pruned": True,
+                        "inputs_evaluated": [k for k, _ in inputs if k in states[i]["scores"]],
+                        "upper_bound": round(upper[i], 2),
+                        "threshold": round(threshold, 2),
+                        "reason": (
+                            f"Pruned after {key}: best possible mean {upper[i]:.1f} "
+                            f"< current best {threshold:.1f}"
+                        )
+                    }
+                else:
+                    survivors.append(i)
+            alive = survivors
+
+        results = []
+        for state in states:
+            if state is None:
+                results.append(None)
+                continue
+            order = [key for key, _ in inputs if key in state["scores"]]
+            racing = state["racing"] or {
+                "strategy": "racing",
+                "pruned": False,
+                "inputs_evaluated": order
+            }
+            results.append((
+                {key: state["scores"][key] for key in order},
+                {key: state["responses"][key] for key in order},
+                {key: state["reasoning"][key] for key in order},
+                racing
+            ))
+        return results
+
+    def _allocate_test_inputs(
+        self,
+        prompt_texts: List[str]
+    ) -> Tuple[List[Optional[Tuple[Dict[str, float], Dict[str, str], Dict[str, str]]]], BestArmAllocator]:
+        """
+        Best-arm evaluation: spend test-bench calls adaptively (LUCB, see
+        core/allocator.py) until the best prompt is separated from the rest
+        at SessionConfig.best_arm_confidence, then score the winner on every
+        input.
+        
+        Each round's (prompt, input) pulls run concurrently through the
+        evaluation scheduler. Empty inputs score 50 for every prompt without
+        a call.
+        
+        Returns:
+            (results, allocator): per prompt (in order) its (scores,
+            responses, reasoning) over the inputs it was run on, or None if
+            a stop request interrupted it before any input was scored; the
+            allocator holds every prompt's confidence interval.
+        """
+        inputs = self._test_bench_inputs()
+        allocator = BestArmAllocator(
+            arms=len(prompt_texts),
+            inputs=len(inputs),
+            confidence=self.session.config.best_arm_confidence,
+            batch=self.session.config.eval_workers
+        )
+        states = [{"scores": {}, "responses": {}, "reasoning": {}} for _ in prompt_texts]
+
+        for input_index, (key, input_text) in enumerate(inputs):
+            if not input_text.strip():
+                for arm, state in enumerate(states):
+                    state["scores"][key] = 50.0  # Neutral
+                    state["responses"][key] = ""
+                    state["reasoning"][key] = "Test input empty"
+                    allocator.record(arm, input_index, 50.0, pulled=False)
+
+        def _pull(pull: Tuple[int, int]) -> Tuple[Tuple[int, int], Tuple[float, str, str]]:
+            arm, input_index = pull
+            key, input_text = inputs[input_index]
+            try:
+                return pull, self._evaluate_input(prompt_texts[arm], input_text)
+            except Exception as e:
+                logger.error(f"Evaluation failed for {key}: {e}")
+                return pull, (0.0, "", f"Error: {str(e)}")
+
+        while not self._stop_requested.is_set():
+            pulls = allocator.next_pulls()
+            if not pulls:
+                break
+            if self.session.config.batch_judging:
+                for input_index in sorted({i for _, i in pulls}):
+                    self._batch_judge(
+                        [prompt_texts[arm] for arm, i in pulls if i == input_index],
+                        [inputs[input_index][1]]
+                    )
+
+            for (arm, input_index), (score, response, why) in self.scheduler.map(_pull, pulls):
+                key = inputs[input_index][0]
+                states[arm]["scores"][key] = score
+                states[arm]["responses"][key] = response
+                states[arm]["reasoning"][key] = why
+                allocator.record(arm, input_index, score)
+
+        results = [
+            None if self._stop_requested.is_set() and not allocator.pulled(arm) else
+            (state["scores"], state["responses"], state["reasoning"])
+            for arm, state in enumerate(states)
+        ]
+        return results, allocator
+
+    def _evaluate_test_inputs(
+        self,
+        prompt_text: str
+    ) -> Tuple[Dict[str, float], Dict[str, str], Dict[str, str]]:
+        """
+        Execute and judge a prompt against the tri-state test bench.
+        
+        The A/B/C pipelines run concurrently, capped by
+        SessionConfig.max_parallel_inputs. Errors are isolated per input:
+        a failed input scores 0 without affecting the others.
+        
+        Returns:
+            (scores, responses, reasoning) dicts keyed "input_a".."input_c"
+        """
+        test_inputs = [
+            (input_text, key[len("input_"):]) for key, input_text in self._test_bench_inputs()
+        ]
+
+        def _run_input(item: Tuple[str, str]) -> Tuple[float, str, str]:
+            input_text, label = item
+            if not input_text.strip():
+                return 50.0, "", "Test input empty"  # Neutral
+
+            try:
+                return self._evaluate_input(prompt_text, input_text)
+            except Exception as e:
+                logger.error(f"Evaluation failed for {label}: {e}")
+                return 0.0, "", f"Error: {str(e)}"
+
+        workers = max(1, min(self.session.config.max_parallel_inputs, len(test_inputs)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            outcomes = list(pool.map(_run_input, test_inputs))
+
+        scores = {}
+        responses = {}
+        reasoning = {}
+        for (_, label), (score, response, why) in zip(test_inputs, outcomes):
+            key = f"input_{label}"
+            scores[key] = score
+            responses[key] = response
+            reasoning[key] = why
+
+        return scores, responses, reasoning
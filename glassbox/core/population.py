@@ -0,0 +1,212 @@
+"""
+Population Store - array-backed Promptbreeder population.
+
+Fitness, generation and island membership live in flat arrays (NumPy when
+installed, the stdlib array module otherwise) and prompt strings are
+interned, so clones and migrants share one copy of their text. Selection
+works on indices: ranking and tournament selection read the fitness array
+directly instead of sorting unit objects, which keeps a generation over a
+population in the hundreds cheap. EvolutionaryUnit objects are only
+materialized for the units an engine actually hands to a mutation call or
+to the UI. Each unit's prompt hash (models.lineage.prompt_key) is computed
+once on insert for fitness-cache lookups.
+"""
+
+import random
+import sys
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+from glassbox.models.lineage import prompt_key
+
+# NumPy is optional: the same operations fall back to array.array
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+@dataclass
+class EvolutionaryUnit:
+    """A unit in the Promptbreeder population."""
+    id: str
+    task_prompt: str
+    mutation_prompt: str
+    fitness: float = 0.0
+    generation: int = 0
+    parent_ids: List[str] = field(default_factory=list)
+
+
+def _float_array(values: Sequence[float] = ()):
+    if NUMPY_AVAILABLE:
+        return np.asarray(values, dtype=np.float64)
+    return array("d", values)
+
+
+def _int_array(values: Sequence[int] = ()):
+    if NUMPY_AVAILABLE:
+        return np.asarray(values, dtype=np.int32)
+    return array("l", values)
+
+
+def _take(values, indices: Sequence[int]):
+    """Elements of `values` at `indices`, as the same kind of array."""
+    if NUMPY_AVAILABLE:
+        return values[np.asarray(indices, dtype=np.intp)]
+    return array(values.typecode, (values[i] for i in indices))
+
+
+def _concat(values, extra):
+    if NUMPY_AVAILABLE:
+        return np.concatenate([values, np.asarray(extra, dtype=values.dtype)])
+    return values + array(values.typecode, extra)
+
+
+class Population:
+    """
+    Struct-of-arrays population indexed by position.
+
+    Usage:
+        population = Population()
+        population.extend(units, islands=[0, 1, 0, 1])
+        ranked = population.ranked(population.members(0))
+        parents = population.tournament(ranked, size=2, count=4, rng=random)
+    """
+
+    def __init__(self):
+        self.ids: List[str] = []
+        self.task_prompts: List[str] = []
+        self.mutation_prompts: List[str] = []
+        self.parent_ids: List[List[str]] = []
+        self.keys: List[str] = []  # prompt_key(task_prompt)
+        self.fitness = _float_array()
+        self.scored = _int_array()  # 1 once fitness holds a real score
+        self.generation = _int_array()
+        self.island = _int_array()
+        self._index: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def clear(self):
+        self.__init__()
+
+    def extend(self, units: Sequence[EvolutionaryUnit], islands: Sequence[int]):
+        """Append units (one array concatenation per call)."""
+        for unit in units:
+            self._index[unit.id] = len(self.ids)
+            self.ids.append(unit.id)
+            self.task_prompts.append(sys.intern(unit.task_prompt))
+            self.mutation_prompts.append(sys.intern(unit.mutation_prompt))
+            self.parent_ids.append(list(unit.parent_ids))
+            self.keys.append(prompt_key(unit.task_prompt))
+        self.fitness = _concat(self.fitness, [u.fitness for u in units])
+        self.scored = _concat(self.scored, [0] * len(units))
+        self.generation = _concat(self.generation, [u.generation for u in units])
+        self.island = _concat(self.island, list(islands))
+
+    def replace(self, index: int, unit: EvolutionaryUnit, island: int):
+        """Overwrite the unit at `index` (e.g. with a migrant)."""
+        del self._index[self.ids[index]]
+        self._index[unit.id] = index
+        self.ids[index] = unit.id
+        self.task_prompts[index] = sys.intern(unit.task_prompt)
+        self.mutation_prompts[index] = sys.intern(unit.mutation_prompt)
+        self.parent_ids[index] = list(unit.parent_ids)
+        self.keys[index] = prompt_key(unit.task_prompt)
+        self.fitness[index] = unit.fitness
+        self.scored[index] = 0
+        self.generation[index] = unit.generation
+        self.island[index] = island
+
+    def keep(self, indices: Sequence[int]):
+        """Compact the population to `indices`, in that order."""
+        indices = list(indices)
+        self.ids = [self.ids[i] for i in indices]
+        self.task_prompts = [self.task_prompts[i] for i in indices]
+        self.mutation_prompts = [self.mutation_prompts[i] for i in indices]
+        self.parent_ids = [self.parent_ids[i] for i in indices]
+        self.keys = [self.keys[i] for i in indices]
+        self.fitness = _take(self.fitness, indices)
+        self.scored = _take(self.scored, indices)
+        self.generation = _take(self.generation, indices)
+        self.island = _take(self.island, indices)
+        self._index = {unit_id: i for i, unit_id in enumerate(self.ids)}
+
+    def index_of(self, unit_id: str) -> Optional[int]:
+        return self._index.get(unit_id)
+
+    def set_fitness(self, index: int, value: float):
+        self.fitness[index] = value
+        self.scored[index] = 1
+
+    def unit(self, index: int) -> EvolutionaryUnit:
+        """Materialize one unit (a copy; edits do not write back)."""
+        return EvolutionaryUnit(
+            id=self.ids[index],
+            task_prompt=self.task_prompts[index],
+            mutation_prompt=self.mutation_prompts[index],
+            fitness=float(self.fitness[index]),
+            generation=int(self.generation[index]),
+            parent_ids=list(self.parent_ids[index])
+        )
+
+    def units(self, indices: Optional[Sequence[int]] = None) -> List[EvolutionaryUnit]:
+        if indices is None:
+            indices = range(len(self))
+        return [self.unit(i) for i in indices]
+
+    def members(self, island: int) -> List[int]:
+        """Indices of the units on `island`."""
+        if NUMPY_AVAILABLE:
+            return np.flatnonzero(self.island == island).tolist()
+        return [i for i, value in enumerate(self.island) if value == island]
+
+    def ranked(self, indices: Optional[Sequence[int]] = None) -> List[int]:
+        """Indices by fitness descending, ties broken by id (deterministic)."""
+        indices = list(range(len(self)) if indices is None else indices)
+        if NUMPY_AVAILABLE and indices:
+            idx = np.asarray(indices, dtype=np.intp)
+            ids = np.asarray([self.ids[i] for i in indices])
+            return idx[np.lexsort((ids, -self.fitness[idx]))].tolist()
+        return sorted(indices, key=lambda i: (-self.fitness[i], self.ids[i]))
+
+    def best_fitness(self) -> float:
+        if not len(self):
+            return 0.0
+        return float(max(self.fitness))
+
+    def tournament(
+        self,
+        indices: Sequence[int],
+        size: int,
+        count: int,
+        rng: random.Random,
+        exclude: Optional[int] = None
+    ) -> List[Optional[int]]:
+        """
+        `count` tournament winners from `indices`.
+
+        Each tournament draws `size` contestants with replacement from
+        `rng` (so results are identical with and without NumPy) and the
+        fittest wins, the first drawn on ties. Contestants equal to
+        `exclude` are dropped; a tournament left empty yields None.
+        """
+        if not indices or count <= 0:
+            return []
+        size = max(1, size)
+        draws = [[indices[rng.randrange(len(indices))] for _ in range(size)] for _ in range(count)]
+        if exclude is not None:
+            draws = [[i for i in contestants if i != exclude] for contestants in draws]
+
+        if NUMPY_AVAILABLE and exclude is None:
+            matrix = np.asarray(draws, dtype=np.intp)
+            winners = matrix[np.arange(count), np.argmax(self.fitness[matrix], axis=1)]
+            return winners.tolist()
+        return [
+            max(contestants, key=lambda i: self.fitness[i]) if contestants else None
+            for contestants in draws
+        ]
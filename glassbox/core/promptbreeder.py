@@ -7,12 +7,14 @@ both task-prompts and mutation-prompts that co-evolve.
 
 import logging
 import random
-from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, NamedTuple, Optional, Tuple
 
 import uuid
 from glassbox.core.optimizer_base import AbstractOptimizer, StepResult
 from glassbox.core.api_client import Message
+from glassbox.core.bandit import MutationBandit
+from glassbox.core.population import EvolutionaryUnit, Population
+from glassbox.models.lineage import FitnessRecord, bench_fingerprint, input_signature
 from glassbox.models.session import SchematicState
 from glassbox.models.candidate import UnifiedCandidate
 from glassbox.prompts.templates import (
@@ -25,16 +27,19 @@ from glassbox.prompts.templates import (
 
 logger = logging.getLogger(__name__)
 
+# Candidate UUIDs are derived from session, unit ID and prompt hash
+CANDIDATE_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "glassbox/promptbreeder")
 
-@dataclass
-class EvolutionaryUnit:
-    """A unit in the Promptbreeder population."""
-    id: str
-    task_prompt: str
-    mutation_prompt: str
-    fitness: float = 0.0
-    generation: int = 0
-    parent_ids: List[str] = field(default_factory=list)
+
+class BreedingPlan(NamedTuple):
+    """One child to breed, with every random choice already made."""
+    index: int  # Child slot this generation (used in its id)
+    island: int
+    parent: EvolutionaryUnit
+    operator: str
+    partner: Optional[EvolutionaryUnit]
+    direction: Optional[str]  # Zero-order direction chosen by the bandit
+    rng: random.Random
 
 
 class PromptbreederEngine(AbstractOptimizer):
@@ -48,8 +53,29 @@ class PromptbreederEngine(AbstractOptimizer):
        - Zero-Order: Direct rewrite (e.g., "make more formal")
        - First-Order: Mutation-prompt modifies task-prompt
        - Crossover: Combine task from A with mutation from B
-    4. Tournament selection: Kill bottom 50%, clone top 50%
-    5. Repeat
+    4. Selection: keep the top 50% of each island, breed the rest from
+       tournament winners
+    5. Every migration_interval generations, each island's best replaces
+       the worst unit of the next island (ring)
+    6. Repeat
+
+    Population size, generation cap, island count and tournament size come
+    from SessionConfig; the population itself is an array-backed Population.
+    Fitness is the mean judge score over the test bench inputs, scored a
+    minibatch (SessionConfig.fitness_minibatch) of not-yet-scored inputs
+    per unit per generation and cached per prompt text with its per-input
+    scores (session.fitness_cache), so survivors accumulate scores instead
+    of being re-scored. Until a unit is scored on every input its missing
+    inputs count at the neutral 50, so partially scored units do not
+    outrank fully scored ones on a lucky first input; recorded candidates
+    are updated as their scores accumulate. With evaluation_strategy "racing", units whose
+    best possible mean can no longer reach the leader's guaranteed mean
+    stop being scored. Every unit is recorded in session.lineage; cache
+    and lineage are saved with the session.
+
+    Operators and zero-order directions are chosen by MutationBandits
+    (SessionConfig.mutation_selection: "ucb", "thompson" or "random")
+    rewarded with each child's fitness gain per API call.
     
     Glass Box Visualization:
     - Schematic: Horizontal branching tree (phylogenetic)
@@ -57,22 +83,50 @@ class PromptbreederEngine(AbstractOptimizer):
     - Animation: Branches grow, failed ones gray out
     """
 
-    POPULATION_SIZE = 8  # Smaller than paper's 20 for hackathon
     MUTATION_OPERATORS = ["zero_order", "first_order", "crossover"]
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.population: List[EvolutionaryUnit] = []
+        self.store = Population()
+        self._recorded_units: Dict[str, UnifiedCandidate] = {}  # unit id -> its entry in session.candidates
         self._generation = 0
         self._mutation_directions = [
             "more formal", "more concise", "more detailed",
             "step-by-step", "more technical", "simpler"
         ]
+        strategy = self.session.config.mutation_selection
+        exploration = self.session.config.bandit_exploration
+        self.operator_bandit = MutationBandit(self.MUTATION_OPERATORS, strategy, exploration)
+        self.direction_bandit = MutationBandit(self._mutation_directions, strategy, exploration)
+        self._awaiting: Dict[str, Tuple[str, Optional[str], float]] = {}  # child id -> (operator, direction, parent fitness)
+        self._origins: Dict[str, Tuple[str, Optional[str]]] = {}  # unit id -> (operator, direction)
 
     @property
     def engine_name(self) -> str:
         return "Promptbreeder (Evolutionary)"
 
+    @property
+    def population(self) -> List[EvolutionaryUnit]:
+        """Current units in rank order (materialized copies of the store)."""
+        return self.store.units()
+
+    @property
+    def population_size(self) -> int:
+        return max(2, self.session.config.population_size)
+
+    @property
+    def island_count(self) -> int:
+        # Every island needs a survivor and a child
+        return max(1, min(self.session.config.breeder_islands, self.population_size // 2))
+
+    def _island_capacity(self, island: int) -> int:
+        base, extra = divmod(self.population_size, self.island_count)
+        return base + (1 if island < extra else 0)
+
+    def reset(self):
+        super().reset()
+        self._recorded_units.clear()
+
     @property
     def engine_type_enum(self):
         from glassbox.models.candidate import EngineType
@@ -83,74 +137,149 @@ class PromptbreederEngine(AbstractOptimizer):
         return "tree"
 
     def _initialize_population(self):
-        """Create initial population from seed prompt."""
-        self.population = []
+        """Create initial population from seed prompt, dealt round-robin to islands."""
+        self.store.clear()
         seed = self.session.seed_prompt
+        islands = self.island_count
 
-        for i in range(self.POPULATION_SIZE):
+        units = []
+        for i in range(self.population_size):
             mutation_prompt = random.choice(PROMPTBREEDER_MUTATION_PROMPTS)
-            unit = EvolutionaryUnit(
+            units.append(EvolutionaryUnit(
                 id=f"g0_u{i}",
                 task_prompt=seed if i == 0 else f"{seed}\n\n(Variation {i})",
                 mutation_prompt=mutation_prompt,
                 generation=0
-            )
-            self.population.append(unit)
+            ))
+        self.store.extend(units, [i % islands for i in range(len(units))])
+        self._track(units)
+
+    def _track(self, units: List[EvolutionaryUnit]):
+        """Record units in the session lineage."""
+        for unit in units:
+            self.session.lineage.add(unit.id, unit.parent_ids, unit.generation)
+
+    def _candidate_id(self, unit_id: str, key: str) -> uuid.UUID:
+        """Candidate UUID that is stable across processes and save/load."""
+        return uuid.uuid5(CANDIDATE_NAMESPACE, f"{self.session.metadata.session_id}/{unit_id}/{key}")
 
     def step(self) -> StepResult:
         """Execute one evolutionary generation."""
         self.session.current_step += 1
         self._generation += 1
+        config = self.session.config
+
+        # Budget check: at least one fitness evaluation
+        shortfall = self._budget_shortfall(2)
+        if shortfall:
+            return self._budget_stop_result(self.session.current_step, shortfall)
 
         # Initialize on first step
-        if not self.population:
+        if not len(self.store):
             self._initialize_population()
+        store = self.store
 
         # Phase 1: Evaluate fitness
         self.session.schematic_state = SchematicState.EVALUATION
         self.session.active_node = "evaluation"
         self._update_monologue("Evaluating population fitness...", "tournament")
 
-        for unit in self.population:
-            if self._stop_requested.is_set():
-                break
-            if unit.fitness == 0.0:  # Only evaluate unevaluated units
-                unit.fitness = self._evaluate_fitness(unit.task_prompt)
+        self._credit_bandits(self._score_population())
+
+        if self.island_count > 1 and config.migration_interval > 0 \
+                and self._generation % config.migration_interval == 0:
+            self._migrate()
+
+        # Phase 2: Selection - elites survive, tournament winners breed
+        survivors: List[int] = []
+        plans: List[BreedingPlan] = []
+        for island in range(self.island_count):
+            ranked = store.ranked(store.members(island))
+            elites = ranked[:max(1, len(ranked) // 2)]
+            survivors.extend(elites)
+            breeders = [i for i in elites if store.fitness[i] > 0]  # Crossover partners
+            parents = store.tournament(ranked, config.tournament_size, self._island_capacity(island) - len(elites), random)
+
+            # Random choices are drawn here, in order, so children are
+            # reproducible under a fixed seed however the workers interleave
+            for parent in parents:
+                operator = self.operator_bandit.select(random)
+                partner = None
+                if operator == "crossover":
+                    partner = store.tournament(breeders, config.tournament_size, 1, random, exclude=parent)
+                    partner = partner[0] if partner else None
+                    if partner is None:
+                        operator = "zero_order"  # No other scored elite on this island
+                        self.operator_bandit.reassign("crossover", operator)
+                direction = None
+                if operator == "zero_order" and self.direction_bandit.strategy != "random":
+                    direction = self.direction_bandit.select(random)
+                plans.append(BreedingPlan(
+                    index=len(plans),
+                    island=island,
+                    parent=store.unit(parent),
+                    operator=operator,
+                    partner=store.unit(partner) if partner is not None else None,
+                    direction=direction,
+                    rng=random.Random(random.getrandbits(64))
+                ))
 
-        # Phase 2: Selection (Tournament)
-        self.population.sort(key=lambda u: u.fitness, reverse=True)
-        survivors = self.population[:len(self.population) // 2]
-        
         # Phase 3: Mutation/Reproduction
         self.session.schematic_state = SchematicState.GROWTH
         self.session.active_node = "mutation"
-        
-        new_population = list(survivors)  # Clone survivors
-        
-        for survivor in survivors:
-            if self._stop_requested.is_set():
-                break
-                
-            operator = random.choice(self.MUTATION_OPERATORS)
-            self._update_monologue(f"Applying {operator} to unit {survivor.id}", operator)
-            
-            child = self._apply_mutation(survivor, operator)
-            if child:
-                new_population.append(child)
 
-        self.population = new_population[:self.POPULATION_SIZE]
+        affordable = self._trim_to_budget(plans, 1)
+        for plan in plans[len(affordable):]:
+            self._release_plan(plan)
+        plans = affordable
+        if plans:
+            operators = sorted({plan.operator for plan in plans})
+            self._update_monologue(
+                f"Breeding {len(plans)} children in parallel across {self.island_count} island(s) ({', '.join(operators)})",
+                operators[0] if len(operators) == 1 else "mixed"
+            )
+
+        def _breed(plan: BreedingPlan) -> Optional[EvolutionaryUnit]:
+            with self.telemetry.phase("mutation"):
+                return self._apply_mutation(
+                    plan.parent, plan.operator, plan.rng, plan.index, plan.partner, plan.direction
+                )
+
+        children = self.scheduler.map(_breed, plans)  # Submission order
+        self._track([child for child in children if child])
+        for plan, child in zip(plans, children):
+            parent_fitness = max(plan.parent.fitness, plan.partner.fitness if plan.partner else 0.0)
+            if child is None:
+                # Failed mutation: one call spent, no gain
+                self.operator_bandit.update(plan.operator, parent_fitness, parent_fitness, calls=1)
+                if plan.direction:
+                    self.direction_bandit.update(plan.direction, parent_fitness, parent_fitness, calls=1)
+                continue
+            self._awaiting[child.id] = (plan.operator, plan.direction, parent_fitness)
+            self._origins[child.id] = (plan.operator, plan.direction)
+
+        store.keep(survivors)
+        store.extend(
+            [child for child in children if child],
+            [plan[1] for plan, child in zip(plans, children) if child]
+        )
+        store.keep(store.ranked())
 
         # Convert to UnifiedCandidate for session tracking
         step_candidates = []
+        lineage = self.session.lineage
+        inputs = self._fitness_inputs()
         for unit in self.population:
-            # Estimate other scores if not computed (hackathon shortcut per original code)
-            score_a = unit.fitness
-            score_b = unit.fitness * 0.9
-            score_c = unit.fitness * 0.8
-            scores = {"input_a": score_a, "input_b": score_b, "input_c": score_c}
-            
+            index = store.index_of(unit.id)
+            record = self.session.fitness_cache.peek(store.keys[index])
+            scores = {}
+            observed = None
+            if record is not None:
+                scores = {name: record.scores[sig] for name, _, sig in inputs if sig in record.scores}
+                observed = record.mean([sig for _, _, sig in inputs])
+
             candidate = UnifiedCandidate(
-                id=uuid.UUID(hex=hash(unit.id) & ((1<<128)-1)), # Deterministic UUID from unit ID string
+                id=self._candidate_id(unit.id, store.keys[index]),
                 engine_type=self.engine_type_enum,
                 generation_index=self._generation,
                 display_text=f"Unit {unit.id}: {unit.task_prompt[:30]}...",
@@ -162,14 +291,33 @@ class PromptbreederEngine(AbstractOptimizer):
                     "mutation_prompt": unit.mutation_prompt,
                     "parent_ids": unit.parent_ids,
                     "fitness": unit.fitness,
-                    "mutation_operator": "mixed" # Simplification
+                    "island": int(store.island[index]),
+                    "fitness_inputs": len(scores),
+                    "observed_mean": observed,
+                    "racing": {"pruned": bool(record and record.pruned)},
+                    "lineage": {"depth": lineage.depth(unit.id), "root": lineage.root(unit.id)},
+                    "mutation_operator": self._origins.get(unit.id, ("seed", None))[0],
+                    "mutation_direction": self._origins.get(unit.id, ("seed", None))[1]
                 }
             )
             step_candidates.append(candidate)
             
-            # Add to session if not already there (check by ID string match in meta)
-            if not any(c.meta.get("unit_id") == unit.id for c in self.session.candidates):
-                self.session.candidates.append(candidate)
+            # Add to session once scored (children are scored next generation),
+            # then keep the entry current as the unit's minibatches accumulate
+            recorded = self._recorded_units.get(unit.id)
+            if recorded is not None:
+                recorded.score_aggregate = candidate.score_aggregate
+                recorded.test_results = candidate.test_results
+                recorded.meta = candidate.meta
+            elif store.scored[index]:
+                self._recorded_units[unit.id] = candidate
+                self._record_candidate(candidate)
+
+        self.session.mutation_bandits = {
+            "strategy": self.operator_bandit.strategy,
+            "operators": self.operator_bandit.to_dict(),
+            "directions": self.direction_bandit.to_dict()
+        }
 
         best = max(step_candidates, key=lambda c: c.score_aggregate)
         self._add_trajectory_entry(best)
@@ -178,6 +326,7 @@ class PromptbreederEngine(AbstractOptimizer):
         self.session.schematic_state = SchematicState.IDLE
         self.session.active_node = ""
 
+        max_generations = config.max_generations
         return StepResult(
             candidates=step_candidates,
             best_candidate=best,
@@ -185,36 +334,216 @@ class PromptbreederEngine(AbstractOptimizer):
             schematic_state=SchematicState.IDLE,
             active_node="",
             internal_monologue=self.session.internal_monologue,
-            should_stop=self._generation >= 10  # Max generations
+            should_stop=bool(max_generations) and self._generation >= max_generations
         )
 
-    def _evaluate_fitness(self, task_prompt: str) -> float:
-        """Evaluate fitness using test bench input A (for speed)."""
+    def _migrate(self):
+        """Ring migration: each island's best replaces the worst unit of the next island."""
+        store = self.store
+        islands = self.island_count
+        bests = [store.ranked(store.members(island))[:1] for island in range(islands)]
+        for island, best in enumerate(bests):
+            destination = (island + 1) % islands
+            members = store.ranked(store.members(destination))
+            if not best or len(members) < 2:
+                continue
+            source = store.unit(best[0])
+            migrant = EvolutionaryUnit(
+                id=f"g{self._generation}_m{destination}",
+                task_prompt=source.task_prompt,
+                mutation_prompt=source.mutation_prompt,
+                fitness=source.fitness,  # Already scored, no re-evaluation
+                generation=self._generation,
+                parent_ids=[source.id]
+            )
+            store.replace(members[-1], migrant, destination)
+            self._track([migrant])
+            self._origins[migrant.id] = ("migration", None)
+        self._update_monologue(f"Migrated island bests around a ring of {islands} islands", "migration")
+
+    def _fitness_inputs(self) -> List[Tuple[str, str, str]]:
+        """(result key, input text, score signature) for each non-empty test input."""
+        inputs = [(name, text) for name, text in self._test_bench_inputs() if text and text.strip()]
+        if not inputs:
+            inputs = [("input_a", "Test input")]
+        return [(name, text, input_signature(name, text)) for name, text in inputs]
+
+    def _score_population(self) -> Dict[str, float]:
+        """
+        Score every unit on up to fitness_minibatch test inputs it has no
+        cached score for. Units sharing a prompt share one evaluation.
+
+        Without racing all (prompt, input) pairs run concurrently in one
+        batch. With racing, inputs go one round at a time (each round
+        concurrent) and after every round a prompt is pruned when its upper
+        bound (100 on every input it still lacks) falls below the best lower
+        bound (0 on every missing input) in the population.
+
+        Returns:
+            Prompt key -> scoring calls spent this generation per unit
+        """
+        store = self.store
+        config = self.session.config
+        cache = self.session.fitness_cache
+        inputs = self._fitness_inputs()
+        signatures = [sig for _, _, sig in inputs]
+        minibatch = config.fitness_minibatch if config.fitness_minibatch > 0 else len(inputs)
+        racing = config.evaluation_strategy == "racing" and len(inputs) > 1
+
+        groups: Dict[str, List[int]] = {}
+        for index, key in enumerate(store.keys):
+            groups.setdefault(key, []).append(index)
+
+        records: Dict[str, FitnessRecord] = {}
+        todo: Dict[str, List[Tuple[str, str]]] = {}  # prompt key -> (signature, input text) to score
+        bench = bench_fingerprint(signatures)
+        for key in groups:
+            record = cache.get(key) or FitnessRecord(fitness=0.0, generation=self._generation)
+            if record.pruned and record.pruned_bench != bench:
+                record.pruned = False  # Pruned against a test bench that has since been edited
+            records[key] = record
+            missing = [(sig, text) for _, text, sig in inputs if sig not in record.scores]
+            if missing and not record.pruned:
+                todo[key] = missing[:minibatch]
+
+        if racing:
+            rounds = [[(key, r) for key in todo if r < len(todo[key])] for r in range(minibatch)]
+        else:
+            rounds = [[(key, r) for key in todo for r in range(len(todo[key]))]]
+
+        spent: Dict[str, int] = {}
+        pruned = set()
+
+        def _score(pair: Tuple[str, int]) -> str:
+            key, position = pair
+            signature, input_text = todo[key][position]
+            score = self._evaluate_fitness(store.task_prompts[groups[key][0]], input_text)
+            if score is not None:
+                records[key].scores[signature] = score  # Left unscored on failure; retried later
+            return key
+
+        for pairs in rounds:
+            pairs = self._trim_to_budget([p for p in pairs if p[0] not in pruned], 2)  # Execute + judge
+            if not pairs:
+                break
+            for key in self.scheduler.map(_score, pairs):  # Pairs skipped on stop are not returned
+                spent[key] = spent.get(key, 0) + 2
+            if racing:
+                pruned |= self._race_prune(records, signatures)
+
+        for key, record in records.items():
+            fitness = record.estimate(signatures)
+            if fitness is None:
+                continue
+            record.fitness = fitness
+            cache.put(key, record)
+            for index in groups[key]:
+                store.set_fitness(index, fitness)
+
+        return {key: calls / len(groups[key]) for key, calls in spent.items()}
+
+    def _race_prune(self, records: Dict[str, FitnessRecord], signatures: List[str]) -> set:
+        """Mark (and return) prompts that can no longer catch the leader."""
+        count = len(signatures)
+        bounds = {}
+        for key, record in records.items():
+            scored = [record.scores[sig] for sig in signatures if sig in record.scores]
+            if scored:
+                total = sum(scored)
+                bounds[key] = (total / count, (total + 100.0 * (count - len(scored))) / count)
+        if not bounds:
+            return set()
+        best_lower = max(lower for lower, _ in bounds.values())
+        pruned = set()
+        for key, (lower, upper) in bounds.items():
+            if lower < upper < best_lower and not records[key].pruned:  # lower == upper: fully scored
+                records[key].pruned = True
+                records[key].pruned_bench = bench_fingerprint(signatures)
+                pruned.add(key)
+        return pruned
+
+    def _credit_bandits(self, evaluated: Dict[str, float]):
+        """
+        Reward the operator (and direction) of every child scored this
+        generation. A child costs its mutation call plus its share of the
+        fitness evaluation calls, or nothing more if its prompt was cached.
+        """
+        store = self.store
+        for unit_id, (operator, direction, parent_fitness) in list(self._awaiting.items()):
+            index = store.index_of(unit_id)
+            if index is None:  # Culled before it could be scored
+                self._release(operator, direction)
+            elif store.scored[index]:
+                key = store.keys[index]
+                calls = 1 + evaluated.get(key, 0)
+                fitness = float(store.fitness[index])
+                self.operator_bandit.update(operator, parent_fitness, fitness, calls)
+                if direction:
+                    self.direction_bandit.update(direction, parent_fitness, fitness, calls)
+            else:
+                continue  # Not evaluated yet (budget); keep waiting
+            del self._awaiting[unit_id]
+
+    def _release(self, operator: str, direction: Optional[str]):
+        self.operator_bandit.release(operator)
+        if direction:
+            self.direction_bandit.release(direction)
+
+    def _release_plan(self, plan: BreedingPlan):
+        """Withdraw the bandit pulls of a plan that will not be bred."""
+        self._release(plan.operator, plan.direction)
+
+    def _evaluate_fitness(self, task_prompt: str, input_text: str) -> Optional[float]:
+        """Judge score of a prompt on one test input; None if the judge failed."""
         try:
-            input_text = self.session.test_bench.input_a or "Test input"
-            response = self._execute_prompt(task_prompt, input_text)
-            eval_result = self.evaluator.evaluate(task_prompt, input_text, response)
-            return eval_result.score
+            (score, _, _), judged = self._evaluate_input_verdict(task_prompt, input_text)
+            return score if judged else None
         except Exception as e:
             logger.error(f"Fitness evaluation failed: {e}")
-            return 0.0
+            return None
 
-    def _apply_mutation(self, parent: EvolutionaryUnit, operator: str) -> Optional[EvolutionaryUnit]:
-        """Apply mutation operator to create child unit."""
+    def _apply_mutation(
+        self,
+        parent: EvolutionaryUnit,
+        operator: str,
+        rng: Optional[random.Random] = None,
+        index: Optional[int] = None,
+        partner: Optional[EvolutionaryUnit] = None,
+        direction: Optional[str] = None
+    ) -> Optional[EvolutionaryUnit]:
+        """
+        Apply mutation operator to create child unit.
+
+        Safe to call from worker threads: all randomness comes from `rng`
+        and the child id from `index` (the child's slot this generation).
+        Crossover uses `partner` and zero-order uses `direction` when the
+        caller has already selected them.
+        """
+        rng = rng or random.Random(random.getrandbits(64))
         try:
             if operator == "zero_order":
-                return self._zero_order_mutation(parent)
+                return self._zero_order_mutation(parent, rng, index, direction)
             elif operator == "first_order":
-                return self._first_order_mutation(parent)
+                return self._first_order_mutation(parent, rng, index)
             elif operator == "crossover":
-                return self._crossover(parent)
+                return self._crossover(parent, rng, index, partner)
         except Exception as e:
             logger.error(f"Mutation failed: {e}")
             return None
 
-    def _zero_order_mutation(self, parent: EvolutionaryUnit) -> EvolutionaryUnit:
+    def _child_id(self, kind: str, rng: random.Random, index: Optional[int]) -> str:
+        suffix = index if index is not None else rng.randint(0, 999)
+        return f"g{self._generation}_{kind}{suffix}"
+
+    def _zero_order_mutation(
+        self,
+        parent: EvolutionaryUnit,
+        rng: random.Random,
+        index: Optional[int] = None,
+        direction: Optional[str] = None
+    ) -> EvolutionaryUnit:
         """Direct rewrite mutation."""
-        direction = random.choice(self._mutation_directions)
+        direction = direction or rng.choice(self._mutation_directions)
         
         prompt = PROMPTBREEDER_ZERO_ORDER_MUTATION.format(
             prompt=parent.task_prompt,
@@ -227,14 +556,16 @@ class PromptbreederEngine(AbstractOptimizer):
         new_prompt = response.content if response.success else parent.task_prompt
 
         return EvolutionaryUnit(
-            id=f"g{self._generation}_z{random.randint(0, 999)}",
+            id=self._child_id("z", rng, index),
             task_prompt=new_prompt,
             mutation_prompt=f"Zero-order: {direction}",
             generation=self._generation,
             parent_ids=[parent.id]
         )
 
-    def _first_order_mutation(self, parent: EvolutionaryUnit) -> EvolutionaryUnit:
+    def _first_order_mutation(
+        self, parent: EvolutionaryUnit, rng: random.Random, index: Optional[int] = None
+    ) -> EvolutionaryUnit:
         """Mutation-prompt modifies task-prompt."""
         prompt = PROMPTBREEDER_FIRST_ORDER_MUTATION.format(
             task_prompt=parent.task_prompt,
@@ -247,24 +578,30 @@ class PromptbreederEngine(AbstractOptimizer):
         new_prompt = response.content if response.success else parent.task_prompt
 
         # Also evolve the mutation prompt
-        new_mutation = random.choice(PROMPTBREEDER_MUTATION_PROMPTS)
+        new_mutation = rng.choice(PROMPTBREEDER_MUTATION_PROMPTS)
 
         return EvolutionaryUnit(
-            id=f"g{self._generation}_f{random.randint(0, 999)}",
+            id=self._child_id("f", rng, index),
             task_prompt=new_prompt,
             mutation_prompt=new_mutation,
             generation=self._generation,
             parent_ids=[parent.id]
         )
 
-    def _crossover(self, parent: EvolutionaryUnit) -> EvolutionaryUnit:
+    def _crossover(
+        self,
+        parent: EvolutionaryUnit,
+        rng: random.Random,
+        index: Optional[int] = None,
+        other: Optional[EvolutionaryUnit] = None
+    ) -> EvolutionaryUnit:
         """Combine task from one unit with mutation from another."""
-        # Find another high-fitness parent
-        other_parents = [u for u in self.population if u.id != parent.id and u.fitness > 0]
-        if not other_parents:
-            return self._zero_order_mutation(parent)
-
-        other = random.choice(other_parents)
+        if other is None:
+            # Find another high-fitness parent
+            other_parents = [u for u in self.population if u.id != parent.id and u.fitness > 0]
+            if not other_parents:
+                return self._zero_order_mutation(parent, rng, index)
+            other = rng.choice(other_parents)
 
         prompt = PROMPTBREEDER_CROSSOVER_TEMPLATE.format(
             prompt_a=parent.task_prompt,
@@ -279,7 +616,7 @@ class PromptbreederEngine(AbstractOptimizer):
         new_prompt = response.content if response.success else parent.task_prompt
 
         return EvolutionaryUnit(
-            id=f"g{self._generation}_c{random.randint(0, 999)}",
+            id=self._child_id("c", rng, index),
             task_prompt=new_prompt,
             mutation_prompt=other.mutation_prompt,  # Take mutation from other parent
             generation=self._generation,
@@ -288,13 +625,14 @@ class PromptbreederEngine(AbstractOptimizer):
 
     def _update_monologue(self, mutation_description: str, operator: str):
         """Update Glass Box monologue."""
-        best_fitness = max((u.fitness for u in self.population), default=0)
+        best_fitness = self.store.best_fitness()
         self.session.internal_monologue = MONOLOGUE_PROMPTBREEDER.format(
             generation=self._generation,
-            population_size=len(self.population),
+            population_size=len(self.store),
             mutation_operator=operator.replace("_", "-").title(),
             best_fitness=f"{best_fitness:.1f}",
-            mutation_description=mutation_description
+            mutation_description=mutation_description,
+            operator_stats=self.operator_bandit.summary()
         )
 
     def get_schematic_nodes(self) -> List[Dict[str, Any]]:
@@ -316,16 +654,17 @@ class PromptbreederEngine(AbstractOptimizer):
         return nodes
 
     def get_schematic_edges(self) -> List[Dict[str, Any]]:
-        """Return tree schematic edges based on parent relationships."""
+        """Return tree schematic edges based on parent relationships (from the lineage store)."""
         edges = []
-        for unit in self.population:
-            for parent_id in unit.parent_ids:
-                if any(u.id == parent_id for u in self.population):
+        lineage = self.session.lineage
+        for index, unit_id in enumerate(self.store.ids):
+            for parent_id in lineage.parents(unit_id):
+                if self.store.index_of(parent_id) is not None:
                     edges.append({
                         "source": parent_id,
-                        "target": unit.id,
+                        "target": unit_id,
                         "color": "#3B82F6",
-                        "active": unit.generation == self._generation,
+                        "active": int(self.store.generation[index]) == self._generation,
                         "label": ""
                     })
         return edges
@@ -0,0 +1,162 @@
+"""
+Client-side Rate Limiting - token bucket plus AIMD concurrency control.
+
+Keeps parallel engines at the gateway's throughput ceiling without retry
+storms: the token bucket smooths request starts, and the concurrency limit
+shrinks multiplicatively on 429/5xx and grows additively on success
+(TCP-style AIMD).
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Optional, Dict
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    rate tokens are added per second up to capacity; each request takes one.
+    A rate of 0 disables limiting.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take a token now and return how long the caller must wait before
+        using it (0.0 if one was available). Never blocks.
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self, stop_event: Optional[threading.Event] = None) -> bool:
+        """Block until a token is available. Returns False if stopped while waiting."""
+        wait = self.reserve()
+        if wait <= 0:
+            return True
+        if stop_event is None:
+            time.sleep(wait)
+            return True
+        return not stop_event.wait(wait)
+
+
+class AdaptiveConcurrencyController:
+    """
+    AIMD limit on in-flight requests.
+
+    - on_success(): limit += increase / limit (about +increase per full window)
+    - on_overload(): limit *= decrease_factor, at most once per cooldown so a
+      burst of 429s from one congestion event only halves the limit once
+    """
+
+    def __init__(
+        self,
+        initial_limit: float = 8,
+        min_limit: float = 1,
+        max_limit: float = 64,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        cooldown: float = 1.0,
+        throughput_window: float = 10.0
+    ):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.cooldown = cooldown
+        self.throughput_window = throughput_window
+
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._in_flight = 0
+        self._last_decrease = 0.0
+        self._completions: deque = deque()
+        self._successes = 0
+        self._overloads = 0
+        self._cond = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current whole-number concurrency limit."""
+        return max(int(self.min_limit), int(self._limit))
+
+    def acquire(self, stop_event: Optional[threading.Event] = None) -> bool:
+        """
+        Wait for an in-flight slot. Returns False if stop was requested.
+
+        Polls the stop event every 100ms while waiting.
+        """
+        with self._cond:
+            while self._in_flight >= self.limit:
+                if stop_event is not None and stop_event.is_set():
+                    return False
+                self._cond.wait(timeout=0.1)
+            self._in_flight += 1
+            return True
+
+    def try_acquire(self) -> bool:
+        """Take an in-flight slot if one is free under the current limit."""
+        with self._cond:
+            if self._in_flight >= self.limit:
+                return False
+            self._in_flight += 1
+            return True
+
+    def release(self):
+        """Give back an in-flight slot."""
+        with self._cond:
+            self._in_flight = max(0, self._in_flight - 1)
+            self._cond.notify_all()
+
+    def on_success(self):
+        """Additive increase after a successful response."""
+        with self._cond:
+            self._successes += 1
+            self._record_completion()
+            self._limit = min(self.max_limit, self._limit + self.increase / self._limit)
+            self._cond.notify_all()
+
+    def on_overload(self):
+        """Multiplicative decrease after a 429/5xx/timeout."""
+        with self._cond:
+            self._overloads += 1
+            now = time.monotonic()
+            if now - self._last_decrease >= self.cooldown:
+                self._limit = max(self.min_limit, self._limit * self.decrease_factor)
+                self._last_decrease = now
+
+    def _record_completion(self):
+        """Track success timestamps for the throughput metric (lock held)."""
+        now = time.monotonic()
+        self._completions.append(now)
+        while self._completions and now - self._completions[0] > self.throughput_window:
+            self._completions.popleft()
+
+    def metrics(self) -> Dict[str, float]:
+        """Current limit, in-flight count and observed throughput (req/s)."""
+        with self._cond:
+            now = time.monotonic()
+            while self._completions and now - self._completions[0] > self.throughput_window:
+                self._completions.popleft()
+            return {
+                "concurrency_limit": self.limit,
+                "in_flight": self._in_flight,
+                "throughput_rps": len(self._completions) / self.throughput_window,
+                "successes": self._successes,
+                "overloads": self._overloads
+            }
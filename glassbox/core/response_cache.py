@@ -0,0 +1,200 @@
+"""
+Response Cache - persistent, content-addressed store for LLM responses.
+
+Backed by SQLite in WAL mode so concurrent evaluator threads (and separate
+runs) can share it. Keys are a SHA-256 of model, temperature and the
+normalized message list; by default only deterministic (temperature 0.0)
+calls are cached, which covers every LLM Judge call.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional, List, Dict, Any
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_messages(messages: List[Any]) -> List[Dict[str, str]]:
+    """
+    Reduce Message objects or dicts to [{"role", "text"}] with stripped text.
+
+    String content and Boeing typed content ([{"type": "text", ...}]) map
+    to the same normalized form.
+    """
+    normalized = []
+    for msg in messages:
+        if hasattr(msg, "role"):
+            role, content = msg.role, msg.content
+        else:
+            role, content = msg.get("role", "user"), msg.get("content", "")
+
+        if isinstance(content, list):
+            text = "".join(
+                item.get("text", "")
+                for item in content
+                if isinstance(item, dict) and item.get("type") == "text"
+            )
+        else:
+            text = str(content)
+
+        normalized.append({"role": role, "text": text.strip()})
+    return normalized
+
+
+class ResponseCache:
+    """
+    Disk-backed LLM response cache with TTL and size-based LRU eviction.
+
+    Usage:
+        cache = ResponseCache("~/.glassbox/responses.db")
+        key = cache.make_key("gpt-4o-mini", 0.0, messages)
+        hit = cache.get(key)
+        if hit is None:
+            cache.put(key, content, raw_response)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl_seconds: int = 7 * 24 * 3600,
+        max_bytes: int = 256 * 1024 * 1024,
+        cache_all_temperatures: bool = False
+    ):
+        self.path = os.path.expanduser(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.cache_all_temperatures = cache_all_temperatures
+
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                content TEXT NOT NULL,
+                raw TEXT,
+                size INTEGER NOT NULL,
+                created REAL NOT NULL,
+                accessed REAL NOT NULL
+            )"""
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(model: str, temperature: float, messages: List[Any]) -> str:
+        """Content address for a request: hash of model, temperature and messages."""
+        payload = json.dumps(
+            {
+                "model": model,
+                "temperature": round(float(temperature), 4),
+                "messages": normalize_messages(messages)
+            },
+            sort_keys=True,
+            separators=(",", ":")
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def is_cacheable(self, temperature: float) -> bool:
+        """Only deterministic calls are cached unless configured otherwise."""
+        return self.cache_all_temperatures or temperature == 0.0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response.
+
+        Returns:
+            {"content": str, "raw_response": dict|None} or None on miss/expiry
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content, raw, created FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None or (self.ttl_seconds and now - row[2] > self.ttl_seconds):
+                if row is not None:
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self._conn.commit()
+                self.misses += 1
+                return None
+
+            self._conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+
+        return {
+            "content": row[0],
+            "raw_response": json.loads(row[1]) if row[1] else None
+        }
+
+    def put(self, key: str, content: str, raw_response: Optional[Dict] = None):
+        """Store a successful response and evict least-recently-used entries."""
+        raw = json.dumps(raw_response, default=str) if raw_response is not None else None
+        size = len(content.encode("utf-8")) + (len(raw.encode("utf-8")) if raw else 0)
+        now = time.time()
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, content, raw, size, created, accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, content, raw, size, now, now)
+            )
+            self._evict_locked()
+            self._conn.commit()
+
+    def _evict_locked(self):
+        """Drop oldest-accessed rows until the store fits in max_bytes."""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        rows = self._conn.execute("SELECT key, size FROM responses ORDER BY accessed ASC")
+        to_delete = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            to_delete.append((key,))
+            total -= size
+
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", to_delete)
+        logger.debug(f"Response cache evicted {len(to_delete)} entries")
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters plus current entry count and size."""
+        with self._lock:
+            entries, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": entries,
+                "bytes": total
+            }
+
+    def clear(self):
+        """Remove every cached response."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def close(self):
+        """Close the SQLite connection."""
+        with self._lock:
+            self._conn.close()
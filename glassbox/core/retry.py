@@ -0,0 +1,112 @@
+"""
+Retry Policy - jittered exponential backoff with Retry-After support.
+
+Also provides run_interruptible(), which lets a blocking HTTP call be
+abandoned as soon as the optimizer's stop event fires, so pressing STOP
+takes effect in well under a second instead of after the current request
+and retry sleep finish.
+"""
+
+import random
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+STOP_POLL_INTERVAL = 0.05  # Seconds between stop checks while a call is in flight
+
+
+class RequestCancelled(Exception):
+    """Raised when a stop request abandons an in-flight call."""
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header (delta-seconds or HTTP-date) into seconds.
+
+    Returns None if the header is missing or malformed.
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Pluggable retry policy for the API clients.
+
+    Delays grow as base_delay * 2^attempt up to max_delay. The top `jitter`
+    fraction of each delay is randomized so parallel workers do not retry
+    in lockstep. A server-provided Retry-After overrides the computed delay
+    (capped at max_retry_after).
+    """
+    max_retries: int = 5
+    base_delay: float = 2.0
+    max_delay: float = 32.0
+    jitter: float = 0.5  # 0 = deterministic, 1 = full jitter
+    max_retry_after: float = 120.0
+
+    def should_retry(self, status_code: int) -> bool:
+        """429 and 5xx are transient; everything else is returned to the caller."""
+        return status_code == 429 or status_code >= 500
+
+    def compute_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Seconds to wait before retry number `attempt` (0-based)."""
+        server_delay = parse_retry_after(retry_after)
+        if server_delay is not None:
+            return min(server_delay, self.max_retry_after)
+
+        delay = min(self.base_delay * (2 ** attempt), self.max_delay)
+        jitter_span = delay * self.jitter
+        return delay - jitter_span + random.uniform(0, jitter_span)
+
+
+def run_interruptible(
+    fn: Callable[[], T],
+    stop_event: threading.Event,
+    poll_interval: float = STOP_POLL_INTERVAL
+) -> T:
+    """
+    Run a blocking call on a daemon thread and wait for it, checking
+    stop_event every poll_interval.
+
+    Raises RequestCancelled if stop is requested first; the abandoned call
+    finishes (or times out) in the background and its result is discarded.
+    """
+    outcome = {}
+    done = threading.Event()
+
+    def _worker():
+        try:
+            outcome["result"] = fn()
+        except BaseException as e:
+            outcome["error"] = e
+        finally:
+            done.set()
+
+    threading.Thread(target=_worker, daemon=True, name="glassbox-request").start()
+
+    while not done.wait(poll_interval):
+        if stop_event.is_set():
+            raise RequestCancelled("Request cancelled by user")
+
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
@@ -68,6 +68,11 @@ class S2AEngine(AbstractOptimizer):
         self.session.current_step += 1
         self._pass_number += 1
 
+        # Budget check: filter, response and judge calls for the primary input
+        shortfall = self._budget_shortfall(3)
+        if shortfall:
+            return self._budget_stop_result(self.session.current_step, shortfall)
+
         # Phase 1: Apply filter to get clean context
         self.session.schematic_state = SchematicState.FILTERING
         self.session.active_node = "filter"
@@ -76,7 +81,8 @@ class S2AEngine(AbstractOptimizer):
         raw_context = getattr(self, '_raw_context', self.session.test_bench.input_a)
         query = getattr(self, '_query', self.session.seed_prompt)
 
-        filter_result = self._apply_filter(raw_context, query)
+        with self.telemetry.phase("filtering"):
+            filter_result = self._apply_filter(raw_context, query)
         clean_context = filter_result.get("clean", raw_context)
         filtered_out = filter_result.get("filtered", [])
 
@@ -84,25 +90,28 @@ class S2AEngine(AbstractOptimizer):
         self.session.schematic_state = SchematicState.EVALUATION
         self.session.active_node = "response"
 
-        response = self._generate_response(clean_context, query)
+        with self.telemetry.phase("execution"):
+            response = self._generate_response(clean_context, query)
 
         # Phase 3: Evaluate quality
-        eval_result = self.evaluator.evaluate(
-            self._current_filter_prompt,
-            f"Context: {raw_context}\nQuery: {query}",
-            response
-        )
+        with self.telemetry.phase("judging"):
+            eval_result = self.evaluator.evaluate(
+                self._current_filter_prompt,
+                f"Context: {raw_context}\nQuery: {query}",
+                response
+            )
 
         # Phase 4: Optimize filter (if score is low)
-        if eval_result.score < 80 and self._pass_number < 5:
+        if eval_result.score < 80 and self._pass_number < 5 and not self._budget_shortfall(1):
             self.session.schematic_state = SchematicState.OPTIMIZATION
             self.session.active_node = "optimizer"
             
-            new_filter = self._optimize_filter(
-                eval_result.score,
-                filtered_out,
-                []  # Would track false negatives with ground truth
-            )
+            with self.telemetry.phase("generation"):
+                new_filter = self._optimize_filter(
+                    eval_result.score,
+                    filtered_out,
+                    []  # Would track false negatives with ground truth
+                )
             if new_filter:
                 self._filter_variations.append(new_filter)
                 self._current_filter_prompt = new_filter
@@ -134,27 +143,41 @@ class S2AEngine(AbstractOptimizer):
             }
         )
 
-        # Quick evaluation on other test inputs
-        for label, input_text in [("b", self.session.test_bench.input_b), 
-                                   ("c", self.session.test_bench.input_c)]:
-            key = f"input_{label}"
-            if input_text.strip():
-                try:
+        # Quick evaluation on other test inputs (run concurrently, applied in order)
+        def _evaluate_other_input(item):
+            label, input_text = item
+            try:
+                with self.telemetry.phase("filtering"):
                     filtered = self._apply_filter(input_text, query)
+                with self.telemetry.phase("execution"):
                     resp = self._generate_response(filtered.get("clean", input_text), query)
+                with self.telemetry.phase("judging"):
                     ev = self.evaluator.evaluate(self._current_filter_prompt, input_text, resp)
-                    
-                    candidate.test_results[key] = ev.score
-                    candidate.score_aggregate = (candidate.score_aggregate + ev.score) / 2 # simplified avg
-                    candidate.meta["test_details"]["responses"][key] = resp
-                    candidate.meta["test_details"]["reasoning"][key] = ev.reasoning
-                    
-                except Exception as e:
-                    candidate.test_results[key] = 0.0
-                    candidate.meta["test_details"]["responses"][key] = ""
-                    candidate.meta["test_details"]["reasoning"][key] = f"Error: {e}"
-
-        self.session.candidates.append(candidate)
+                return label, ev.score, resp, ev.reasoning, None
+            except Exception as e:
+                return label, 0.0, "", "", e
+
+        other_inputs = [
+            (label, input_text)
+            for label, input_text in [("b", self.session.test_bench.input_b),
+                                      ("c", self.session.test_bench.input_c)]
+            if input_text.strip()
+        ]
+        other_inputs = self._trim_to_budget(other_inputs, 3)
+
+        for label, score, resp, reasoning, error in self.scheduler.map(_evaluate_other_input, other_inputs):
+            key = f"input_{label}"
+            if error is None:
+                candidate.test_results[key] = score
+                candidate.score_aggregate = (candidate.score_aggregate + score) / 2 # simplified avg
+                candidate.meta["test_details"]["responses"][key] = resp
+                candidate.meta["test_details"]["reasoning"][key] = reasoning
+            else:
+                candidate.test_results[key] = 0.0
+                candidate.meta["test_details"]["responses"][key] = ""
+                candidate.meta["test_details"]["reasoning"][key] = f"Error: {error}"
+
+        self._record_candidate(candidate)
         self._add_trajectory_entry(candidate)
         self.session.winner = self.session.get_best_candidate()
 
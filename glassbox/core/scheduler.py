@@ -0,0 +1,88 @@
+"""
+Evaluation Scheduler - shared worker pool for candidate evaluation.
+
+Engines submit their per-step candidates here instead of looping serially,
+so a step's wall-clock is bounded by the slowest candidate rather than the
+sum of all of them.
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Sequence, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_SKIPPED = object()  # Marker for work items dropped after a stop request
+
+
+class EvaluationScheduler:
+    """
+    Bounded worker pool that honours the optimizer's stop signal.
+
+    Usage:
+        scheduler = EvaluationScheduler(max_workers=4, stop_event=stop_event)
+        candidates = scheduler.map(evaluate_fn, prompts)
+    """
+
+    def __init__(self, max_workers: int, stop_event: threading.Event):
+        self.max_workers = max(1, max_workers)
+        self._stop_event = stop_event
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Create the worker pool on first use."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="glassbox-eval"
+                )
+            return self._executor
+
+    def map(self, fn: Callable[[T], R], items: Sequence[T]) -> List[R]:
+        """
+        Apply fn to every item concurrently.
+
+        Results come back in submission order. Items that had not started
+        when stop was requested are dropped, mirroring the serial loops'
+        "break on stop" behaviour. The first exception raised by fn is
+        re-raised after all started items finish.
+        """
+        if not items:
+            return []
+
+        def _guarded(item: T):
+            if self._stop_event.is_set():
+                return _SKIPPED
+            return fn(item)
+
+        executor = self._get_executor()
+        futures = [executor.submit(_guarded, item) for item in items]
+
+        results = []
+        error: Optional[BaseException] = None
+        for future in futures:
+            try:
+                result = future.result()
+            except Exception as e:
+                logger.error(f"Scheduled evaluation failed: {e}")
+                error = error or e
+                continue
+            if result is not _SKIPPED:
+                results.append(result)
+
+        if error is not None:
+            raise error
+        return results
+
+    def shutdown(self):
+        """Release worker threads; the pool is rebuilt on next use."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,213 @@
+"""
+Telemetry - per-phase instrumentation of LLM calls.
+
+AbstractOptimizer wraps its API client in an InstrumentedClient. Every
+send_message is attributed to the phase the calling thread is in (set with
+TelemetryRecorder.phase()) and timed, with retries, token counts and
+overlap with other in-flight calls. At the end of a step the recorder
+folds this into a StepTelemetry.
+
+Token counts come from the gateway's "usage" block when present and are
+otherwise estimated at ~4 characters per token.
+"""
+
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from glassbox.models.telemetry import PhaseStats, StepTelemetry
+
+OTHER_PHASE = "other"
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for text (no tokenizer dependency)."""
+    if not text:
+        return 0
+    return max(1, (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN)
+
+
+def _message_text(message: Any) -> str:
+    content = message.get("content", "") if isinstance(message, dict) else getattr(message, "content", "")
+    if isinstance(content, list):  # Boeing typed content
+        return "".join(part.get("text", "") for part in content if isinstance(part, dict))
+    return content if isinstance(content, str) else ""
+
+
+def count_message_tokens(messages: List[Any]) -> int:
+    """Estimated input tokens for a request."""
+    return sum(estimate_tokens(_message_text(m)) for m in messages)
+
+
+def _usage_tokens(response: Any) -> Optional[Tuple[int, int]]:
+    """(input, output) tokens reported by the gateway, if any."""
+    raw = getattr(response, "raw_response", None)
+    usage = raw.get("usage") if isinstance(raw, dict) else None
+    if not isinstance(usage, dict):
+        return None
+    try:
+        return int(usage.get("prompt_tokens", 0)), int(usage.get("completion_tokens", 0))
+    except (TypeError, ValueError):
+        return None
+
+
+def _union_length(intervals: List[Tuple[float, float]]) -> float:
+    """Total length covered by possibly overlapping intervals."""
+    total = 0.0
+    current_start = current_end = None
+    for start, end in sorted(intervals):
+        if current_end is None or start > current_end:
+            if current_end is not None:
+                total += current_end - current_start
+            current_start, current_end = start, end
+        else:
+            current_end = max(current_end, end)
+    if current_end is not None:
+        total += current_end - current_start
+    return total
+
+
+class TelemetryRecorder:
+    """
+    Collects call and phase timings for the current step (thread-safe).
+
+    Usage:
+        recorder.begin_step()
+        with recorder.phase("generation"):
+            client.send_message(...)   # via InstrumentedClient
+        step_telemetry = recorder.end_step(step_number)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._ids = itertools.count()
+        self._in_flight: Dict[int, Dict[str, Any]] = {}
+        self.total_calls = 0  # Lifetime counters (not reset per step), read by BudgetTracker
+        self.total_tokens = 0
+        self.total_cache_hits = 0
+        self._reset()
+
+    def _reset(self):
+        self._step_start = time.perf_counter()
+        self._phases: Dict[str, PhaseStats] = {}
+        self._intervals: Dict[str, List[Tuple[float, float]]] = {}
+        self._overlaps: Dict[str, int] = {}
+
+    def begin_step(self):
+        """Start collecting a new step."""
+        with self._lock:
+            self._reset()
+
+    def end_step(self, step_number: int) -> StepTelemetry:
+        """Fold everything recorded since begin_step into a StepTelemetry."""
+        with self._lock:
+            for name, intervals in self._intervals.items():
+                self._phases.setdefault(name, PhaseStats()).wall_time_s = _union_length(intervals)
+            telemetry = StepTelemetry(
+                step=step_number,
+                wall_time_s=time.perf_counter() - self._step_start,
+                phases=self._phases,
+                overlaps=self._overlaps
+            )
+            self._reset()
+        return telemetry
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Attribute calls made by this thread inside the block to `name`."""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            stack.pop()
+            with self._lock:
+                self._intervals.setdefault(name, []).append((start, time.perf_counter()))
+
+    def current_phase(self) -> str:
+        stack = getattr(self._local, "stack", None)
+        return stack[-1] if stack else OTHER_PHASE
+
+    def call_started(self, phase: str) -> int:
+        """Register an in-flight call; returns a token for call_finished."""
+        with self._lock:
+            call_id = next(self._ids)
+            call = {"phase": phase, "start": time.perf_counter(), "overlapped": False}
+            for other in self._in_flight.values():
+                other["overlapped"] = call["overlapped"] = True
+                pair = "|".join(sorted((phase, other["phase"])))
+                self._overlaps[pair] = self._overlaps.get(pair, 0) + 1
+            self._in_flight[call_id] = call
+            stats = self._phases.setdefault(phase, PhaseStats())
+            stats.peak_concurrency = max(stats.peak_concurrency, len(self._in_flight))
+        return call_id
+
+    def call_finished(self, call_id: int, response: Any, input_tokens: int):
+        """
+        Record a completed call's latency, retries, tokens and outcome.
+
+        Responses served by a response cache or cassette (response.cached)
+        cost nothing: they are counted as cache hits, not as calls or tokens,
+        so they never draw down the run budget.
+        """
+        end = time.perf_counter()
+        if getattr(response, "cached", False) is True:
+            with self._lock:
+                call = self._in_flight.pop(call_id)
+                self._phases.setdefault(call["phase"], PhaseStats()).cache_hits += 1
+                self.total_cache_hits += 1
+            return
+
+        usage = _usage_tokens(response)
+        if usage is not None:
+            input_tokens, output_tokens = usage
+        else:
+            content = getattr(response, "content", "")
+            output_tokens = estimate_tokens(content if isinstance(content, str) else "")
+        retries = getattr(response, "retries", 0)
+
+        with self._lock:
+            call = self._in_flight.pop(call_id)
+            stats = self._phases.setdefault(call["phase"], PhaseStats())
+            stats.calls += 1
+            stats.retries += retries if isinstance(retries, int) else 0
+            stats.failures += 0 if getattr(response, "success", False) else 1
+            stats.input_tokens += input_tokens
+            stats.output_tokens += output_tokens
+            stats.call_time_s += end - call["start"]
+            stats.overlapped_calls += 1 if call["overlapped"] else 0
+            self.total_calls += 1
+            self.total_tokens += input_tokens + output_tokens
+            self._intervals.setdefault(call["phase"], []).append((call["start"], end))
+
+
+class InstrumentedClient:
+    """
+    API client proxy that reports every send_message to a TelemetryRecorder.
+
+    All other attributes (config, request_stop, health_check, ...) are
+    delegated to the wrapped client.
+    """
+
+    def __init__(self, client: Any, recorder: TelemetryRecorder):
+        self.client = client
+        self.recorder = recorder
+
+    def __getattr__(self, name: str):
+        return getattr(self.__dict__["client"], name)
+
+    def send_message(self, messages: List[Any], *args, **kwargs):
+        call_id = self.recorder.call_started(self.recorder.current_phase())
+        response = None
+        try:
+            response = self.client.send_message(messages, *args, **kwargs)
+            return response
+        finally:
+            self.recorder.call_finished(call_id, response, count_message_tokens(messages))
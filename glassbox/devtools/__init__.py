@@ -0,0 +1,16 @@
+# Developer tools package (offline test doubles, not used by the app)
+from glassbox.devtools.mock_gateway import (
+    MockGateway,
+    MockGatewayConfig,
+    LatencyProfile,
+    FaultProfile,
+    ScriptedResponse,
+)
+
+__all__ = [
+    "MockGateway",
+    "MockGatewayConfig",
+    "LatencyProfile",
+    "FaultProfile",
+    "ScriptedResponse",
+]
@@ -0,0 +1,442 @@
+"""
+Mock Boeing AI Gateway - local stand-in for bcai-public-api/conversation.
+
+Speaks the request/response schema BoeingAPIClient expects so the real HTTP
+path (pooling, retries, rate limiting, parsing fallbacks) can be exercised
+offline. Latency, error injection and scripted replies are configurable.
+
+Usage:
+    with MockGateway(MockGatewayConfig(faults=FaultProfile(rate_429=0.1))) as gateway:
+        client = BoeingAPIClient(APIConfig(base_url=gateway.url))
+        ...
+        print(gateway.stats())
+
+Or from the command line:
+    python -m glassbox.devtools.mock_gateway --port 8089 --latency lognormal:0.8:0.3 --rate-5xx 0.05
+"""
+
+import argparse
+import json
+import logging
+import math
+import random
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Fields the gateway rejects requests without (Boeing spec 1.3)
+REQUIRED_FIELDS = (
+    "model",
+    "conversation_guid",
+    "stream",
+    "skip_db_save",
+    "conversation_mode",
+    "temperature",
+    "messages",
+)
+
+SSO_HTML_PAGE = (
+    "<!DOCTYPE html><html><head><title>Boeing Sign In</title></head>"
+    "<body><form action=\"/idp/SSO.saml2\" method=\"post\">"
+    "<p>Please sign in to continue.</p></form></body></html>"
+)
+
+
+@dataclass
+class LatencyProfile:
+    """
+    Per-request service time in seconds.
+
+    distribution: "fixed", "uniform" (mean +/- spread), "normal" (stddev =
+    spread), "lognormal" (median = mean, sigma = spread) or "exponential".
+    Samples are clamped to [minimum, maximum].
+    """
+    distribution: str = "fixed"
+    mean: float = 0.0
+    spread: float = 0.0
+    minimum: float = 0.0
+    maximum: float = 60.0
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw one latency."""
+        if self.distribution == "uniform":
+            value = rng.uniform(self.mean - self.spread, self.mean + self.spread)
+        elif self.distribution == "normal":
+            value = rng.gauss(self.mean, self.spread)
+        elif self.distribution == "lognormal":
+            value = rng.lognormvariate(math.log(self.mean), self.spread) if self.mean > 0 else 0.0
+        elif self.distribution == "exponential":
+            value = rng.expovariate(1.0 / self.mean) if self.mean > 0 else 0.0
+        else:
+            value = self.mean
+        return min(self.maximum, max(self.minimum, value))
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyProfile":
+        """Build from "distribution:mean[:spread]", e.g. "lognormal:0.8:0.3"."""
+        parts = spec.split(":")
+        return cls(
+            distribution=parts[0],
+            mean=float(parts[1]) if len(parts) > 1 else 0.0,
+            spread=float(parts[2]) if len(parts) > 2 else 0.0
+        )
+
+
+@dataclass
+class FaultProfile:
+    """
+    Random error injection. Rates are independent probabilities checked in
+    the order timeout, HTML, 429, 5xx.
+    """
+    rate_5xx: float = 0.0
+    rate_429: float = 0.0
+    rate_html: float = 0.0  # SSO interception page with a 200 status
+    rate_timeout: float = 0.0  # Hold the connection for timeout_seconds
+    server_error_status: int = 503
+    retry_after: Optional[str] = None  # Retry-After header on 429/5xx
+    timeout_seconds: float = 120.0
+
+
+@dataclass
+class ScriptedResponse:
+    """One canned gateway reply, consumed in order or matched by substring."""
+    content: Union[str, List[Dict[str, str]]] = ""
+    status: int = 200
+    headers: Dict[str, str] = field(default_factory=dict)
+    html: bool = False
+    delay: Optional[float] = None  # Overrides the latency profile
+
+
+@dataclass
+class MockGatewayConfig:
+    """Configuration for the mock gateway."""
+    host: str = "127.0.0.1"
+    port: int = 0  # 0 = pick a free port
+    endpoint: str = "/bcai-public-api/conversation"
+    latency: LatencyProfile = field(default_factory=LatencyProfile)
+    faults: FaultProfile = field(default_factory=FaultProfile)
+    response_shape: str = "messages"  # "messages", "message" or "alternate"
+    list_content: bool = False  # Return [{"type": "text", "text": ...}] content
+    require_auth: bool = True
+    validate_schema: bool = True
+    default_reply: str = "Mock gateway response."
+    seed: Optional[int] = None
+
+
+Responder = Callable[[Dict[str, Any]], str]
+
+
+class MockGateway:
+    """
+    Threaded HTTP server imitating the Boeing AI Gateway.
+
+    Reply precedence for a valid request: queued script entries (FIFO), then
+    substring rules (first match on the last user message), then the
+    responder callable, then config.default_reply. Random faults are only
+    injected for unscripted requests.
+    """
+
+    def __init__(
+        self,
+        config: Optional[MockGatewayConfig] = None,
+        responder: Optional[Responder] = None
+    ):
+        self.config = config or MockGatewayConfig()
+        self.responder = responder
+
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._closing = threading.Event()
+        self._script: Deque[ScriptedResponse] = deque()
+        self._rules: List[Tuple[str, ScriptedResponse]] = []
+
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+        self.requests: List[Dict[str, Any]] = []  # Decoded request bodies
+        self._status_counts: Counter = Counter()
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._connections = 0
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> "MockGateway":
+        """Start serving on a daemon thread."""
+        gateway = self
+
+        class _Handler(_GatewayHandler):
+            pass
+
+        _Handler.gateway = gateway
+        self._closing.clear()
+        self._server = ThreadingHTTPServer((self.config.host, self.config.port), _Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            daemon=True,
+            name="glassbox-mock-gateway"
+        )
+        self._thread.start()
+        logger.info(f"Mock gateway listening on {self.url}")
+        return self
+
+    def stop(self):
+        """Stop serving and release held (timeout) connections."""
+        self._closing.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "MockGateway":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        """Base URL to put in APIConfig.base_url."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    # ------------------------------------------------------------------
+    # Scripting
+    # ------------------------------------------------------------------
+
+    def enqueue(self, *responses: Union[str, ScriptedResponse]):
+        """Queue replies served to the next requests, in order."""
+        with self._lock:
+            for response in responses:
+                if isinstance(response, str):
+                    response = ScriptedResponse(content=response)
+                self._script.append(response)
+
+    def when(self, substring: str, response: Union[str, ScriptedResponse]):
+        """Reply with `response` whenever the last user message contains substring."""
+        if isinstance(response, str):
+            response = ScriptedResponse(content=response)
+        with self._lock:
+            self._rules.append((substring, response))
+
+    def stats(self) -> Dict[str, Any]:
+        """Request counts by status, peak concurrency and TCP connections seen."""
+        with self._lock:
+            return {
+                "requests": len(self.requests),
+                "status_counts": dict(self._status_counts),
+                "peak_in_flight": self._peak_in_flight,
+                "connections": self._connections
+            }
+
+    # ------------------------------------------------------------------
+    # Request handling (called from handler threads)
+    # ------------------------------------------------------------------
+
+    def _choose_reply(self, body: Dict[str, Any]) -> Tuple[Optional[ScriptedResponse], bool]:
+        """Pick the reply for a request. Returns (reply, scripted)."""
+        last_user = _last_user_text(body.get("messages", []))
+        with self._lock:
+            if self._script:
+                return self._script.popleft(), True
+            for substring, response in self._rules:
+                if substring in last_user:
+                    return response, True
+
+        if self.responder is not None:
+            return ScriptedResponse(content=self.responder(body)), False
+        return ScriptedResponse(content=self.config.default_reply), False
+
+    def _inject_fault(self) -> Optional[str]:
+        """Roll for a random fault: "timeout", "html", "429", "5xx" or None."""
+        faults = self.config.faults
+        with self._lock:
+            for kind, rate in (
+                ("timeout", faults.rate_timeout),
+                ("html", faults.rate_html),
+                ("429", faults.rate_429),
+                ("5xx", faults.rate_5xx),
+            ):
+                if rate > 0 and self._rng.random() < rate:
+                    return kind
+        return None
+
+    def _sample_latency(self) -> float:
+        with self._lock:
+            return self.config.latency.sample(self._rng)
+
+    def _build_body(self, content: Union[str, List[Dict[str, str]]], turn: int) -> Dict[str, Any]:
+        """Success payload in the configured choices shape."""
+        if isinstance(content, str) and self.config.list_content:
+            content = [{"type": "text", "text": content}]
+        message = {"role": "assistant", "content": content}
+
+        shape = self.config.response_shape
+        if shape == "alternate":
+            shape = "messages" if turn % 2 == 0 else "message"
+
+        choice = {"messages": [message]} if shape == "messages" else {"message": message}
+        return {"choices": [choice]}
+
+
+class _GatewayHandler(BaseHTTPRequestHandler):
+    """HTTP handler; the MockGateway instance is attached per server."""
+
+    gateway: MockGateway = None
+    protocol_version = "HTTP/1.1"  # Keep-alive, so client pooling is observable
+
+    def setup(self):
+        super().setup()
+        with self.gateway._lock:
+            self.gateway._connections += 1
+
+    def do_POST(self):
+        gateway = self.gateway
+        length = int(self.headers.get("Content-Length", 0))
+        raw = self.rfile.read(length) if length else b""
+
+        if self.path != gateway.config.endpoint:
+            self._send_json(404, {"error": f"Unknown endpoint {self.path}"})
+            return
+
+        if gateway.config.require_auth and not self.headers.get("Authorization", "").startswith("Basic "):
+            self._send_json(401, {"error": "Missing or invalid PAT"})
+            return
+
+        try:
+            body = json.loads(raw or b"{}")
+        except json.JSONDecodeError:
+            self._send_json(400, {"error": "Invalid JSON body"})
+            return
+
+        if gateway.config.validate_schema:
+            missing = [name for name in REQUIRED_FIELDS if name not in body]
+            if missing or body.get("stream") is not False:
+                self._send_json(400, {"error": f"Schema violation: missing {missing}"})
+                return
+
+        with gateway._lock:
+            turn = len(gateway.requests)
+            gateway.requests.append(body)
+            gateway._in_flight += 1
+            gateway._peak_in_flight = max(gateway._peak_in_flight, gateway._in_flight)
+
+        try:
+            self._respond(gateway, body, turn)
+        finally:
+            with gateway._lock:
+                gateway._in_flight -= 1
+
+    def _respond(self, gateway: MockGateway, body: Dict[str, Any], turn: int):
+        reply, scripted = gateway._choose_reply(body)
+        fault = None if scripted else gateway._inject_fault()
+        faults = gateway.config.faults
+
+        delay = reply.delay if reply.delay is not None else gateway._sample_latency()
+        if fault == "timeout":
+            delay = faults.timeout_seconds
+        if delay > 0 and gateway._closing.wait(delay):
+            self.close_connection = True  # Server stopping - drop the held connection
+            return
+
+        retry_headers = {"Retry-After": faults.retry_after} if faults.retry_after else {}
+        if fault == "html" or reply.html:
+            self._send(200, SSO_HTML_PAGE.encode("utf-8"), "text/html; charset=utf-8")
+        elif fault == "429":
+            self._send_json(429, {"error": "Too Many Requests"}, retry_headers)
+        elif fault == "5xx":
+            self._send_json(faults.server_error_status, {"error": "Upstream unavailable"}, retry_headers)
+        elif reply.status != 200:
+            self._send_json(reply.status, {"error": "Scripted error"}, reply.headers)
+        else:
+            self._send_json(200, gateway._build_body(reply.content, turn), reply.headers)
+
+    def _send_json(self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None):
+        self._send(status, json.dumps(payload).encode("utf-8"), "application/json", headers)
+
+    def _send(self, status: int, data: bytes, content_type: str, headers: Optional[Dict[str, str]] = None):
+        with self.gateway._lock:
+            self.gateway._status_counts[status] += 1
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+
+def _last_user_text(messages: List[Dict[str, Any]]) -> str:
+    """Text of the last user message (string or typed-list content)."""
+    for message in reversed(messages):
+        if message.get("role") != "user":
+            continue
+        content = message.get("content", "")
+        if isinstance(content, list):
+            return "".join(
+                item.get("text", "") for item in content
+                if isinstance(item, dict) and item.get("type") == "text"
+            )
+        return str(content)
+    return ""
+
+
+def main(argv: Optional[List[str]] = None):
+    """Run the mock gateway until interrupted."""
+    parser = argparse.ArgumentParser(description="Local mock of the Boeing AI Gateway")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency", default="fixed:0", help="distribution:mean[:spread] in seconds")
+    parser.add_argument("--rate-5xx", type=float, default=0.0)
+    parser.add_argument("--rate-429", type=float, default=0.0)
+    parser.add_argument("--rate-html", type=float, default=0.0)
+    parser.add_argument("--rate-timeout", type=float, default=0.0)
+    parser.add_argument("--retry-after", default=None, help="Retry-After header on 429/5xx")
+    parser.add_argument("--shape", default="messages", choices=["messages", "message", "alternate"])
+    parser.add_argument("--list-content", action="store_true")
+    parser.add_argument("--reply", default=MockGatewayConfig.default_reply)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    config = MockGatewayConfig(
+        host=args.host,
+        port=args.port,
+        latency=LatencyProfile.parse(args.latency),
+        faults=FaultProfile(
+            rate_5xx=args.rate_5xx,
+            rate_429=args.rate_429,
+            rate_html=args.rate_html,
+            rate_timeout=args.rate_timeout,
+            retry_after=args.retry_after
+        ),
+        response_shape=args.shape,
+        list_content=args.list_content,
+        default_reply=args.reply,
+        seed=args.seed
+    )
+
+    logging.basicConfig(level=logging.INFO)
+    gateway = MockGateway(config).start()
+    print(f"Mock gateway at {gateway.url}{config.endpoint} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        gateway.stop()
+
+
+if __name__ == "__main__":
+    main()
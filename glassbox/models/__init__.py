@@ -4,6 +4,7 @@ from glassbox.models.session import (
     TrajectoryEntry,
     TestBenchConfig,
     SessionConfig,
+    RunBudget,
     SessionMetadata,
     OptimizerSession
 )
@@ -13,6 +14,10 @@ from glassbox.models.candidate import (
     EngineType
 )
 
+from glassbox.models.memo import ExecutionMemo, canonicalize_prompt
+from glassbox.models.telemetry import PhaseStats, StepTelemetry, RunTelemetry
+from glassbox.models.lineage import FitnessCache, FitnessRecord, LineageStore, prompt_key
+
 __all__ = [
     "EngineType",
     "SchematicState", 
@@ -20,6 +25,16 @@ __all__ = [
     "TestBenchConfig",
     "UnifiedCandidate",
     "SessionConfig",
+    "RunBudget",
     "SessionMetadata",
-    "OptimizerSession"
+    "OptimizerSession",
+    "ExecutionMemo",
+    "canonicalize_prompt",
+    "PhaseStats",
+    "StepTelemetry",
+    "RunTelemetry",
+    "FitnessCache",
+    "FitnessRecord",
+    "LineageStore",
+    "prompt_key"
 ]
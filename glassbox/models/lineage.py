@@ -0,0 +1,236 @@
+"""
+Lineage Models - Promptbreeder fitness cache and family tree.
+
+Both live on OptimizerSession and are serialized with the .opro file:
+
+- FitnessCache maps a stable hash of a prompt's text to its per-input
+  scores, so a prompt is scored on each test input once per session however
+  many units carry it (clones, migrants, children that reproduce an earlier
+  prompt, or a reloaded run) and survivors keep accumulating scores across
+  generations instead of being re-scored.
+- LineageStore records every unit's parents by unit ID, with children,
+  depth and root precomputed on insert so parent/child/root lookups are
+  dictionary reads.
+"""
+
+import hashlib
+import threading
+from collections import deque
+from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence
+
+from glassbox.models.memo import canonicalize_prompt
+
+NEUTRAL_SCORE = 50.0  # Judge-scale midpoint assumed for inputs a prompt has not been scored on
+
+
+def prompt_key(prompt: str) -> str:
+    """Stable (cross-process) hash of a prompt's canonical text."""
+    return hashlib.sha256(canonicalize_prompt(prompt).encode("utf-8")).hexdigest()[:32]
+
+
+def input_signature(name: str, text: str) -> str:
+    """Score key for a test input: its slot plus a hash of its text, so
+    editing an input does not reuse scores earned on the old text."""
+    return f"{name}:{prompt_key(text)[:12]}"
+
+
+def bench_fingerprint(signatures: Iterable[str]) -> str:
+    """Stable hash of a test bench's input signatures (order-independent)."""
+    return hashlib.sha256("\n".join(sorted(signatures)).encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class FitnessRecord:
+    """Cached fitness of one prompt."""
+    fitness: float
+    generation: int = 0  # Generation it was first scored in
+    scores: Dict[str, float] = field(default_factory=dict)  # input_signature -> judge score
+    pruned: bool = False  # Racing stopped scoring it
+    pruned_bench: str = ""  # bench_fingerprint the pruning applies to
+
+    def mean(self, signatures: Optional[Iterable[str]] = None) -> Optional[float]:
+        """Mean score over `signatures` (default: all); None if none are scored."""
+        keys = self.scores if signatures is None else [s for s in signatures if s in self.scores]
+        if not keys:
+            return None
+        return sum(self.scores[k] for k in keys) / len(keys)
+
+    def estimate(self, signatures: Sequence[str], prior: float = NEUTRAL_SCORE) -> Optional[float]:
+        """
+        Fitness over `signatures` with each unscored input counted at
+        `prior`, so a prompt scored on fewer inputs is pulled towards the
+        prior instead of ranking level with a fully scored one. Equals
+        mean() once every input is scored; None if none are.
+        """
+        scored = [self.scores[s] for s in signatures if s in self.scores]
+        if not scored:
+            return None
+        return (sum(scored) + prior * (len(signatures) - len(scored))) / len(signatures)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FitnessRecord":
+        return cls(**{k: data[k] for k in cls.__dataclass_fields__ if k in data})
+
+
+class FitnessCache:
+    """
+    Thread-safe prompt-hash -> FitnessRecord map with hit/miss counters.
+
+    Usage:
+        record = cache.get(key)
+        if record is None:
+            cache.put(key, FitnessRecord(fitness=score, generation=g))
+    """
+
+    def __init__(self):
+        self._records: Dict[str, FitnessRecord] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._records
+
+    def peek(self, key: str) -> Optional[FitnessRecord]:
+        """get() without touching the hit/miss counters."""
+        with self._lock:
+            return self._records.get(key)
+
+    def get(self, key: str) -> Optional[FitnessRecord]:
+        with self._lock:
+            record = self._records.get(key)
+            if record is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return record
+
+    def put(self, key: str, record: FitnessRecord):
+        with self._lock:
+            self._records[key] = record
+
+    def clear(self):
+        with self._lock:
+            self._records.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._records)}
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {key: record.to_dict() for key, record in self._records.items()}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FitnessCache":
+        cache = cls()
+        cache._records = {key: FitnessRecord.from_dict(record) for key, record in data.items()}
+        return cache
+
+
+class LineageStore:
+    """
+    Unit family tree indexed by unit ID.
+
+    parents, children, depth and root are O(1) lookups. ancestors() walks
+    the tree once per unit and memoizes the result, so repeated ancestry
+    checks (is_ancestor) are O(1) as well.
+    """
+
+    def __init__(self):
+        self._parents: Dict[str, List[str]] = {}
+        self._children: Dict[str, List[str]] = {}
+        self._generation: Dict[str, int] = {}
+        self._depth: Dict[str, int] = {}
+        self._root: Dict[str, str] = {}
+        self._ancestors: Dict[str, FrozenSet[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._parents)
+
+    def __contains__(self, unit_id: str) -> bool:
+        return unit_id in self._parents
+
+    def add(self, unit_id: str, parent_ids: Sequence[str] = (), generation: int = 0):
+        """Record a unit; re-adding an ID (a new run reusing it) replaces the entry."""
+        if unit_id in self._parents:
+            for parent in self._parents[unit_id]:
+                siblings = self._children.get(parent, [])
+                if unit_id in siblings:
+                    siblings.remove(unit_id)
+            self._ancestors.clear()
+
+        parents = [p for p in parent_ids if p != unit_id]
+        self._parents[unit_id] = parents
+        self._children.setdefault(unit_id, [])
+        self._generation[unit_id] = generation
+        for parent in parents:
+            self._children.setdefault(parent, []).append(unit_id)
+
+        known = [p for p in parents if p in self._depth]
+        self._depth[unit_id] = 1 + max(self._depth[p] for p in known) if known else 0
+        self._root[unit_id] = self._root.get(parents[0], parents[0]) if parents else unit_id
+
+    def parents(self, unit_id: str) -> List[str]:
+        return list(self._parents.get(unit_id, []))
+
+    def children(self, unit_id: str) -> List[str]:
+        return list(self._children.get(unit_id, []))
+
+    def generation(self, unit_id: str) -> Optional[int]:
+        return self._generation.get(unit_id)
+
+    def depth(self, unit_id: str) -> int:
+        """Generations of recorded ancestry above the unit (0 for a seed unit)."""
+        return self._depth.get(unit_id, 0)
+
+    def root(self, unit_id: str) -> str:
+        """Initial-population ancestor along first parents."""
+        return self._root.get(unit_id, unit_id)
+
+    def ancestors(self, unit_id: str) -> FrozenSet[str]:
+        """Every recorded ancestor of the unit (memoized)."""
+        cached = self._ancestors.get(unit_id)
+        if cached is not None:
+            return cached
+        seen = set()
+        queue = deque(self._parents.get(unit_id, []))
+        while queue:
+            parent = queue.popleft()
+            if parent in seen:
+                continue
+            seen.add(parent)
+            known = self._ancestors.get(parent)
+            if known is not None:
+                seen.update(known)
+            else:
+                queue.extend(self._parents.get(parent, []))
+        result = self._ancestors[unit_id] = frozenset(seen)
+        return result
+
+    def is_ancestor(self, ancestor_id: str, unit_id: str) -> bool:
+        return ancestor_id in self.ancestors(unit_id)
+
+    def clear(self):
+        self.__init__()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            unit_id: {"parents": parents, "generation": self._generation[unit_id]}
+            for unit_id, parents in self._parents.items()
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LineageStore":
+        store = cls()
+        for unit_id, entry in data.items():  # Insertion order: parents before children
+            store.add(unit_id, entry.get("parents", []), entry.get("generation", 0))
+        return store
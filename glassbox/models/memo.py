@@ -0,0 +1,77 @@
+"""
+Execution Memo - in-session LRU memo of executor outputs and judge results.
+
+Lives on OptimizerSession (not serialized) so every engine run against the
+same session shares it: a prompt that OPro, APE or Promptbreeder already
+evaluated is not re-executed or re-judged.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def canonicalize_prompt(prompt: str) -> str:
+    """Collapse whitespace so whitespace-equivalent prompts share a memo key."""
+    return _WHITESPACE.sub(" ", prompt).strip()
+
+
+class ExecutionMemo:
+    """
+    Thread-safe bounded LRU with hit/miss counters.
+
+    Keys are tuples built by the optimizer, e.g.
+    ("exec", canonical_prompt, input_text, model, temperature).
+    """
+
+    def __init__(self, max_entries: int = 2048):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the memoized value (refreshing its recency) or None."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, value: Any):
+        """Store a value, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and current size for the UI."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries)
+            }
+
+    def clear(self):
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Membership test that does not touch recency or hit/miss counters."""
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -13,6 +13,9 @@ import uuid
 
 
 from glassbox.models.candidate import UnifiedCandidate, EngineType
+from glassbox.models.memo import ExecutionMemo
+from glassbox.models.telemetry import RunTelemetry
+from glassbox.models.lineage import FitnessCache, LineageStore
 
 class SchematicState(Enum):
     """Visual states for the Glass Box schematic."""
@@ -50,6 +53,33 @@ class TestBenchConfig:
         }
 
 
+@dataclass
+class RunBudget:
+    """Per-run limits on LLM usage (0 = unlimited)."""
+    max_calls: int = 0  # LLM calls per run
+    max_tokens: int = 0  # Input + output tokens per run
+    deadline_s: float = 0.0  # Wall-clock seconds per run
+
+    @property
+    def is_limited(self) -> bool:
+        return bool(self.max_calls or self.max_tokens or self.deadline_s)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "max_calls": self.max_calls,
+            "max_tokens": self.max_tokens,
+            "deadline_s": self.deadline_s
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'RunBudget':
+        return cls(
+            max_calls=data.get('max_calls', 0),
+            max_tokens=data.get('max_tokens', 0),
+            deadline_s=data.get('deadline_s', 0.0)
+        )
+
+
 @dataclass
 class SessionConfig:
     """Runtime configuration for optimization session."""
@@ -60,6 +90,63 @@ class SessionConfig:
     noise_level: float = 0.0  # RAG noise injection (0-1)
     top_k: int = 5  # RAG retrieval count
     vector_store_path: str = ""
+    max_parallel_inputs: int = 3  # Concurrent A/B/C pipelines per candidate
+    eval_workers: int = 4  # Candidates evaluated concurrently per step
+    memo_max_entries: int = 2048  # In-session executor/judge memo (LRU)
+    batch_judging: bool = False  # One listwise judge call per input per step
+    evaluation_strategy: str = "full"  # "full", "racing" (prune on partial scores) or "best_arm" (APE: adaptive allocation)
+    pipelined_generation: bool = False  # OPro: generate step n+1 while step n is still being scored (not with racing or islands)
+    pipeline_trigger: int = 1  # Scored candidates needed before the speculative generation starts
+    opro_islands: int = 1  # OPro: independent chains run concurrently (1 = classic single chain)
+    island_temperatures: List[float] = field(default_factory=list)  # Per-chain temperature (default: spread around temperature)
+    migration_interval: int = 2  # Steps between island migrations (OPro: into session.trajectory; Promptbreeder: ring)
+    meta_prompt_token_budget: int = 1200  # OPro history tokens per generation call (0 = last 5, truncated)
+    meta_prompt_max_entries: int = 20  # Most history prompts shown
+    meta_prompt_diversity: float = 0.3  # History selection: 0 = by score only, 1 = by novelty only
+    population_size: int = 8  # Promptbreeder units across all islands
+    max_generations: int = 10  # Promptbreeder generation cap (0 = until stopped)
+    breeder_islands: int = 1  # Promptbreeder sub-populations with ring migration
+    tournament_size: int = 2  # Promptbreeder contestants per parent selection
+    fitness_minibatch: int = 1  # Promptbreeder: new test inputs scored per unit per generation (0 = all)
+    mutation_selection: str = "ucb"  # Promptbreeder operator/direction choice: "ucb", "thompson" or "random"
+    bandit_exploration: float = 0.2  # UCB exploration weight
+    best_arm_confidence: float = 0.95  # APE best_arm: stop once the winner is separated at this confidence
+    induction_subsets: int = 1  # APE: concurrent induction calls on sampled example subsets (1 = first three only)
+    budget: RunBudget = field(default_factory=RunBudget)  # Enforced by AbstractOptimizer.run
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "model": self.model,
+            "temperature": self.temperature,
+            "generations_per_step": self.generations_per_step,
+            "stop_score_threshold": self.stop_score_threshold,
+            "noise_level": self.noise_level,
+            "top_k": self.top_k,
+            "vector_store_path": self.vector_store_path,
+            "max_parallel_inputs": self.max_parallel_inputs,
+            "eval_workers": self.eval_workers,
+            "memo_max_entries": self.memo_max_entries,
+            "batch_judging": self.batch_judging,
+            "evaluation_strategy": self.evaluation_strategy,
+            "pipelined_generation": self.pipelined_generation,
+            "pipeline_trigger": self.pipeline_trigger,
+            "opro_islands": self.opro_islands,
+            "island_temperatures": list(self.island_temperatures),
+            "migration_interval": self.migration_interval,
+            "meta_prompt_token_budget": self.meta_prompt_token_budget,
+            "meta_prompt_max_entries": self.meta_prompt_max_entries,
+            "meta_prompt_diversity": self.meta_prompt_diversity,
+            "population_size": self.population_size,
+            "max_generations": self.max_generations,
+            "breeder_islands": self.breeder_islands,
+            "tournament_size": self.tournament_size,
+            "fitness_minibatch": self.fitness_minibatch,
+            "mutation_selection": self.mutation_selection,
+            "bandit_exploration": self.bandit_exploration,
+            "best_arm_confidence": self.best_arm_confidence,
+            "induction_subsets": self.induction_subsets,
+            "budget": self.budget.to_dict()
+        }
 
 
 @dataclass
@@ -95,6 +182,19 @@ class OptimizerSession:
     schematic_state: SchematicState = SchematicState.IDLE
     active_node: str = ""
     internal_monologue: str = ""  # For Glass Box text panel
+    
+    # Per-step timing, call and token accounting (see models/telemetry.py)
+    telemetry: RunTelemetry = field(default_factory=RunTelemetry)
+    
+    # Promptbreeder fitness by prompt hash and unit family tree (see models/lineage.py)
+    fitness_cache: FitnessCache = field(default_factory=FitnessCache, repr=False, compare=False)
+    lineage: LineageStore = field(default_factory=LineageStore, repr=False, compare=False)
+    
+    # Promptbreeder mutation bandit state, once per session (candidates keep only their chosen arm)
+    mutation_bandits: Dict[str, Any] = field(default_factory=dict)
+    
+    # Runtime-only memo of executor outputs/judge results (not serialized)
+    execution_memo: ExecutionMemo = field(default_factory=ExecutionMemo, repr=False, compare=False)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to .opro JSON format."""
@@ -105,11 +205,7 @@ class OptimizerSession:
                 "timestamp": self.metadata.timestamp,
                 "session_id": self.metadata.session_id
             },
-            "config": {
-                "model": self.config.model,
-                "temperature": self.config.temperature,
-                "noise_level": self.config.noise_level
-            },
+            "config": self.config.to_dict(),
             "test_bench": self.test_bench.to_dict(),
             "seed_prompt": self.seed_prompt,
             "current_step": self.current_step,
@@ -118,7 +214,11 @@ class OptimizerSession:
                 {"step": t.step, "score": t.score, "prompt": t.prompt}
                 for t in self.trajectory
             ],
-            "candidates": [c.model_dump() for c in self.candidates]
+            "candidates": [c.model_dump() for c in self.candidates],
+            "telemetry": self.telemetry.to_dict(),
+            "fitness_cache": self.fitness_cache.to_dict(),
+            "lineage": self.lineage.to_dict(),
+            "mutation_bandits": self.mutation_bandits
         }
 
     def to_json(self, indent: int = 2) -> str:
@@ -153,7 +253,30 @@ class OptimizerSession:
                 stop_score_threshold=data['config'].get('stop_score_threshold', 95.0),
                 noise_level=data['config'].get('noise_level', 0.0),
                 top_k=data['config'].get('top_k', 5),
-                vector_store_path=data['config'].get('vector_store_path', "")
+                vector_store_path=data['config'].get('vector_store_path', ""),
+                max_parallel_inputs=data['config'].get('max_parallel_inputs', 3),
+                eval_workers=data['config'].get('eval_workers', 4),
+                memo_max_entries=data['config'].get('memo_max_entries', 2048),
+                batch_judging=data['config'].get('batch_judging', False),
+                evaluation_strategy=data['config'].get('evaluation_strategy', "full"),
+                pipelined_generation=data['config'].get('pipelined_generation', False),
+                pipeline_trigger=data['config'].get('pipeline_trigger', 1),
+                opro_islands=data['config'].get('opro_islands', 1),
+                island_temperatures=data['config'].get('island_temperatures', []),
+                migration_interval=data['config'].get('migration_interval', 2),
+                meta_prompt_token_budget=data['config'].get('meta_prompt_token_budget', 1200),
+                meta_prompt_max_entries=data['config'].get('meta_prompt_max_entries', 20),
+                meta_prompt_diversity=data['config'].get('meta_prompt_diversity', 0.3),
+                population_size=data['config'].get('population_size', 8),
+                max_generations=data['config'].get('max_generations', 10),
+                breeder_islands=data['config'].get('breeder_islands', 1),
+                tournament_size=data['config'].get('tournament_size', 2),
+                fitness_minibatch=data['config'].get('fitness_minibatch', 1),
+                mutation_selection=data['config'].get('mutation_selection', "ucb"),
+                bandit_exploration=data['config'].get('bandit_exploration', 0.2),
+                best_arm_confidence=data['config'].get('best_arm_confidence', 0.95),
+                induction_subsets=data['config'].get('induction_subsets', 1),
+                budget=RunBudget.from_dict(data['config'].get('budget', {}))
             )
         
         # Load test bench
@@ -192,6 +315,15 @@ class OptimizerSession:
         if 'winner' in data and data['winner']:
              session.winner = UnifiedCandidate(**data['winner'])
         
+        # Load telemetry
+        if 'telemetry' in data:
+            session.telemetry = RunTelemetry.from_dict(data['telemetry'])
+        
+        # Load Promptbreeder fitness cache and lineage
+        session.fitness_cache = FitnessCache.from_dict(data.get('fitness_cache', {}))
+        session.lineage = LineageStore.from_dict(data.get('lineage', {}))
+        session.mutation_bandits = data.get('mutation_bandits', {})
+        
         return session
 
     @classmethod
@@ -213,8 +345,13 @@ class OptimizerSession:
             return None
         return max(self.candidates, key=lambda c: c.score_aggregate)
 
-    def get_trajectory_summary(self, max_entries: int = 5) -> str:
-        """Format trajectory for meta-prompt (OPro pattern)."""
-        recent = self.trajectory[-max_entries:] if self.trajectory else []
+    def get_trajectory_summary(
+        self,
+        max_entries: int = 5,
+        entries: Optional[List[TrajectoryEntry]] = None
+    ) -> str:
+        """Format trajectory for meta-prompt (OPro pattern); `entries` overrides self.trajectory."""
+        trajectory = self.trajectory if entries is None else entries
+        recent = trajectory[-max_entries:] if trajectory else []
         lines = [f"[Prompt: {t.prompt[:50]}... | Score: {t.score:.1f}]" for t in recent]
         return "\n".join(lines)
@@ -0,0 +1,146 @@
+"""
+Telemetry Models - per-phase timing, call and token accounting.
+
+Each engine step produces a StepTelemetry (attached to StepResult); the
+session keeps a RunTelemetry accumulating every step, serialized with the
+.opro file so a run's cost profile travels with its results.
+
+Phases: generation, execution, judging, mutation, induction, filtering
+(calls made outside any phase are counted under "other").
+"""
+
+from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, List
+
+PHASES = ("generation", "execution", "judging", "mutation", "induction", "filtering")
+
+
+@dataclass
+class PhaseStats:
+    """Accumulated cost of one phase."""
+    calls: int = 0
+    retries: int = 0
+    failures: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    wall_time_s: float = 0.0  # Time the phase was active (overlaps counted once)
+    call_time_s: float = 0.0  # Sum of individual call latencies
+    overlapped_calls: int = 0  # Calls that ran while another call was in flight
+    peak_concurrency: int = 0  # Most calls in flight when one of this phase started
+    cache_hits: int = 0  # Responses served by a cache or cassette (not in calls/tokens)
+
+    @property
+    def tokens(self) -> int:
+        return self.input_tokens + self.output_tokens
+
+    def merge(self, other: "PhaseStats"):
+        """Add another PhaseStats into this one (peak takes the max)."""
+        self.calls += other.calls
+        self.retries += other.retries
+        self.failures += other.failures
+        self.input_tokens += other.input_tokens
+        self.output_tokens += other.output_tokens
+        self.wall_time_s += other.wall_time_s
+        self.call_time_s += other.call_time_s
+        self.overlapped_calls += other.overlapped_calls
+        self.peak_concurrency = max(self.peak_concurrency, other.peak_concurrency)
+        self.cache_hits += other.cache_hits
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["wall_time_s"] = round(self.wall_time_s, 4)
+        data["call_time_s"] = round(self.call_time_s, 4)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PhaseStats":
+        return cls(**{k: data[k] for k in cls.__dataclass_fields__ if k in data})
+
+
+@dataclass
+class StepTelemetry:
+    """Timing and cost of one optimization step."""
+    step: int = 0
+    wall_time_s: float = 0.0
+    phases: Dict[str, PhaseStats] = field(default_factory=dict)
+    overlaps: Dict[str, int] = field(default_factory=dict)  # "execution|judging" -> overlapping call pairs
+
+    @property
+    def calls(self) -> int:
+        return sum(p.calls for p in self.phases.values())
+
+    @property
+    def retries(self) -> int:
+        return sum(p.retries for p in self.phases.values())
+
+    @property
+    def cache_hits(self) -> int:
+        return sum(p.cache_hits for p in self.phases.values())
+
+    @property
+    def input_tokens(self) -> int:
+        return sum(p.input_tokens for p in self.phases.values())
+
+    @property
+    def output_tokens(self) -> int:
+        return sum(p.output_tokens for p in self.phases.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "step": self.step,
+            "wall_time_s": round(self.wall_time_s, 4),
+            "phases": {name: stats.to_dict() for name, stats in self.phases.items()},
+            "overlaps": dict(self.overlaps)
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "StepTelemetry":
+        return cls(
+            step=data.get("step", 0),
+            wall_time_s=data.get("wall_time_s", 0.0),
+            phases={name: PhaseStats.from_dict(stats) for name, stats in data.get("phases", {}).items()},
+            overlaps=dict(data.get("overlaps", {}))
+        )
+
+
+@dataclass
+class RunTelemetry:
+    """Every step's telemetry for a session, plus run totals."""
+    steps: List[StepTelemetry] = field(default_factory=list)
+
+    def add(self, step: StepTelemetry):
+        self.steps.append(step)
+
+    def clear(self):
+        self.steps.clear()
+
+    def totals(self) -> Dict[str, PhaseStats]:
+        """Per-phase stats summed over all steps."""
+        totals: Dict[str, PhaseStats] = {}
+        for step in self.steps:
+            for name, stats in step.phases.items():
+                totals.setdefault(name, PhaseStats()).merge(stats)
+        return totals
+
+    @property
+    def calls(self) -> int:
+        return sum(step.calls for step in self.steps)
+
+    @property
+    def tokens(self) -> int:
+        return sum(step.input_tokens + step.output_tokens for step in self.steps)
+
+    @property
+    def cache_hits(self) -> int:
+        return sum(step.cache_hits for step in self.steps)
+
+    @property
+    def wall_time_s(self) -> float:
+        return sum(step.wall_time_s for step in self.steps)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"steps": [step.to_dict() for step in self.steps]}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RunTelemetry":
+        return cls(steps=[StepTelemetry.from_dict(step) for step in data.get("steps", [])])
@@ -1,7 +1,10 @@
 # Prompts package
 from glassbox.prompts.templates import (
     EVALUATOR_SYSTEM_PROMPT,
+    EVALUATOR_BATCH_SYSTEM_PROMPT,
     EVALUATOR_USER_TEMPLATE,
+    EVALUATOR_BATCH_USER_TEMPLATE,
+    EVALUATOR_BATCH_ITEM_TEMPLATE,
     OPRO_OPTIMIZER_SYSTEM_PROMPT,
     OPRO_OPTIMIZER_USER_TEMPLATE,
     APE_INDUCTION_SYSTEM_PROMPT,
@@ -22,7 +25,10 @@ from glassbox.prompts.templates import (
 
 __all__ = [
     "EVALUATOR_SYSTEM_PROMPT",
+    "EVALUATOR_BATCH_SYSTEM_PROMPT",
     "EVALUATOR_USER_TEMPLATE",
+    "EVALUATOR_BATCH_USER_TEMPLATE",
+    "EVALUATOR_BATCH_ITEM_TEMPLATE",
     "OPRO_OPTIMIZER_SYSTEM_PROMPT",
     "OPRO_OPTIMIZER_USER_TEMPLATE",
     "APE_INDUCTION_SYSTEM_PROMPT",
@@ -12,9 +12,7 @@ These prompts are based on the original research papers where available:
 # LLM JUDGE / EVALUATOR PROMPTS
 # =============================================================================
 
-EVALUATOR_SYSTEM_PROMPT = """You are an expert prompt evaluator. Your task is to score how well an AI assistant's response addresses the given task.
-
-EVALUATION CRITERIA:
+EVALUATOR_CRITERIA = """EVALUATION CRITERIA:
 1. **Accuracy** (0-25): Is the response factually correct and complete?
 2. **Relevance** (0-25): Does the response directly address the task/question?
 3. **Clarity** (0-25): Is the response well-structured and easy to understand?
@@ -23,7 +21,11 @@ EVALUATION CRITERIA:
 SCORING RULES:
 - Provide a score from 0-100 (sum of all criteria)
 - Be strict but fair - reserve 90+ scores for exceptional responses
-- Consider edge cases and adversarial inputs when scoring
+- Consider edge cases and adversarial inputs when scoring"""
+
+EVALUATOR_SYSTEM_PROMPT = """You are an expert prompt evaluator. Your task is to score how well an AI assistant's response addresses the given task.
+
+""" + EVALUATOR_CRITERIA + """
 
 OUTPUT FORMAT (JSON only):
 {
@@ -48,6 +50,51 @@ AI RESPONSE TO EVALUATE:
 
 Evaluate this response and provide your JSON score."""
 
+# Listwise judging (Evaluator.evaluate_batch): same criteria, array output
+EVALUATOR_BATCH_OUTPUT_FORMAT = """OUTPUT FORMAT (JSON array only, one object per response, in the order given):
+[
+    {
+        "index": <response number>,
+        "score": <0-100>,
+        "breakdown": {
+            "accuracy": <0-25>,
+            "relevance": <0-25>,
+            "clarity": <0-25>,
+            "instruction_following": <0-25>
+        },
+        "reasoning": "<1-2 sentence explanation of the score>"
+    },
+    ...
+]"""
+
+EVALUATOR_BATCH_SYSTEM_PROMPT = """You are an expert prompt evaluator. Your task is to score several AI assistant responses to the same input, each against the task prompt that produced it.
+
+""" + EVALUATOR_CRITERIA + """
+- Score each response independently - do not rank them against each other
+
+""" + EVALUATOR_BATCH_OUTPUT_FORMAT
+
+EVALUATOR_BATCH_USER_TEMPLATE = """INPUT PROVIDED:
+{input_text}
+
+Below are {count} AI responses to this input, each produced by its own task prompt.
+Score EACH response independently against its own task prompt and the criteria - do not rank them against each other.
+
+{responses}
+
+OUTPUT FORMAT (JSON array only, exactly {count} objects in the order given):
+[
+    {{"index": 1, "score": <0-100>, "breakdown": {{"accuracy": <0-25>, "relevance": <0-25>, "clarity": <0-25>, "instruction_following": <0-25>}}, "reasoning": "<1-2 sentences>"}},
+    ...
+]"""
+
+EVALUATOR_BATCH_ITEM_TEMPLATE = """=== RESPONSE {index} ===
+TASK PROMPT:
+{candidate_prompt}
+
+AI RESPONSE TO EVALUATE:
+{response}"""
+
 
 # =============================================================================
 # OPRO ENGINE PROMPTS (Yang et al., 2023)
@@ -243,6 +290,7 @@ MONOLOGUE_PROMPTBREEDER = """[Promptbreeder - Generation {generation}]
 Population size: {population_size}
 Operator: {mutation_operator}
 Best fitness: {best_fitness}%
+Operator gain/call (improved/scored): {operator_stats}
 Attempting: {mutation_description}"""
 
 MONOLOGUE_S2A = """[S2A Filter - Pass {pass_num}]
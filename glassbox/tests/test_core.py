@@ -76,6 +76,354 @@ class TestMessage:
         assert result["content"] == content
 
 
+# API Client Tests
+class TestBoeingAPIClient:
+    """Tests for BoeingAPIClient HTTP session handling."""
+
+    def test_session_pool_sized_from_config(self):
+        from glassbox.core.api_client import BoeingAPIClient, APIConfig
+
+        client = BoeingAPIClient(APIConfig(pool_size=3, ca_bundle_path="/tmp/ca.pem"))
+        adapter = client.session.get_adapter("https://bcai-test.web.boeing.com")
+
+        assert adapter._pool_maxsize == 3
+        assert client.session.verify == "/tmp/ca.pem"
+        assert client.session is client.session  # Reused, not rebuilt
+
+    def test_send_message_uses_pooled_session(self, monkeypatch):
+        from glassbox.core.api_client import BoeingAPIClient, Message
+
+        monkeypatch.setenv("BCAI_PAT_B64", "dGVzdA==")
+        client = BoeingAPIClient()
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Type": "application/json"}
+        mock_response.json.return_value = {
+            "choices": [{"messages": [{"content": "pong"}]}]
+        }
+
+        with patch.object(client.session, "post", return_value=mock_response) as mock_post:
+            result = client.send_message([Message(role="user", content="ping")])
+            result = client.send_message([Message(role="user", content="ping")])
+
+        assert result.success
+        assert result.content == "pong"
+        assert mock_post.call_count == 2
+        assert client.get_connection_stats()["requests_sent"] == 2
+
+
+    def test_judge_temperature_zero_is_sent_and_cached(self, monkeypatch, tmp_path):
+        from glassbox.core.api_client import BoeingAPIClient, APIConfig, Message
+
+        monkeypatch.setenv("BCAI_PAT_B64", "dGVzdA==")
+        client = BoeingAPIClient(APIConfig(cache_path=str(tmp_path / "cache.db")))
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Type": "application/json"}
+        mock_response.json.return_value = {"choices": [{"message": {"content": "{\"score\": 80}"}}]}
+
+        messages = [Message(role="user", content="judge this")]
+        with patch.object(client.session, "post", return_value=mock_response) as mock_post:
+            first = client.send_message(messages, temperature=0.0)
+            second = client.send_message(messages, temperature=0.0)
+            client.send_message(messages, temperature=0.7)
+            client.send_message(messages, temperature=0.7)
+
+        assert mock_post.call_args_list[0].kwargs["json"]["temperature"] == 0.0
+        assert first.content == second.content
+        assert mock_post.call_count == 3  # Only the deterministic repeat was cached
+        assert client.response_cache.stats()["hits"] == 1
+
+
+    def test_429_is_retried_and_shrinks_concurrency(self, monkeypatch):
+        from glassbox.core.api_client import BoeingAPIClient, APIConfig, Message
+
+        monkeypatch.setenv("BCAI_PAT_B64", "dGVzdA==")
+        client = BoeingAPIClient(APIConfig(initial_concurrency=8))
+
+        throttled = Mock(status_code=429, headers={"Retry-After": "0"})
+        ok = Mock(status_code=200, headers={"Content-Type": "application/json"})
+        ok.json.return_value = {"choices": [{"message": {"content": "done"}}]}
+
+        with patch.object(client.session, "post", side_effect=[throttled, ok]):
+            result = client.send_message([Message(role="user", content="hi")])
+
+        stats = client.get_rate_limit_stats()
+        assert result.content == "done"
+        assert stats["overloads"] == 1
+        assert stats["concurrency_limit"] == 4
+
+
+    def test_stop_interrupts_backoff_and_inflight_request(self, monkeypatch):
+        import threading
+        import time
+        from glassbox.core.api_client import BoeingAPIClient, Message
+        from glassbox.core.retry import RetryPolicy
+
+        monkeypatch.setenv("BCAI_PAT_B64", "dGVzdA==")
+        client = BoeingAPIClient(retry_policy=RetryPolicy(base_delay=30, jitter=0))
+        message = [Message(role="user", content="hi")]
+
+        # Stop during a 30s backoff
+        throttled = Mock(status_code=503, headers={})
+        with patch.object(client.session, "post", return_value=throttled):
+            threading.Timer(0.2, client.request_stop).start()
+            start = time.monotonic()
+            result = client.send_message(message)
+        assert time.monotonic() - start < 1.0
+        assert result.error_message == "Request cancelled by user"
+
+        # Stop while the request itself is still in flight
+        client.reset_stop()
+        hang = threading.Event()
+        with patch.object(client.session, "post", side_effect=lambda *a, **k: hang.wait(10)):
+            threading.Timer(0.2, client.request_stop).start()
+            start = time.monotonic()
+            result = client.send_message(message)
+        hang.set()
+        assert time.monotonic() - start < 1.0
+        assert result.error_message == "Request cancelled by user"
+
+
+class TestRetryPolicy:
+    """Tests for backoff computation and Retry-After parsing."""
+
+    def test_retry_after_overrides_jittered_backoff(self):
+        from email.utils import format_datetime
+        from datetime import datetime, timedelta, timezone
+        from glassbox.core.retry import RetryPolicy, parse_retry_after
+
+        policy = RetryPolicy(base_delay=2, max_delay=32, jitter=0.5, max_retry_after=60)
+        for attempt in range(6):
+            delay = policy.compute_delay(attempt)
+            cap = min(2 * 2 ** attempt, 32)
+            assert cap / 2 <= delay <= cap
+
+        assert policy.compute_delay(0, "7") == 7
+        assert policy.compute_delay(0, "600") == 60  # Capped
+        http_date = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=20), usegmt=True)
+        assert 15 < parse_retry_after(http_date) <= 20
+        assert parse_retry_after("soon") is None
+        assert policy.should_retry(429) and policy.should_retry(502)
+        assert not policy.should_retry(401)
+
+
+class TestRateLimiter:
+    """Tests for the token bucket and AIMD controller."""
+
+    def test_aimd_decreases_once_per_cooldown_and_ramps_up(self):
+        from glassbox.core.rate_limiter import AdaptiveConcurrencyController
+
+        controller = AdaptiveConcurrencyController(initial_limit=8, max_limit=16, cooldown=60)
+        controller.on_overload()
+        controller.on_overload()  # Same congestion event - no second halving
+        assert controller.limit == 4
+
+        for _ in range(5):  # +1/limit per success: about +1 per full window
+            controller.on_success()
+        assert controller.limit == 5
+        assert controller.metrics()["throughput_rps"] > 0
+
+    def test_token_bucket_paces_after_burst(self):
+        from glassbox.core.rate_limiter import TokenBucket
+
+        bucket = TokenBucket(rate=10, capacity=2)
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(0.1, abs=0.02)
+        assert TokenBucket(rate=0, capacity=1).reserve() == 0.0
+
+
+class TestResponseCache:
+    """Tests for the persistent response cache."""
+
+    def test_key_normalizes_message_formats(self):
+        from glassbox.core.api_client import Message
+        from glassbox.core.response_cache import ResponseCache
+
+        typed = [Message(role="user", content=[{"type": "text", "text": "Hello "}])]
+        plain = [Message(role="user", content="Hello")]
+
+        assert ResponseCache.make_key("m", 0.0, typed) == ResponseCache.make_key("m", 0.0, plain)
+        assert ResponseCache.make_key("m", 0.0, plain) != ResponseCache.make_key("m", 0.3, plain)
+
+    def test_ttl_expiry_and_lru_eviction(self, tmp_path):
+        import time
+        from glassbox.core.response_cache import ResponseCache
+
+        cache = ResponseCache(str(tmp_path / "c.db"), ttl_seconds=3600, max_bytes=25)
+        cache.put("a", "x" * 10)
+        cache.put("b", "y" * 10)
+        assert cache.get("a")["content"] == "x" * 10  # Touch "a" so "b" is LRU
+        cache.put("c", "z" * 10)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+        cache.ttl_seconds = 1e-6
+        time.sleep(0.01)
+        assert cache.get("a") is None
+        cache.close()
+
+
+class TestAsyncBoeingAPIClient:
+    """Tests for the asyncio Boeing client."""
+
+    def test_send_many_caps_in_flight_requests(self, monkeypatch):
+        pytest.importorskip("aiohttp")
+        import asyncio
+        from glassbox.core.async_client import AsyncBoeingAPIClient
+        from glassbox.core.api_client import APIConfig, Message
+        from glassbox.devtools import MockGateway, MockGatewayConfig, LatencyProfile
+
+        monkeypatch.setenv("BCAI_PAT_B64", "dGVzdA==")
+        gateway = MockGateway(MockGatewayConfig(
+            latency=LatencyProfile(mean=0.05),
+            response_shape="message",
+            list_content=True,
+            default_reply="ok"
+        )).start()
+
+        client = AsyncBoeingAPIClient(APIConfig(base_url=gateway.url, max_concurrency=2))
+
+        async def _run():
+            try:
+                return await client.send_many(
+                    [[Message(role="user", content=f"q{i}")] for i in range(6)]
+                )
+            finally:
+                await client.aclose()
+
+        try:
+            results = asyncio.run(_run())
+        finally:
+            gateway.stop()
+
+        assert [r.content for r in results] == ["ok"] * 6
+        assert gateway.stats()["peak_in_flight"] <= 2
+
+    def test_429_shrinks_in_flight_requests(self, monkeypatch):
+        pytest.importorskip("aiohttp")
+        import asyncio
+        from glassbox.core.async_client import AsyncBoeingAPIClient
+        from glassbox.core.api_client import APIConfig, Message
+        from glassbox.core.retry import RetryPolicy
+        from glassbox.devtools import MockGateway, MockGatewayConfig, LatencyProfile, ScriptedResponse
+
+        monkeypatch.setenv("BCAI_PAT_B64", "dGVzdA==")
+        gateway = MockGateway(MockGatewayConfig(
+            latency=LatencyProfile(mean=0.05),
+            response_shape="message",
+            default_reply="ok"
+        )).start()
+        gateway.enqueue(ScriptedResponse(status=429, headers={"Retry-After": "0"}))
+
+        client = AsyncBoeingAPIClient(
+            APIConfig(base_url=gateway.url, initial_concurrency=4, max_concurrency=4),
+            retry_policy=RetryPolicy(base_delay=0.01)
+        )
+
+        async def _run():
+            try:
+                first = await client.send_message([Message(role="user", content="throttled")])
+                rest = await client.send_many(
+                    [[Message(role="user", content=f"q{i}")] for i in range(4)]
+                )
+                return [first] + rest
+            finally:
+                await client.aclose()
+
+        try:
+            results = asyncio.run(_run())
+        finally:
+            gateway.stop()
+
+        assert [r.content for r in results] == ["ok"] * 5
+        assert client.get_rate_limit_stats()["overloads"] == 1
+        assert gateway.stats()["peak_in_flight"] == 2  # AIMD halved 4 -> 2, not the static cap of 4
+
+    def test_inherited_sync_entry_points_are_async(self, monkeypatch):
+        pytest.importorskip("aiohttp")
+        import asyncio
+        from glassbox.core.async_client import AsyncBoeingAPIClient
+        from glassbox.core.api_client import APIConfig, APIResponse, Message
+        from glassbox.devtools import MockGateway, MockGatewayConfig
+
+        monkeypatch.setenv("BCAI_PAT_B64", "dGVzdA==")
+        gateway = MockGateway(MockGatewayConfig(response_shape="message", default_reply="ok")).start()
+        client = AsyncBoeingAPIClient(APIConfig(base_url=gateway.url))
+        received = []
+
+        async def _run():
+            try:
+                health = await client.health_check()
+                task = client.send_message_async([Message(role="user", content="q")], callback=received.append)
+                return health, await task
+            finally:
+                await client.aclose()
+
+        try:
+            health, response = asyncio.run(_run())
+        finally:
+            gateway.stop()
+
+        assert health == "OK"
+        assert isinstance(response, APIResponse) and response.content == "ok"
+        assert received == [response] and client._result_queue.get_nowait() is response
+
+    def test_async_gemini_health_check_is_awaitable(self):
+        import asyncio
+        from glassbox.core.async_client import AsyncGeminiAPIClient
+        from glassbox.core.gemini_client import GeminiConfig
+
+        client = AsyncGeminiAPIClient(GeminiConfig(api_key=""))
+        status = asyncio.run(client.health_check())
+        assert status["model"] == client.config.model and status["api_key_set"] is False
+
+
+class TestMockGateway:
+    """Tests for the local gateway stand-in against the real HTTP client."""
+
+    def test_shapes_scripts_and_faults(self, monkeypatch):
+        from glassbox.core.api_client import BoeingAPIClient, APIConfig, Message
+        from glassbox.core.retry import RetryPolicy
+        from glassbox.devtools import MockGateway, MockGatewayConfig, ScriptedResponse
+
+        monkeypatch.setenv("BCAI_PAT_B64", "dGVzdA==")
+        with MockGateway(MockGatewayConfig(response_shape="alternate", list_content=True)) as gateway:
+            client = BoeingAPIClient(
+                APIConfig(base_url=gateway.url),
+                retry_policy=RetryPolicy(base_delay=0.01)
+            )
+            ask = lambda text: client.send_message([Message(role="user", content=text)])
+
+            gateway.enqueue("first", "second")
+            gateway.when("judge", '{"score": 77}')
+            assert ask("a").content == "first"   # choices[0].messages
+            assert ask("b").content == "second"  # choices[0].message
+            assert ask("please judge").content == '{"score": 77}'
+
+            gateway.enqueue(
+                ScriptedResponse(status=429, headers={"Retry-After": "0"}),
+                ScriptedResponse(status=503),
+                "recovered"
+            )
+            assert ask("c").content == "recovered"
+
+            gateway.enqueue(ScriptedResponse(html=True))
+            assert "SSO" in ask("d").error_message
+
+            stats = gateway.stats()
+            client.close()
+
+        assert stats["status_counts"] == {200: 5, 429: 1, 503: 1}
+        assert stats["connections"] == 1  # Pooled keep-alive session
+        assert gateway.requests[0]["skip_db_save"] is True
+
+
 # Session Tests
 class TestOptimizerSession:
     """Tests for OptimizerSession."""
@@ -120,6 +468,34 @@ class TestOptimizerSession:
         assert len(data["candidates"]) == 1
         assert data["candidates"][0]["score_aggregate"] == 80.0
 
+    def test_session_config_round_trip(self):
+        from dataclasses import fields
+        from glassbox.models import OptimizerSession
+        from glassbox.models.session import SessionConfig, RunBudget
+
+        session = OptimizerSession()
+        session.config = SessionConfig(
+            model="gpt-4o", temperature=0.3, generations_per_step=5,
+            stop_score_threshold=90.0, noise_level=0.2, top_k=7,
+            vector_store_path="store", max_parallel_inputs=2, eval_workers=6,
+            memo_max_entries=64, batch_judging=True, evaluation_strategy="racing",
+            pipelined_generation=True, pipeline_trigger=2, opro_islands=3,
+            island_temperatures=[0.2, 0.7, 1.1], migration_interval=4,
+            meta_prompt_token_budget=800, meta_prompt_max_entries=10,
+            meta_prompt_diversity=0.5, population_size=12, max_generations=4,
+            breeder_islands=2, tournament_size=3, fitness_minibatch=0,
+            mutation_selection="thompson", bandit_exploration=0.4,
+            best_arm_confidence=0.9, induction_subsets=3,
+            budget=RunBudget(max_calls=50, max_tokens=20000, deadline_s=30.0)
+        )
+        defaults = SessionConfig()
+        unchanged = [f.name for f in fields(SessionConfig)
+                   if getattr(session.config, f.name) == getattr(defaults, f.name)]
+        assert unchanged == []  # Every field differs, so a dropped one would show
+
+        restored = OptimizerSession.from_json(session.to_json())
+        assert restored.config == session.config
+
     def test_candidate_score_aggregate(self):
         from glassbox.models import UnifiedCandidate, EngineType
         import uuid
@@ -250,6 +626,103 @@ class TestEvaluator:
         
         assert result.score == 75.0
 
+    def test_evaluate_tristate_runs_inputs_concurrently(self):
+        import threading
+        from glassbox.core.evaluator import Evaluator, EvaluationResult
+        from glassbox.core.api_client import BoeingAPIClient
+        
+        evaluator = Evaluator(Mock(spec=BoeingAPIClient))
+        barrier = threading.Barrier(2, timeout=5)
+
+        def executor_fn(prompt, input_text):
+            if input_text == "bad":
+                raise RuntimeError("boom")
+            barrier.wait()  # Deadlocks unless A and C run at the same time
+            return f"echo {input_text}"
+
+        evaluator.evaluate = lambda prompt, input_text, response: EvaluationResult(
+            score=len(response), reasoning=response, breakdown={}
+        )
+
+        result_a, result_b, result_c = evaluator.evaluate_tristate(
+            "prompt", "golden", "bad", "adversarial", executor_fn
+        )
+
+        assert result_a.reasoning == "echo golden"
+        assert result_b.score == 0.0
+        assert "boom" in result_b.reasoning
+        assert result_c.reasoning == "echo adversarial"
+
+
+    def test_evaluate_batch_single_call_and_fallback(self):
+        from glassbox.core.evaluator import Evaluator, EvaluationResult
+        from glassbox.core.api_client import BoeingAPIClient, APIResponse
+
+        client = Mock(spec=BoeingAPIClient)
+        client.send_message.return_value = APIResponse(success=True, content=json.dumps([
+            {"index": 2, "score": 40, "reasoning": "weak"},
+            {"index": 1, "score": 90, "reasoning": "strong"},
+        ]))
+        evaluator = Evaluator(client)
+
+        results = evaluator.evaluate_batch("Task", "input", ["good", "bad"], ["p1", "p2"])
+        assert [r.score for r in results] == [90.0, 40.0]  # Reordered by index
+        assert client.send_message.call_count == 1
+        judged = client.send_message.call_args.args[0][1].content
+        assert "TASK PROMPT:\np1" in judged and "TASK PROMPT:\np2" in judged and "Task" not in judged
+        system = client.send_message.call_args.args[0][0].content
+        assert "JSON array only" in system and "OUTPUT FORMAT (JSON only)" not in system  # One format, not two
+
+        # A custom rubric carries over to the batch system prompt
+        evaluator.set_custom_rubric("Penalise jargon.")
+        assert evaluator.batch_system_prompt.endswith("Penalise jargon.")
+        assert "OUTPUT FORMAT (JSON only)" not in evaluator.batch_system_prompt
+
+        # Wrong number of objects -> per-item evaluate
+        client.send_message.return_value = APIResponse(success=True, content='[{"score": 50}]')
+        evaluator.evaluate = Mock(return_value=EvaluationResult(score=60, reasoning="", breakdown={}))
+        results = evaluator.evaluate_batch("Task", "input", ["good", "bad"], ["p1", "p2"])
+        assert [r.score for r in results] == [60, 60]
+        assert evaluator.evaluate.call_args_list[1].args == ("p2", "input", "bad")
+
+# Scheduler Tests
+class TestEvaluationScheduler:
+    """Tests for the shared candidate evaluation pool."""
+
+    def test_map_preserves_order_and_runs_concurrently(self):
+        import threading
+        import time
+        from glassbox.core.scheduler import EvaluationScheduler
+
+        scheduler = EvaluationScheduler(max_workers=3, stop_event=threading.Event())
+
+        def slow_square(x):
+            time.sleep(0.2 - x * 0.05)  # Later items finish first
+            return x * x
+
+        start = time.monotonic()
+        results = scheduler.map(slow_square, [0, 1, 2])
+        elapsed = time.monotonic() - start
+        scheduler.shutdown()
+
+        assert results == [0, 1, 4]
+        assert elapsed < 0.35  # Bounded by the slowest item, not the sum
+
+    def test_map_skips_items_after_stop(self):
+        import threading
+        from glassbox.core.scheduler import EvaluationScheduler
+
+        stop = threading.Event()
+        scheduler = EvaluationScheduler(max_workers=1, stop_event=stop)
+
+        def work(x):
+            if x == 1:
+                stop.set()
+            return x
+
+        assert scheduler.map(work, [0, 1, 2, 3]) == [0, 1]
+        scheduler.shutdown()
+
 
 # Utility Tests
 class TestUtils:
@@ -314,6 +787,752 @@ class TestEngines:
         assert "digraph" in dot_source
         assert "OPro" in dot_source
 
+    def test_evaluate_candidate_isolates_input_errors(self):
+        from glassbox.core import OProEngine, BoeingAPIClient, HumanOverrideEvaluator
+        from glassbox.core.evaluator import EvaluationResult
+        from glassbox.models import OptimizerSession, TestBenchConfig
+
+        session = OptimizerSession()
+        session.test_bench = TestBenchConfig(input_a="golden", input_b="edge", input_c="")
+        mock_evaluator = Mock(spec=HumanOverrideEvaluator)
+        mock_evaluator.evaluate.return_value = EvaluationResult(
+            score=90.0, reasoning="Good", breakdown={}
+        )
+
+        engine = OProEngine(Mock(spec=BoeingAPIClient), mock_evaluator, session)
+
+        def execute(prompt, input_text):
+            if input_text == "edge":
+                raise RuntimeError("API call failed: 500")
+            return "response"
+
+        engine._execute_prompt = execute
+        candidate = engine._evaluate_candidate("Summarize the input.", 1)
+
+        assert candidate.test_results == {"input_a": 90.0, "input_b": 0.0, "input_c": 50.0}
+        assert candidate.score_aggregate == pytest.approx(140.0 / 3)
+        assert candidate.meta["test_details"]["reasoning"]["input_c"] == "Test input empty"
+
+    def test_memo_skips_repeat_evaluations_across_engines(self):
+        from glassbox.core import OProEngine, APEEngine, BoeingAPIClient, HumanOverrideEvaluator
+        from glassbox.core.api_client import APIResponse
+        from glassbox.core.evaluator import EvaluationResult
+        from glassbox.models import OptimizerSession, TestBenchConfig
+
+        session = OptimizerSession()
+        session.test_bench = TestBenchConfig(input_a="golden", input_b="edge", input_c="")
+        client = Mock(spec=BoeingAPIClient)
+        client.send_message.return_value = APIResponse(success=True, content="answer")
+        evaluator = Mock(spec=HumanOverrideEvaluator)
+        evaluator.evaluate.return_value = EvaluationResult(
+            score=70.0, reasoning="ok", breakdown={}, raw_response='{"score": 70}'
+        )
+
+        opro = OProEngine(client, evaluator, session)
+        ape = APEEngine(client, evaluator, session)
+        first = opro._evaluate_candidate("Summarize the input.", 1)
+        second = ape._evaluate_candidate("  Summarize   the input.\n", 1)
+
+        assert client.send_message.call_count == 2  # One execute per non-empty input
+        assert evaluator.evaluate.call_count == 2
+        assert first.test_results == second.test_results
+        assert session.execution_memo.stats()["hits"] == 2
+
+    def test_batch_judging_uses_one_judge_call_per_input(self):
+        from glassbox.core import OProEngine, BoeingAPIClient, HumanOverrideEvaluator
+        from glassbox.core.api_client import APIResponse
+        from glassbox.core.evaluator import EvaluationResult
+        from glassbox.models import OptimizerSession, TestBenchConfig
+
+        session = OptimizerSession()
+        session.config.batch_judging = True
+        session.test_bench = TestBenchConfig(input_a="golden", input_b="edge", input_c="")
+        client = Mock(spec=BoeingAPIClient)
+        client.send_message.return_value = APIResponse(success=True, content="answer")
+        evaluator = Mock(spec=HumanOverrideEvaluator)
+        evaluator.system_prompt = "rubric"
+        evaluator.evaluate_batch.side_effect = lambda prompt, input_text, responses, candidate_prompts: [
+            EvaluationResult(score=80.0, reasoning="batch", breakdown={}, raw_response="[...]")
+            for _ in responses
+        ]
+
+        engine = OProEngine(client, evaluator, session)
+        prompts = ["Prompt one is here.", "Prompt two is here.", "Prompt three is here."]
+        engine._batch_judge(prompts)
+        candidates = [engine._evaluate_candidate(p, 1) for p in prompts]
+
+        assert evaluator.evaluate_batch.call_count == 2  # Inputs A and B
+        evaluator.evaluate.assert_not_called()
+        assert all(c.test_results["input_a"] == 80.0 for c in candidates)
+        assert client.send_message.call_count == 6  # Executions only
+
+    def test_racing_prunes_candidates_that_cannot_win(self):
+        from glassbox.core import OProEngine, BoeingAPIClient, HumanOverrideEvaluator
+        from glassbox.core.api_client import APIResponse
+        from glassbox.core.evaluator import EvaluationResult
+        from glassbox.models import OptimizerSession, TestBenchConfig, UnifiedCandidate, EngineType
+
+        session = OptimizerSession()
+        session.config.evaluation_strategy = "racing"
+        session.test_bench = TestBenchConfig(input_a="golden", input_b="edge", input_c="")
+        session.candidates.append(UnifiedCandidate(
+            engine_type=EngineType.OPRO, generation_index=0,
+            display_text="prior", full_content="prior", score_aggregate=80.0
+        ))
+        client = Mock(spec=BoeingAPIClient)
+        client.send_message.return_value = APIResponse(success=True, content="answer")
+        evaluator = Mock(spec=HumanOverrideEvaluator)
+        evaluator.evaluate.side_effect = lambda prompt, input_text, response: EvaluationResult(
+            score=10.0 if "weak" in prompt else 90.0, reasoning="", breakdown={}, raw_response="{}"
+        )
+
+        engine = OProEngine(client, evaluator, session)
+        candidates = engine._race_variations(
+            [("A weak prompt here.", ""), ("A strong prompt here.", "")], step_num=1
+        )
+
+        weak, strong = candidates
+        assert weak.meta["racing"]["pruned"] is True
+        assert weak.test_results == {"input_a": 10.0, "input_c": 50.0}  # B never run; empty C is free
+        assert "input_a" in weak.meta["racing"]["reason"]
+        assert strong.meta["racing"]["pruned"] is False
+        assert strong.test_results == {"input_a": 90.0, "input_b": 90.0, "input_c": 50.0}
+        assert evaluator.evaluate.call_count == 3
+
+    def test_racing_with_batch_judging_prunes_before_executing(self):
+        from glassbox.core import OProEngine, APEEngine, BoeingAPIClient, HumanOverrideEvaluator
+        from glassbox.core.api_client import APIResponse
+        from glassbox.core.evaluator import EvaluationResult
+        from glassbox.models import OptimizerSession, TestBenchConfig, UnifiedCandidate, EngineType
+
+        inputs = ("golden", "edge", "noisy")
+        for engine_class in (OProEngine, APEEngine):
+            session = OptimizerSession()
+            session.seed_prompt = "Summarize the input."
+            session.config.evaluation_strategy = "racing"
+            session.config.batch_judging = True
+            session.test_bench = TestBenchConfig(input_a="golden", input_b="edge", input_c="noisy")
+            session.candidates.append(UnifiedCandidate(
+                engine_type=EngineType.OPRO, generation_index=0,
+                display_text="prior", full_content="prior", score_aggregate=80.0
+            ))
+            client = Mock(spec=BoeingAPIClient)
+            client.send_message.return_value = APIResponse(success=True, content=(
+                "VARIATION 1: First weak prompt here.\nREASONING: a\n"
+                "VARIATION 2: Second weak prompt here.\nREASONING: b"
+            ))
+            evaluator = Mock(spec=HumanOverrideEvaluator)
+            evaluator.system_prompt = "rubric"
+            weak = lambda: EvaluationResult(score=10.0, reasoning="", breakdown={}, raw_response="[...]")
+            evaluator.evaluate_batch.side_effect = lambda prompt, input_text, responses, candidate_prompts: [
+                weak() for _ in responses
+            ]
+            evaluator.evaluate.side_effect = lambda prompt, input_text, response: weak()
+
+            engine = engine_class(client, evaluator, session)
+            if engine_class is APEEngine:
+                engine.set_examples([("a", "A"), ("b", "B"), ("c", "C")])
+            result = engine.step()
+
+            executed = [
+                call for call in client.send_message.call_args_list
+                if call.args[0][-1].content in inputs
+            ]
+            assert result.candidates and all(c.meta["racing"]["pruned"] for c in result.candidates)
+            assert len(executed) == len(result.candidates)  # Input A only, not the whole bench
+
+    def test_benchmark_fake_llm_runs_every_engine(self):
+        from benchmarks.run_benchmarks import run_engine, ENGINES
+
+        for name in ENGINES:
+            result = run_engine(name, steps=3, seed=1)
+            assert result.steps > 0 and result.api_calls > 0
+            assert result.best_score > 0
+
+        first = run_engine("opro", steps=3, seed=1)
+        again = run_engine("opro", steps=3, seed=1)
+        assert first.curve == again.curve  # Reproducible despite concurrent evaluation
+
+    def test_cassette_replays_session_without_llm(self, tmp_path):
+        import random
+        from benchmarks.fake_llm import FakeLLM
+        from glassbox.core import OProEngine
+        from glassbox.core.api_client import Message
+        from glassbox.core.cassette import CassetteClient
+        from glassbox.core.evaluator import Evaluator
+        from glassbox.models.session import OptimizerSession, TestBenchConfig
+
+        def _run(client):
+            random.seed(3)
+            session = OptimizerSession()
+            session.seed_prompt = "Summarize the input."
+            session.test_bench = TestBenchConfig(input_a="Pump P2 pressure drop.", input_b="", input_c="")
+            session.config.stop_score_threshold = 101.0
+            OProEngine(client, Evaluator(client), session).run(max_steps=2)
+            return sorted((c.full_content, c.score_aggregate) for c in session.candidates)
+
+        path = str(tmp_path / "run.jsonl.gz")
+        recorder = CassetteClient(path, mode="record", client=FakeLLM(seed=3))
+        recorded = _run(recorder)
+        recorder.close()
+
+        replay = CassetteClient(path, mode="replay")  # No LLM behind it
+        assert _run(replay) == recorded
+        assert replay.stats()["misses"] == 0 and replay.stats()["hits"] > 0
+        assert replay.config.model == "fake-llm"
+
+        miss = replay.send_message([Message(role="user", content="never recorded")])
+        assert miss.success is False and "Cassette miss" in miss.error_message
+
+    def test_step_telemetry_per_phase(self):
+        import random
+        from benchmarks.fake_llm import FakeLLM
+        from glassbox.core import OProEngine
+        from glassbox.core.evaluator import Evaluator
+        from glassbox.models.session import OptimizerSession, TestBenchConfig
+
+        random.seed(0)
+        llm = FakeLLM(latency=0.02)
+        session = OptimizerSession()
+        session.seed_prompt = "Summarize the input."
+        session.test_bench = TestBenchConfig(input_a="Pump P2 pressure drop.", input_b="Brake wear.", input_c="")
+        session.config.stop_score_threshold = 101.0
+        results = OProEngine(llm, Evaluator(llm), session).run(max_steps=2)
+
+        telemetry = results[0].telemetry
+        assert telemetry.step == 1
+        assert telemetry.phases["generation"].calls == 1
+        assert telemetry.phases["execution"].calls == telemetry.phases["judging"].calls == 6
+        assert telemetry.phases["judging"].input_tokens > 0 and telemetry.phases["judging"].output_tokens > 0
+        assert telemetry.phases["execution"].wall_time_s < telemetry.phases["execution"].call_time_s
+        assert telemetry.phases["execution"].overlapped_calls > 0 and telemetry.overlaps
+        assert telemetry.wall_time_s >= telemetry.phases["generation"].wall_time_s
+
+        # Accumulated on the session and carried through save/load
+        assert len(session.telemetry.steps) == 2
+        assert session.telemetry.calls == llm.calls
+        restored = OptimizerSession.from_json(session.to_json()).telemetry
+        assert restored.calls == llm.calls
+        assert restored.totals()["judging"].calls == session.telemetry.totals()["judging"].calls
+
+    def test_run_budget_stops_gracefully(self):
+        import random
+        from benchmarks.fake_llm import FakeLLM
+        from glassbox.core import OProEngine
+        from glassbox.core.evaluator import Evaluator
+        from glassbox.models.session import OptimizerSession, TestBenchConfig, RunBudget
+
+        random.seed(0)
+        llm = FakeLLM()
+        session = OptimizerSession()
+        session.seed_prompt = "Summarize the input."
+        session.test_bench = TestBenchConfig(input_a="Pump P2 pressure drop.", input_b="", input_c="")
+        session.config.stop_score_threshold = 101.0
+        session.config.budget = RunBudget(max_calls=10)  # Generation + 3 candidates x 2 calls = 7 per step
+        engine = OProEngine(llm, Evaluator(llm), session)
+        results = engine.run(max_steps=50)
+
+        assert llm.calls <= 10
+        assert len(session.candidates) == 4  # 3 in step 1, then only 1 affordable in step 2
+        assert len(results) == 2 and engine.stop_reason.startswith("call budget reached")
+        assert session.winner is session.get_best_candidate()
+        assert engine._status.value == "completed"
+
+        # Deadline already passed: no calls at all
+        session.config.budget = RunBudget(deadline_s=1e-9)
+        calls = llm.calls
+        engine = OProEngine(llm, Evaluator(llm), session)
+        assert engine.run(max_steps=5) == [] and llm.calls == calls
+        assert "deadline" in engine.stop_reason
+
+    def test_replayed_responses_are_not_charged_to_budget(self, tmp_path):
+        import random
+        from benchmarks.fake_llm import FakeLLM
+        from glassbox.core import OProEngine
+        from glassbox.core.cassette import CassetteClient
+        from glassbox.core.evaluator import Evaluator
+        from glassbox.models.session import OptimizerSession, TestBenchConfig, RunBudget
+
+        def _run(client, budget):
+            random.seed(3)
+            session = OptimizerSession()
+            session.seed_prompt = "Summarize the input."
+            session.test_bench = TestBenchConfig(input_a="Pump P2 pressure drop.", input_b="", input_c="")
+            session.config.stop_score_threshold = 101.0
+            session.config.budget = budget
+            engine = OProEngine(client, Evaluator(client), session)
+            return engine, engine.run(max_steps=2)
+
+        path = str(tmp_path / "run.jsonl")
+        llm = FakeLLM(seed=3)
+        recorder = CassetteClient(path, mode="record", client=llm)
+        _, recorded = _run(recorder, RunBudget())
+        recorder.close()
+        assert sum(r.telemetry.calls for r in recorded) == llm.calls
+
+        # Replays are free: a budget for one step (7 calls) covers the whole run
+        # (concurrent identical requests may meet the memo instead, so count replays)
+        replayer = CassetteClient(path, mode="replay")
+        engine, replayed = _run(replayer, RunBudget(max_calls=8))
+        assert len(replayed) == 2 and not engine.stop_reason
+        assert engine.session.telemetry.calls == 0 and engine.session.telemetry.tokens == 0
+        assert replayer.misses == 0 and engine.session.telemetry.cache_hits == replayer.hits > 0
+
+    def test_pipelined_opro_overlaps_generation(self):
+        import random
+        from benchmarks.fake_llm import FakeLLM
+        from glassbox.core import OProEngine
+        from glassbox.core.evaluator import Evaluator
+        from glassbox.models.session import OptimizerSession, TestBenchConfig
+
+        random.seed(0)
+        llm = FakeLLM(latency=0.02)
+        session = OptimizerSession()
+        session.seed_prompt = "Summarize the input."
+        session.test_bench = TestBenchConfig(input_a="Pump P2 pressure drop.", input_b="", input_c="")
+        session.config.stop_score_threshold = 101.0
+        session.config.eval_workers = 1  # Candidates scored one after another
+        session.config.pipelined_generation = True
+        engine = OProEngine(llm, Evaluator(llm), session)
+        results = engine.run(max_steps=3)
+
+        # Steps 2 and 3 reuse generations started while the previous step was scored
+        assert engine.pipeline_stats["speculative_steps"] == 2
+        assert any("generation" in pair for pair in results[0].telemetry.overlaps)
+
+        pipelined = [c for c in session.candidates if "pipeline" in c.meta]
+        assert {c.generation_index for c in pipelined} == {2, 3}
+        stale_steps = {c.generation_index for c in pipelined if c.meta["pipeline"]["stale_trajectory"]}
+        assert len(stale_steps) == engine.pipeline_stats["stale_steps"]
+        assert all(c.meta["pipeline"]["launched_after"] == 1 for c in pipelined)
+
+        # Nothing is speculated for a step that will not run, and each call
+        # is logged under the step that used it
+        assert llm.calls_by_kind["optimizer"] == 3
+        assert [(g["step"], g["speculative"]) for g in engine.generation_log] == [(1, False), (2, True), (3, True)]
+
+        llm = FakeLLM(latency=0.02)
+        session.config.stop_score_threshold = 0.0  # The first scored candidate meets it
+        engine = OProEngine(llm, Evaluator(llm), session)
+        assert len(engine.run(max_steps=3)) == 1 and llm.calls_by_kind["optimizer"] == 1
+
+    def test_island_opro_migrates_into_shared_trajectory(self):
+        import random
+        from benchmarks.fake_llm import FakeLLM
+        from glassbox.core import OProEngine
+        from glassbox.core.evaluator import Evaluator
+        from glassbox.models.session import OptimizerSession, TestBenchConfig
+
+        random.seed(0)
+        llm = FakeLLM()
+        session = OptimizerSession()
+        session.seed_prompt = "Summarize the input."
+        session.test_bench = TestBenchConfig(input_a="Pump P2 pressure drop.", input_b="", input_c="")
+        session.config.stop_score_threshold = 101.0
+        session.config.opro_islands = 3
+        session.config.migration_interval = 2
+        engine = OProEngine(llm, Evaluator(llm), session)
+
+        results = engine.run(max_steps=1)
+        assert [i.temperature for i in engine.islands] == [0.5, 0.7, 0.9]
+        assert llm.calls_by_kind["optimizer"] == 3  # One generation per chain
+        assert len(results[0].candidates) == 9
+        assert {c.meta["island"]["index"] for c in results[0].candidates} == {0, 1, 2}
+        assert session.trajectory == []  # No migration before migration_interval
+
+        engine.run(max_steps=1)
+        assert all(len(i.trajectory) == 2 for i in engine.islands)
+        assert sorted(e.prompt for e in session.trajectory) == sorted(i.best.display_text for i in engine.islands)
+
+        # Each chain now sees the other chains' migrated bests
+        other_best = engine.islands[1].best.display_text
+        if other_best != engine.islands[0].best.display_text:
+            assert other_best[:50] in engine._island_context(engine.islands[0])[0].text
+
+    def test_island_opro_splits_call_budget_between_chains(self):
+        import random
+        from benchmarks.fake_llm import FakeLLM
+        from glassbox.core import OProEngine
+        from glassbox.core.evaluator import Evaluator
+        from glassbox.models.session import OptimizerSession, TestBenchConfig, RunBudget
+
+        def _session(**config):
+            session = OptimizerSession()
+            session.seed_prompt = "Summarize the input."
+            session.test_bench = TestBenchConfig(input_a="Pump P2 pressure drop.", input_b="", input_c="")
+            session.config.stop_score_threshold = 101.0
+            for name, value in config.items():
+                setattr(session.config, name, value)
+            return session
+
+        random.seed(0)
+        llm = FakeLLM()
+        session = _session(opro_islands=4, budget=RunBudget(max_calls=12))
+        engine = OProEngine(llm, Evaluator(llm), session)
+        results = engine.run(max_steps=10)
+        assert llm.calls <= 12 and llm.calls_by_kind["optimizer"] == 4  # 4 generations + 1 candidate per chain
+        assert len(results) == 2 and "budget" in engine.stop_reason
+        assert sorted(c.meta["island"]["index"] for c in session.candidates) == [0, 1, 2, 3]
+
+        # Too little for every chain: only the ones that fit run
+        llm = FakeLLM()
+        engine = OProEngine(llm, Evaluator(llm), _session(opro_islands=4, budget=RunBudget(max_calls=7)))
+        engine.run(max_steps=10)
+        assert llm.calls_by_kind["optimizer"] == 2 and llm.calls <= 7
+
+        # Chains race like the single chain does
+        llm = FakeLLM()
+        session = _session(opro_islands=2, evaluation_strategy="racing")
+        session.test_bench.input_b = "Valve V1 stuck open."
+        engine = OProEngine(llm, Evaluator(llm), session)
+        engine.run(max_steps=1)
+        assert session.candidates and all("racing" in c.meta and "island" in c.meta for c in session.candidates)
+
+    def test_meta_prompt_builder_budget_and_diversity(self):
+        from glassbox.core.meta_prompt import MetaPromptBuilder
+        from glassbox.core.telemetry import estimate_tokens
+        from glassbox.models.session import TrajectoryEntry
+
+        best = "You are an expert analyst. Summarize the maintenance log in three numbered bullet points. " * 2
+        entries = [TrajectoryEntry(step=i, score=40 + (i % 30), prompt=f"Filler prompt number {i} about logs.")
+                   for i in range(300)]
+        entries += [TrajectoryEntry(step=300 + i, score=90 - i * 0.1, prompt=best + f"Variant {i}.") for i in range(5)]
+        entries.append(TrajectoryEntry(step=400, score=85, prompt="Classify the defect severity as LOW, MEDIUM or HIGH."))
+
+        history = MetaPromptBuilder(token_budget=200, max_entries=10, diversity=0.5).build(entries)
+
+        assert history.tokens <= 200 and history.available == 306
+        assert history.entries[-1].score == 90  # Best shown last, at full length
+        assert (best + "Variant 0.") in history.text
+        assert any("Classify the defect" in e.prompt for e in history.entries)  # Diverse pick beats near-duplicates
+        assert sum(1 for e in history.entries if e.prompt.startswith(best)) < 5
+        assert [e.score for e in history.entries] == sorted(e.score for e in history.entries)
+        assert estimate_tokens(history.text) == history.tokens
+
+    def test_opro_reports_generation_tokens(self):
+        import random
+        from benchmarks.fake_llm import FakeLLM
+        from glassbox.core import OProEngine
+        from glassbox.core.evaluator import Evaluator
+        from glassbox.models.session import OptimizerSession, TestBenchConfig
+
+        random.seed(0)
+        llm = FakeLLM()
+        session = OptimizerSession()
+        session.seed_prompt = "Summarize the input."
+        session.test_bench = TestBenchConfig(input_a="Pump P2 pressure drop.", input_b="", input_c="")
+        session.config.stop_score_threshold = 101.0
+        session.config.meta_prompt_token_budget = 150
+        engine = OProEngine(llm, Evaluator(llm), session)
+        engine.run(max_steps=4)
+
+        assert [entry["step"] for entry in engine.generation_log] == [1, 2, 3, 4]
+        assert engine.generation_log[0]["history_entries"] == 0
+        assert engine.generation_log[-1]["history_entries"] >= 1
+        assert all(entry["history_tokens"] <= 150 for entry in engine.generation_log[1:])
+        assert all(entry["input_tokens"] > entry["history_tokens"] for entry in engine.generation_log)
+
+    def test_promptbreeder_breeds_concurrently_and_deterministically(self):
+        import random
+        from benchmarks.fake_llm import FakeLLM
+        from glassbox.core import PromptbreederEngine
+        from glassbox.core.evaluator import Evaluator
+        from glassbox.models.session import OptimizerSession, TestBenchConfig
+
+        def _run(latency):
+            random.seed(5)
+            llm = FakeLLM(latency=latency, seed=5)
+            session = OptimizerSession()
+            session.seed_prompt = "Summarize the input."
+            session.test_bench = TestBenchConfig(input_a="Pump P2 pressure drop.", input_b="", input_c="")
+            session.config.stop_score_threshold = 101.0
+            engine = PromptbreederEngine(llm, Evaluator(llm), session)
+            results = engine.run(max_steps=2)
+            return engine, results
+
+        engine, results = _run(0.02)
+        mutation = results[0].telemetry.phases["mutation"]
+        assert mutation.calls == 4 and mutation.peak_concurrency > 1  # All children bred at once
+        assert results[0].telemetry.phases["execution"].peak_concurrency > 1
+        ranked = [(-u.fitness, u.id) for u in engine.population]
+        assert ranked == sorted(ranked)
+
+        again, _ = _run(0.0)  # Different thread interleaving, same population
+        assert [(u.id, u.task_prompt, u.fitness) for u in again.population] == \
+            [(u.id, u.task_prompt, u.fitness) for u in engine.population]
+
+    def test_promptbreeder_islands_on_array_population(self):
+        import random
+        from benchmarks.fake_llm import FakeLLM
+        from glassbox.core import PromptbreederEngine
+        from glassbox.core.evaluator import Evaluator
+        from glassbox.core.population import Population, EvolutionaryUnit
+        from glassbox.models.session import OptimizerSession, TestBenchConfig
+
+        random.seed(2)
+        llm = FakeLLM(seed=2)
+        session = OptimizerSession()
+        session.seed_prompt = "Summarize the input."
+        session.test_bench = TestBenchConfig(input_a="Pump P2 pressure drop.", input_b="", input_c="")
+        session.config.stop_score_threshold = 101.0
+        session.config.population_size = 60
+        session.config.max_generations = 2
+        session.config.breeder_islands = 3
+        session.config.migration_interval = 2
+        engine = PromptbreederEngine(llm, Evaluator(llm), session)
+        results = engine.run(max_steps=10)
+
+        assert len(results) == 2 and results[-1].should_stop  # Generation cap from config
+        assert len(engine.store) == 60
+        assert [len(engine.store.members(i)) for i in range(3)] == [20, 20, 20]
+        migrants = [u for u in engine.population if "_m" in u.id]
+        assert migrants and {u.id for u in migrants} <= {"g2_m0", "g2_m1", "g2_m2"}
+        assert all(u.fitness > 0 and len(u.parent_ids) == 1 for u in migrants)
+        unit_ids = [c.meta["unit_id"] for c in session.candidates]
+        assert len(unit_ids) == len(set(unit_ids))  # Each unit recorded once
+
+        # Tournament selection on the fitness array
+        population = Population()
+        population.extend(
+            [EvolutionaryUnit(id=f"u{i}", task_prompt="p", mutation_prompt="m", fitness=float(i)) for i in range(10)],
+            [0] * 10
+        )
+        assert population.ranked()[:3] == [9, 8, 7]
+        winners = population.tournament(list(range(10)), size=10, count=50, rng=random.Random(0))
+        assert sum(population.fitness[i] for i in winners) / 50 > 6
+        assert population.tournament([4], size=3, count=1, rng=random.Random(0), exclude=4) == [None]
+        assert population.task_prompts[0] is population.task_prompts[9]  # Interned
+
+    def test_promptbreeder_fitness_cache_and_lineage_survive_reload(self):
+        import random
+        import uuid
+        from benchmarks.fake_llm import FakeLLM
+        from glassbox.core import PromptbreederEngine
+        from glassbox.core.evaluator import Evaluator
+        from glassbox.core.promptbreeder import CANDIDATE_NAMESPACE
+        from glassbox.models.lineage import prompt_key
+        from glassbox.models.session import OptimizerSession, TestBenchConfig
+
+        random.seed(4)
+        llm = FakeLLM(seed=4)
+        session = OptimizerSession()
+        session.seed_prompt = "Summarize the input."
+        session.test_bench = TestBenchConfig(input_a="Pump P2 pressure drop.", input_b="", input_c="")
+        session.config.stop_score_threshold = 101.0
+        engine = PromptbreederEngine(llm, Evaluator(llm), session)
+        engine.run(max_steps=3)
+
+        # Scored prompts are never judged twice, even if they scored 0
+        judged = llm.calls_by_kind["judge"]
+        assert judged == len(session.fitness_cache)
+        assert prompt_key("Summarize   the input.") == prompt_key("Summarize the input.")
+
+        # Candidate ids no longer depend on the process hash seed
+        candidate = session.candidates[0]
+        unit_id = candidate.meta["unit_id"]
+        expected = uuid.uuid5(CANDIDATE_NAMESPACE,
+                              f"{session.metadata.session_id}/{unit_id}/{prompt_key(candidate.full_content)}")
+        assert candidate.id == expected
+
+        # Edges come from the lineage store
+        child = next(u for u in engine.population if u.parent_ids)
+        assert session.lineage.parents(child.id) == child.parent_ids
+        assert session.lineage.is_ancestor(child.parent_ids[0], child.id)
+        assert session.lineage.root(child.id).startswith("g0_")
+        edges = {(e["source"], e["target"]) for e in engine.get_schematic_edges()}
+        assert all(session.lineage.parents(target) and source in session.lineage.parents(target)
+                   for source, target in edges)
+
+        # Both survive save/load, so a fresh engine re-scores nothing
+        restored = OptimizerSession.from_json(session.to_json())
+        assert restored.fitness_cache.to_dict() == session.fitness_cache.to_dict()
+        assert restored.lineage.ancestors(child.id) == session.lineage.ancestors(child.id)
+        random.seed(4)
+        calls = llm.calls
+        PromptbreederEngine(llm, Evaluator(llm), restored).step()
+        assert llm.calls_by_kind["judge"] == judged
+        assert llm.calls - calls == 4  # Only the four mutation calls
+        assert restored.fitness_cache.stats()["hits"] == 8
+
+    def test_promptbreeder_bandit_allocates_mutations(self):
+        import random
+        from benchmarks.fake_llm import FakeLLM
+        from glassbox.core import PromptbreederEngine
+        from glassbox.core.bandit import MutationBandit
+        from glassbox.core.evaluator import Evaluator
+        from glassbox.models.session import OptimizerSession, TestBenchConfig
+
+        # Pending pulls spread one batch across arms; rewards then steer selection
+        bandit = MutationBandit(["a", "b", "c"], strategy="ucb", exploration=0.1)
+        assert [bandit.select(random) for _ in range(3)] == ["a", "b", "c"]
+        for _ in range(10):
+            bandit.update("a", parent_fitness=50, child_fitness=80, calls=3)
+            bandit.update("b", parent_fitness=50, child_fitness=40, calls=3)
+            bandit.update("c", parent_fitness=50, child_fitness=50, calls=1)
+        picks = [bandit.select(random) for _ in range(20)]
+        assert picks.count("a") > 15
+        assert bandit.stats["a"].improvements == 10 and bandit.stats["b"].mean == 0.0
+
+        thompson = MutationBandit(["a", "b"], strategy="thompson")
+        for _ in range(20):
+            thompson.update("a", 20, 60, calls=3)
+            thompson.update("b", 20, 20, calls=3)
+        rng = random.Random(0)
+        assert [thompson.select(rng) for _ in range(20)].count("a") > 15
+
+        random.seed(6)
+        llm = FakeLLM(seed=6)
+        session = OptimizerSession()
+        session.seed_prompt = "Summarize the input."
+        session.test_bench = TestBenchConfig(input_a="Pump P2 pressure drop.", input_b="", input_c="")
+        session.config.stop_score_threshold = 101.0
+        session.config.population_size = 12
+        engine = PromptbreederEngine(llm, Evaluator(llm), session)
+        results = engine.run(max_steps=4)
+
+        stats = engine.operator_bandit.to_dict()
+        assert sum(arm["pulls"] for arm in stats.values()) == 18  # Children of generations 1-3 scored
+        assert sum(arm["calls"] for arm in stats.values()) <= 18 * 3
+        assert "gain/call" in session.internal_monologue
+        children = [c for c in results[-1].candidates if c.meta["parent_ids"]]
+        assert children and all(c.meta["mutation_operator"] in engine.MUTATION_OPERATORS for c in children)
+        assert all(c.meta["mutation_direction"] for c in children if c.meta["mutation_operator"] == "zero_order")
+        assert session.mutation_bandits["operators"] == stats  # Stored once, not per candidate
+        assert all("bandit" not in c.meta for c in session.candidates)
+        restored = OptimizerSession.from_json(session.to_json())
+        assert restored.mutation_bandits["operators"] == json.loads(json.dumps(stats))
+
+    def test_promptbreeder_minibatch_fitness_races_and_accumulates(self):
+        import random
+        from glassbox.core import PromptbreederEngine, BoeingAPIClient, HumanOverrideEvaluator
+        from glassbox.core.api_client import APIResponse
+        from glassbox.core.evaluator import EvaluationResult
+        from glassbox.models import OptimizerSession, TestBenchConfig
+        from glassbox.models.lineage import input_signature
+
+        def _engine(minibatch, strategy):
+            random.seed(0)
+            session = OptimizerSession()
+            session.seed_prompt = "Summarize the input."
+            session.test_bench = TestBenchConfig(input_a="golden", input_b="edge", input_c="noisy")
+            session.config.stop_score_threshold = 101.0
+            session.config.fitness_minibatch = minibatch
+            session.config.evaluation_strategy = strategy
+            client = Mock(spec=BoeingAPIClient)
+            client.send_message.return_value = APIResponse(success=True, content="Child prompt.")
+            evaluator = Mock(spec=HumanOverrideEvaluator)
+            scores = {"golden": 10.0, "edge": 20.0, "noisy": 30.0}
+            evaluator.evaluate.side_effect = lambda prompt, input_text, response: EvaluationResult(
+                score=scores[input_text] if any(f"Variation {i})" in prompt for i in (1, 3, 5, 7)) else 90.0,
+                reasoning="", breakdown={}, raw_response="{}"
+            )
+            return PromptbreederEngine(client, evaluator, session), evaluator
+
+        engine, evaluator = _engine(0, "racing")
+        first = engine.step()
+        records = engine.session.fitness_cache.to_dict().values()
+        weak = [r for r in records if r["pruned"]]
+        assert len(weak) == 4 and all(len(r["scores"]) == 2 for r in weak)  # Never run on input C
+        assert all(r["fitness"] == pytest.approx((10.0 + 20.0 + 50.0) / 3) for r in weak)  # Input C at neutral 50
+        assert evaluator.evaluate.call_count == 8 + 8 + 4
+        strong = next(c for c in first.candidates if c.meta["unit_id"] == "g0_u0")
+        assert strong.test_results == {"input_a": 90.0, "input_b": 90.0, "input_c": 90.0}  # Real, not fitness * 0.9
+
+        engine.step()  # Survivors keep their scores; only the new child prompt is judged
+        assert evaluator.evaluate.call_count == 20 + 3
+        assert all(not u.task_prompt.endswith(("1)", "3)", "5)", "7)")) for u in engine.population)
+
+        # A pruned flag only holds for the test bench it was decided on
+        assert all(r["pruned_bench"] for r in weak)
+        seed_record = engine.session.fitness_cache.peek(engine.store.keys[engine.store.index_of("g0_u0")])
+        seed_record.pruned = True
+        seed_record.pruned_bench = weak[0]["pruned_bench"]
+        engine.session.test_bench.input_c = "noisy, edited"
+        engine._score_population()
+        assert not seed_record.pruned
+        assert input_signature("input_c", "noisy, edited") in seed_record.scores  # Scored again
+
+        # One new input per unit per generation, accumulated on survivors
+        engine, evaluator = _engine(1, "full")
+        engine.step()
+        assert evaluator.evaluate.call_count == 8
+        engine.step()
+        seed_record = engine.session.fitness_cache.peek(engine.store.keys[engine.store.index_of("g0_u0")])
+        assert sorted(key.split(":")[0] for key in seed_record.scores) == ["input_a", "input_b"]
+        assert evaluator.evaluate.call_count == 8 + 4 + 1  # 4 survivors + 1 distinct child prompt
+
+        # The recorded seed follows its second minibatch, and last generation's
+        # children, also at 90 but on one input, rank below the seeds and are culled
+        recorded = [c for c in engine.session.candidates if c.meta["unit_id"] == "g0_u0"]
+        assert len(recorded) == 1 and recorded[0].meta["fitness_inputs"] == 2
+        assert recorded[0].test_results == {"input_a": 90.0, "input_b": 90.0}
+        assert recorded[0].score_aggregate == pytest.approx((90.0 + 90.0 + 50.0) / 3)
+        assert recorded[0].meta["observed_mean"] == 90.0
+        assert not any(unit.id.startswith("g1_") for unit in engine.population)
+        assert engine.session.winner is recorded[0]
+
+    def test_ape_induces_example_subsets_concurrently(self):
+        import random
+        from benchmarks.fake_llm import FakeLLM
+        from glassbox.core import APEEngine
+        from glassbox.core.evaluator import Evaluator
+        from glassbox.models.session import OptimizerSession, TestBenchConfig
+
+        random.seed(1)
+        llm = FakeLLM(latency=0.02, seed=1)
+        session = OptimizerSession()
+        session.seed_prompt = "Summarize the input."
+        session.test_bench = TestBenchConfig(input_a="Pump P2 pressure drop.", input_b="", input_c="")
+        session.config.stop_score_threshold = 101.0
+        session.config.induction_subsets = 4
+        engine = APEEngine(llm, Evaluator(llm), session)
+        engine.set_examples([(f"input {i}", f"output {i}") for i in range(5)])
+        results = engine.run(max_steps=1)
+
+        induction = results[0].telemetry.phases["induction"]
+        assert induction.calls == 4 and induction.peak_concurrency > 1  # One call's latency
+        assert len(engine.induced_instructions) == 3  # Two subsets induced the same instruction
+        assert results[0].telemetry.phases["mutation"].calls == 3  # One resample per distinct instruction
+        prompts = [c.full_content for c in results[0].candidates]
+        assert prompts[:3] == engine.induced_instructions and len(prompts) == 3 + 3
+        assert len(set(prompts)) == len(prompts)
+        assert results[0].candidates[0].meta["deduced_from_indices"] == [0, 1, 2]
+        assert len({tuple(c.meta["deduced_from_indices"]) for c in results[0].candidates}) == 3
+
+    def test_ape_best_arm_allocation_stops_once_winner_is_separated(self):
+        from glassbox.core import APEEngine, BoeingAPIClient, HumanOverrideEvaluator
+        from glassbox.core.api_client import APIResponse
+        from glassbox.core.evaluator import EvaluationResult
+        from glassbox.models import OptimizerSession, TestBenchConfig
+
+        session = OptimizerSession()
+        session.seed_prompt = "Summarize the input."
+        session.test_bench = TestBenchConfig(input_a="golden", input_b="edge", input_c="noisy")
+        session.config.generations_per_step = 4
+        session.config.evaluation_strategy = "best_arm"
+        client = Mock(spec=BoeingAPIClient)
+        client.send_message.return_value = APIResponse(
+            success=True, content="1. Variant one.\n2. Variant two.\n3. Variant three.\n4. Variant four."
+        )
+        evaluator = Mock(spec=HumanOverrideEvaluator)
+        evaluator.evaluate.side_effect = lambda prompt, input_text, response: EvaluationResult(
+            score=10.0 if prompt.startswith("Variant") else 95.0, reasoning="", breakdown={}, raw_response="{}"
+        )
+        engine = APEEngine(client, evaluator, session)
+        engine.set_examples([("a", "A"), ("b", "B"), ("c", "C")])
+        result = engine.step()
+
+        assert evaluator.evaluate.call_count == 5 + 4 + 1 + 1 < 5 * 3  # Sweep, LUCB round, last challenger, winner
+        winner = result.best_candidate
+        assert winner.meta["best_arm"]["status"] == "winner"
+        assert winner.test_results == {"input_a": 95.0, "input_b": 95.0, "input_c": 95.0}  # Finished, exact
+        assert winner.meta["best_arm"]["lower"] == winner.meta["best_arm"]["upper"] == 95.0
+        losers = [c for c in result.candidates if c is not winner]
+        assert len(losers) == 4 and all(c.meta["best_arm"]["status"] == "eliminated" for c in losers)
+        assert all(c.meta["best_arm"]["inputs_evaluated"] == 2 for c in losers)
+        assert all(c.meta["best_arm"]["upper"] < winner.meta["best_arm"]["lower"] for c in losers)
+        assert "separated at 95%" in session.internal_monologue
+
     def test_engine_registry(self):
         from glassbox.core import list_engines, get_engine_class
         
@@ -59,7 +59,7 @@ def render_zone_a(optimizer: Optional[AbstractOptimizer] = None):
                 # PromptBreeder: Prompt + Population
                 st.text_area("Seed Prompt", height=80, key="seed_prompt",
                            placeholder="Base prompt for evolutionary optimization. This prompt will serve as the initial seed for mutation.", label_visibility="collapsed")
-                st.slider("Population Size", 10, 100, 50, 10, key="pb_population")
+                st.slider("Population Size", 4, 100, 8, 2, key="pb_population")  # Default matches SessionConfig.population_size
                 st.caption("Evolutionary params managed by backend.")
 
             elif engine_id == "s2a":
@@ -115,6 +115,11 @@ def render_zone_a(optimizer: Optional[AbstractOptimizer] = None):
                 
                 # Status Footer
                 st.markdown(f"<div style='margin-top:5px; font-size:11px; font-weight:500; color:#666;'>STATUS: <span style='color:#0D7CB1'>{status.upper()}</span></div>", unsafe_allow_html=True)
+                
+                # Executor memo counters (shared across engines for this session)
+                if optimizer is not None:
+                    memo = optimizer.session.execution_memo.stats()
+                    st.markdown(f"<div style='font-size:11px; font-weight:500; color:#666;'>MEMO: <span style='color:#0D7CB1'>{memo['hits']} HIT / {memo['misses']} MISS</span></div>", unsafe_allow_html=True)
 
 
 def _get_readout_content(engine: str, node: Optional[str]) -> str:
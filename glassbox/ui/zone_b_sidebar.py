@@ -4,7 +4,7 @@ Buttons are flush with all 4 edges of the sidebar using absolute positioning.
 """
 
 import streamlit as st
-from glassbox.models.session import SessionConfig
+from glassbox.models.session import SessionConfig, RunBudget
 
 
 def render_zone_b():
@@ -152,5 +152,11 @@ def get_session_config() -> SessionConfig:
         stop_score_threshold=st.session_state.get("stop_threshold", 95.0),
         noise_level=st.session_state.get("noise_level", 0.0),
         top_k=st.session_state.get("top_k", 5),
-        vector_store_path=st.session_state.get("vector_store_path", "")
+        vector_store_path=st.session_state.get("vector_store_path", ""),
+        population_size=int(st.session_state.get("pb_population", 8)),
+        budget=RunBudget(
+            max_calls=int(st.session_state.get("budget_max_calls", 0)),
+            max_tokens=int(st.session_state.get("budget_max_tokens", 0)),
+            deadline_s=float(st.session_state.get("budget_deadline_min", 0.0)) * 60
+        )
     )
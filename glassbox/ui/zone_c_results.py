@@ -47,8 +47,24 @@ def render_zone_c(candidates: List[UnifiedCandidate], test_bench: Optional[TestB
                     col_rank, col_score, col_preview = st.columns([0.2, 0.3, 3])
                     with col_rank:
                         st.markdown(f"**{i+1}**")
+                    racing = candidate.meta.get("racing") or {}
+                    best_arm = candidate.meta.get("best_arm") or {}
                     with col_score:
-                        st.markdown(f"<span style='color:{color};font-weight:bold;'>{score:.0f}</span>", unsafe_allow_html=True)
+                        if best_arm and best_arm["lower"] < best_arm["upper"]:
+                            # Partial score - best-arm allocation stopped before every input was run
+                            interval = f"{best_arm['confidence']:.0%} CI {best_arm['lower']:.0f}-{best_arm['upper']:.0f}"
+                            st.markdown(
+                                f"<span style='color:{color};font-weight:bold;' title='{interval}'>{score:.0f}±</span>",
+                                unsafe_allow_html=True
+                            )
+                        elif racing.get("pruned"):
+                            # Partial score - candidate was dropped early by racing evaluation
+                            st.markdown(
+                                f"<span style='color:{color};font-weight:bold;' title='{racing.get('reason', '')}'>{score:.0f}✂</span>",
+                                unsafe_allow_html=True
+                            )
+                        else:
+                            st.markdown(f"<span style='color:{color};font-weight:bold;'>{score:.0f}</span>", unsafe_allow_html=True)
                     with col_preview:
                         if st.button(preview[:60] + "...", key=f"select_{candidate.id}", use_container_width=True):
                             st.session_state["selected_candidate"] = str(candidate.id)
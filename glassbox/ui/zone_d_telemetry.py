@@ -5,17 +5,30 @@ Contains:
 - Live updating score graph (Plotly)
 - Average and Max score lines
 - Star markers for new high scores
+- Per-phase latency and token cost per step
 """
 
 import streamlit as st
 import plotly.graph_objects as go
-from typing import List
+from typing import List, Optional
 
 from glassbox.models.session import TrajectoryEntry
+from glassbox.models.telemetry import PHASES, RunTelemetry
 
+# Bar colors per phase (calls outside any phase are "other")
+PHASE_COLORS = {
+    "generation": "#3B82F6",
+    "execution": "#22c55e",
+    "judging": "#FFD700",
+    "mutation": "#A855F7",
+    "induction": "#F97316",
+    "filtering": "#06B6D4",
+    "other": "#6B7280",
+}
 
-def render_zone_d(trajectory: List[TrajectoryEntry]):
-    """Render the telemetry graph zone."""
+
+def render_zone_d(trajectory: List[TrajectoryEntry], telemetry: Optional[RunTelemetry] = None):
+    """Render the telemetry graph zone (cost chart shown when telemetry is given)."""
     
     st.markdown("### 📈 Optimization Progress")
     
@@ -24,6 +37,8 @@ def render_zone_d(trajectory: List[TrajectoryEntry]):
         fig = _create_placeholder_chart()
         st.plotly_chart(fig, use_container_width=True, key="telemetry_placeholder")
         st.caption("Graph will populate as optimization progresses...")
+        if telemetry is not None and telemetry.steps:
+            render_cost_telemetry(telemetry)  # Steps can finish before any trajectory entry (e.g. islands)
         return
 
     # Extract data
@@ -133,6 +148,68 @@ def render_zone_d(trajectory: List[TrajectoryEntry]):
         else:
             st.metric("Δ Last", "—")
 
+    if telemetry is not None and telemetry.steps:
+        render_cost_telemetry(telemetry)
+
+
+def render_cost_telemetry(telemetry: RunTelemetry):
+    """Stacked per-phase wall time per step, with tokens per step on a second axis."""
+    st.markdown("#### ⏱️ Latency & Cost")
+
+    steps = [s.step for s in telemetry.steps]
+    phase_names = [p for p in PHASES + ("other",) if any(p in s.phases for s in telemetry.steps)]
+
+    fig = go.Figure()
+    for phase in phase_names:
+        fig.add_trace(go.Bar(
+            x=steps,
+            y=[s.phases[phase].wall_time_s if phase in s.phases else 0.0 for s in telemetry.steps],
+            name=phase.title(),
+            marker_color=PHASE_COLORS.get(phase, "#6B7280"),
+            customdata=[s.phases[phase].calls if phase in s.phases else 0 for s in telemetry.steps],
+            hovertemplate=f'{phase.title()}<br>Step %{{x}}<br>%{{y:.2f}}s, %{{customdata}} calls<extra></extra>'
+        ))
+
+    fig.add_trace(go.Scatter(
+        x=steps,
+        y=[s.input_tokens + s.output_tokens for s in telemetry.steps],
+        mode='lines+markers',
+        name='Tokens',
+        yaxis='y2',
+        line=dict(color='#FAFAFA', width=1, dash='dot'),
+        hovertemplate='Step %{x}<br>%{y} tokens<extra></extra>'
+    ))
+
+    fig.update_layout(
+        barmode='stack',
+        xaxis_title='Step',
+        yaxis=dict(title='Phase time (s)'),
+        yaxis2=dict(title='Tokens', overlaying='y', side='right', showgrid=False),
+        plot_bgcolor='#0E1117',
+        paper_bgcolor='#0E1117',
+        font=dict(color='#FAFAFA'),
+        legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='right', x=1),
+        margin=dict(l=40, r=40, t=40, b=40),
+        hovermode='x unified'
+    )
+    fig.update_xaxes(gridcolor='#31333F', zeroline=False)
+    fig.update_yaxes(gridcolor='#31333F', zeroline=False)
+
+    st.plotly_chart(fig, use_container_width=True, key="cost_telemetry_chart")
+
+    totals = telemetry.totals()
+    slowest = max(totals, key=lambda p: totals[p].wall_time_s) if totals else "—"
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Calls", telemetry.calls)
+    with col2:
+        st.metric("Tokens", f"{telemetry.tokens:,}")
+    with col3:
+        st.metric("Wall Time", f"{telemetry.wall_time_s:.1f}s")
+    with col4:
+        st.metric("Slowest Phase", slowest.title() if totals else slowest)
+
 
 def _create_placeholder_chart():
     """Create a placeholder chart before optimization starts."""
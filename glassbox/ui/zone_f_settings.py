@@ -102,6 +102,15 @@ def render_zone_f():
             
             st.divider()
             
+            # --- RUN BUDGET ---
+            st.markdown("#### Run Budget")
+            st.caption("0 = unlimited. The run stops gracefully with the best prompt so far.")
+            st.number_input("Max LLM Calls", min_value=0, value=st.session_state.get("budget_max_calls", 0), step=50, key="budget_max_calls")
+            st.number_input("Max Tokens", min_value=0, value=st.session_state.get("budget_max_tokens", 0), step=10000, key="budget_max_tokens")
+            st.number_input("Deadline (minutes)", min_value=0.0, value=st.session_state.get("budget_deadline_min", 0.0), step=5.0, key="budget_deadline_min")
+            
+            st.divider()
+            
             # --- API CONFIG ---
             st.markdown("#### API Configuration")
             api_key = st.text_input("Boeing/Gemini API Key", type="password", key="api_key_input", help="Leave empty to use env vars")